@@ -0,0 +1,73 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Measure the startup time of Cylleneus: running `cylleneus --help`, and
+constructing a Corpus, each in a fresh interpreter.
+
+    python benchmarks/startup.py [--runs N] [--corpus NAME]
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+
+HELP = "from cylleneus.cli import main; main(['--help'])"
+
+CORPUS = """
+import time
+t = time.perf_counter()
+from cylleneus.corpus import Corpus, manifest
+imported = time.perf_counter()
+Corpus({name!r})
+constructed = time.perf_counter()
+loaded = [name for name in manifest if manifest.loaded(name)]
+print(imported - t, constructed - imported, ",".join(loaded))
+"""
+
+
+def run(code: str):
+    start = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+    )
+    elapsed = time.perf_counter() - start
+    if result.returncode != 0:
+        sys.exit(result.stderr)
+    return elapsed, result.stdout
+
+
+def report(label: str, times: list):
+    print(
+        f"{label:<32} median {statistics.median(times) * 1000:8.1f} ms"
+        f"   min {min(times) * 1000:8.1f} ms"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--corpus", default="perseus")
+    args = parser.parse_args()
+
+    report("cylleneus --help", [run(HELP)[0] for _ in range(args.runs)])
+
+    totals, imports, constructions = [], [], []
+    for _ in range(args.runs):
+        total, output = run(CORPUS.format(name=args.corpus))
+        imported, constructed, loaded = output.split()
+        totals.append(total)
+        imports.append(float(imported))
+        constructions.append(float(constructed))
+    report(f"Corpus({args.corpus!r}), total", totals)
+    report("  import cylleneus.corpus", imports)
+    report(f"  Corpus({args.corpus!r})", constructions)
+    print(f"corpora imported: {loaded}")
+
+
+if __name__ == "__main__":
+    main()
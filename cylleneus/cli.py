@@ -9,6 +9,7 @@ import click
 import click_spinner
 
 from cylleneus.corpus import Corpus, Work, manifest
+from cylleneus.corpus import tables as _tables
 from cylleneus.search import CylleneusSearcher
 from cylleneus.settings import CORPUS_DIR
 from cylleneus.utils import slugify
@@ -16,9 +17,9 @@ import cylleneus.engine
 from cylleneus import __version__
 
 REMOTE_CORPORA = {
-    name: meta
-    for name, meta in manifest.items()
-    if meta.repo["location"] == "remote"
+    name: descriptor
+    for name, descriptor in manifest.descriptors.items()
+    if descriptor.repo["location"] == "remote"
 }
 
 
@@ -206,6 +207,23 @@ def optimize(corpus):
             click.echo(f"[-] failed")
 
 
+@main.command()
+@click.option("--corpus", "-c", "corpus", required=True)
+def merge(corpus):
+    """Consolidate the indexes of a corpus into a single index. """
+
+    with click_spinner.spinner():
+        c = Corpus(corpus)
+        ndocs = c.merge() if c.searchable else 0
+
+    if ndocs > 0:
+        click.echo(
+            f"[+] merged '{corpus}' with {ndocs} document{'s' if ndocs > 1 else ''}"
+        )
+    else:
+        click.echo(f"[-] failed")
+
+
 @main.command()
 @click.option("--corpus", "-c", "corpus", required=True)
 @click.option("--docix", "-d", "docix", required=True)
@@ -308,17 +326,13 @@ def add(corpus, path, author, title):
 @click.option("--corpus", "-c", "corpus", required=True)
 @click.option("--destructive/--not-destructive", "-d/-D", default=True)
 @click.option("--optimize", "-o", is_flag=True)
-def create(corpus, destructive, optimize):
+@click.option("--jobs", "-j", "jobs", type=int, default=1, show_default=True)
+def create(corpus, destructive, optimize, jobs):
     """Create all corpus indexes from source files. """
 
     with click_spinner.spinner():
         c = Corpus(corpus)
-
-        for file in c.text_dir.glob(c.glob):
-            w = Work(corpus=c)
-            _ = w.indexer.from_file(
-                file, destructive=destructive, optimize=optimize
-            )
+        c.create(destructive=destructive, optimize=optimize, jobs=jobs)
 
     ndocs = c.doc_count_all
     if ndocs > 0:
@@ -329,6 +343,15 @@ def create(corpus, destructive, optimize):
         click.echo("[-] failed")
 
 
+@main.command()
+def tables():
+    """Compile the lookup tables of corpus metadata. """
+
+    with click_spinner.spinner():
+        compiled = _tables.build()
+    click.echo(f"[+] compiled {len(compiled)} tables in '{_tables.CACHE_DIR}'")
+
+
 @main.command()
 @click.option("--corpus", "-c", "corpus", required=True)
 @click.option("--fieldname", "-f", "fieldname", required=True)
@@ -339,7 +362,7 @@ def lexicon(corpus, fieldname):
 
     lexicon = set()
     for reader in c.readers:
-        with CylleneusSearcher(reader) as searcher:
+        with CylleneusSearcher(reader, closereader=False) as searcher:
             lexicon.update(list(searcher.lexicon(fieldname)))
     if lexicon:
         click.echo(
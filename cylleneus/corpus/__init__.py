@@ -1,3 +1,3 @@
-from .core import Corpus, Work
+from .core import Corpus, Work, corpora
 from .indexer import Indexer
 from .meta import manifest
@@ -1,8 +1,10 @@
 import codecs
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, as_completed
 import json
 import shutil
 import sys
+import threading
 from pathlib import Path
 
 import requests
@@ -13,7 +15,7 @@ from cylleneus import settings
 import cylleneus.engine.index
 from cylleneus.engine.fields import Schema
 from cylleneus.engine.searching import CylleneusHit, CylleneusSearcher
-from cylleneus.utils import slugify
+from cylleneus.utils import Debug, LRUCache, slugify
 from . import indexer
 from .meta import manifest
 from enum import IntEnum
@@ -59,20 +61,20 @@ class Corpus:
     def __init__(self, name: str):
         self._name = name
 
-        self._meta = manifest.get(name, manifest["default"])
+        self._meta = manifest[name if name in manifest else "default"]
         self._language = self._meta.language
         self._schema = self._meta.schema()
         self._tokenizer = self._meta.tokenizer()
         self._preprocessor = self._meta.preprocessor(self)
         self._glob = self._meta.glob
         self._fetch = self._meta.fetch
-        manifest_file = self.path / Path("manifest.json")
-        if manifest_file.exists():
-            with codecs.open(manifest_file, "r", "utf8") as fp:
-                self._manifest = json.load(fp)
-        else:
-            self._manifest = {}
+        self._manifest = {}
+        self._mtime = None
+        self.load_manifest()
         self._remote_manifest = None
+        self._docs = None
+        self._works = LRUCache(settings.WORK_CACHE_SIZE)
+        self.defer_manifest = False
 
     @property
     def name(self):
@@ -90,16 +92,57 @@ class Corpus:
     def manifest(self, manifest):
         self._manifest = manifest
 
-    def update_manifest(self, docix=None, work_manifest=None):
+    @property
+    def manifest_file(self):
+        return self.path / Path("manifest.json")
+
+    def _manifest_mtime(self):
+        try:
+            return self.manifest_file.stat().st_mtime_ns
+        except FileNotFoundError:
+            return None
+
+    def load_manifest(self):
+        """Reads the manifest from disk, if there is one."""
+
+        mtime = self._manifest_mtime()
+        if mtime is not None:
+            with codecs.open(self.manifest_file, "r", "utf8") as fp:
+                self._manifest = json.load(fp)
+        self._mtime = mtime
+
+    @property
+    def stale(self):
+        """Whether the manifest has changed on disk since it was read or
+        written by this corpus."""
+
+        return self._manifest_mtime() != self._mtime
+
+    @property
+    def docs(self):
+        """The table locating each document of the manifest."""
+
+        if self._docs is None:
+            self._docs = indexer.DocTable(self)
+        return self._docs
+
+    def update_manifest(self, docix=None, work_manifest=None, doc=None):
         if docix is not None and work_manifest:
             self.manifest[str(docix)] = work_manifest
-        manifest_file = self.path / Path("manifest.json")
+        self.docs.sync()
+        if docix is not None:
+            self.docs.update(docix, doc)
+            self._works.pop(int(docix))
+        if self.defer_manifest:
+            return
         if not self.path.exists():
             self.path.mkdir(parents=True, exist_ok=True)
         with safer.open(
-            manifest_file, mode="w", encoding="utf8", temp_file=False
+            self.manifest_file, mode="w", encoding="utf8", temp_file=False
         ) as fp:
             json.dump(self.manifest, fp, ensure_ascii=False)
+        self._mtime = self._manifest_mtime()
+        self.docs.save()
 
     @property
     def remote_manifest(self):
@@ -149,6 +192,146 @@ class Corpus:
         for ixr in self.indexers:
             ixr.optimize()
 
+    @property
+    def merged_dir(self):
+        return Path(self.path / "merged")
+
+    @property
+    def merged(self):
+        """Whether the corpus has a consolidated index that is up to date with
+        its per-work indexes."""
+
+        if not cylleneus.engine.index.exists_in(
+            self.merged_dir, indexname=self.name
+        ):
+            return False
+        manifest_file = self.path / Path("manifest.json")
+        if not manifest_file.exists():
+            return True
+        return (
+            max(toc.stat().st_mtime for toc in self.merged_dir.glob("*.toc"))
+            >= manifest_file.stat().st_mtime
+        )
+
+    @property
+    def merged_index(self):
+        return indexer.pool.index(self.merged_dir, self.schema, self.name)
+
+    @property
+    def merged_reader(self):
+        return indexer.pool.reader(self.merged_dir, self.schema, self.name)
+
+    @property
+    def merged_docnums(self):
+        """The document numbers of each docix in the consolidated index."""
+
+        return indexer.pool.docnums(self.merged_dir, self.schema, self.name)
+
+    def merge(self):
+        """Build a consolidated index of the corpus from its per-work indexes,
+        replacing any existing one. Returns the number of documents merged,
+        counting each work once, however many passages it is indexed as."""
+
+        if self.merged_dir.exists():
+            indexer.pool.discard(self.merged_dir)
+            shutil.rmtree(self.merged_dir)
+        self.merged_dir.mkdir(parents=True)
+        ix = cylleneus.engine.index.create_in(
+            self.merged_dir, schema=self.schema, indexname=self.name
+        )
+
+        readers = sorted(
+            self.readers,
+            key=lambda reader: min(reader.all_doc_ixs(), default=-1),
+        )
+        writer = ix.writer(limitmb=indexer.LIMITMB, procs=1)
+        for reader in readers:
+            writer.add_reader(reader)
+        writer.commit()
+        Debug.print(
+            Debug.MEDIUM,
+            f"- Merged {len(readers)} indexes of '{self.name}' into {self.merged_dir}",
+        )
+        with ix.reader() as reader:
+            return len(list(reader.all_doc_ixs()))
+
+    def create(
+        self, destructive: bool = True, optimize: bool = False, jobs: int = 1
+    ):
+        """Index all source files of the corpus, using up to ``jobs`` worker
+        processes. When indexing in parallel, documents are numbered up front:
+        a file already in the manifest keeps its docix, and new files are
+        numbered in order of filename, starting after the highest docix in the
+        manifest. The manifest is written once all documents have been
+        indexed."""
+
+        files = sorted(self.text_dir.glob(self.glob))
+
+        if jobs <= 1:
+            for file in files:
+                w = Work(corpus=self)
+                _ = w.indexer.from_file(
+                    file, destructive=destructive, optimize=optimize
+                )
+            return
+
+        # Preprocessors record a file by its name, or by its path in the text
+        # directory
+        existing = {
+            doc["filename"]: int(docix) for docix, doc in self.manifest.items()
+        }
+        start = max(
+            [int(docix) + 1 for docix in self.manifest] + [self.doc_count_all]
+        )
+        docixs = {}
+        for file in files:
+            docix = existing.get(
+                file.relative_to(self.text_dir).as_posix(),
+                existing.get(file.name),
+            )
+            if docix is None or docix in docixs.values():
+                docix, start = start, start + 1
+            docixs[file] = docix
+
+        limitmb = max(256, indexer.LIMITMB // jobs)
+        with ProcessPoolExecutor(
+            max_workers=jobs, initializer=_init_worker, initargs=(self.name,)
+        ) as executor:
+            futures = [
+                executor.submit(
+                    _from_file, file, docix, destructive, optimize, limitmb
+                )
+                for file, docix in docixs.items()
+            ]
+            docs = {}
+            error = None
+            try:
+                for future in as_completed(futures):
+                    # A failed document is raised once every other document,
+                    # already written by the other workers, is in the manifest
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        if error is None:
+                            error = e
+                        continue
+                    if result is not None:
+                        docix, work_manifest, doc = result
+                        self.manifest[str(docix)] = work_manifest
+                        docs[docix] = doc
+            finally:
+                self.docs.sync()
+                for docix, doc in docs.items():
+                    self.docs.update(docix, doc)
+                self.update_manifest()
+                Debug.print(
+                    Debug.MEDIUM,
+                    f"- Updated manifest for '{self.name}': "
+                    f"{len(self.manifest)} documents",
+                )
+            if error is not None:
+                raise error
+
     def verify_by_docix(self, docix, dry_run: bool = True):
         class VerificationResult(IntEnum):
             PASSED = 0
@@ -310,20 +493,37 @@ class Corpus:
             yield Work(self, author=path.parts[-2], title=path.name)
 
     def work_by_docix(self, docix: int):
-        doc = indexer.doc_for_docix(self, docix)
-        if doc is not None:
-            return Work(self, doc=doc)
+        """Returns the work of a document, shared by later lookups until the
+        document is reindexed, or None if there is no such document."""
+
+        docix = int(docix)
+        work = self._works.get(docix)
+        if work is None:
+            doc = indexer.doc_for_docix(self, docix)
+            if doc is not None:
+                work = Work(self, doc=doc)
+                self._works[docix] = work
+        return work
 
     def destroy(self):
         for ixr in self.indexers:
             ixr.destroy()
+        if self.merged_dir.exists():
+            indexer.pool.discard(self.merged_dir)
+            shutil.rmtree(self.merged_dir)
         mfest = self.path / Path("manifest.json")
         if mfest.exists():
             mfest.unlink()
+        if self.docs.path.exists():
+            self.docs.path.unlink()
+        self._manifest = {}
+        self._mtime = None
+        self._docs = None
+        self._works.clear()
 
     def delete_by(self, **kwargs):
         for reader in self.readers:
-            with CylleneusSearcher(reader) as searcher:
+            with CylleneusSearcher(reader, closereader=False) as searcher:
                 results = searcher.document_numbers(**kwargs)
                 if results:
                     for docix in results:
@@ -331,19 +531,22 @@ class Corpus:
 
     def delete_by_ix(self, docix: int):
         for ixr in self.indexers:
-            for ix in ixr.indexes:
-                if docix in ix.reader().all_doc_ixs():
+            for reader in ixr.readers:
+                if docix in reader.all_doc_ixs():
                     ixr.destroy()
+                    break
 
     @property
     def doc_count_all(self):
+        if self.docs:
+            return len(self.docs)
         return len(list(self.index_dir.glob("*/*/*.toc")))
 
     def all_doc_ixs(self):
         docixs = []
         for ixr in self.indexers:
-            for ix in ixr.indexes:
-                docixs += ix.reader().all_doc_ixs()
+            for reader in ixr.readers:
+                docixs += reader.all_doc_ixs()
         return docixs
 
     def clear(self):
@@ -386,19 +589,29 @@ class Corpus:
     @property
     def readers(self):
         for ixr in self.indexers:
-            if ixr.indexes:
-                for ix in ixr.indexes:
-                    yield ix.reader()
+            yield from ixr.readers
 
     def readers_for(self, author: str = "*", title: str = "*"):
         for ixr in self.indexers_for(author, title):
-            for ix in ixr.indexes:
-                yield ix.reader()
+            yield from ixr.readers
 
     def reader_for_docix(self, docix: int):
-        for reader in self.readers:
-            ids = list(reader.all_doc_ixs())
-            if docix in ids:
+        if docix in self.docs:
+            path, indexname, _ = self.docs.location(docix)
+            return indexer.pool.reader(path, self.schema, indexname)
+
+        for toc_filename in self.index_dir.glob(f"*/*/*_{docix}_*.toc"):
+            indexname = (
+                "_".join(
+                    toc_filename.name.replace(".toc", "").rsplit(
+                        "_", maxsplit=4
+                    )[:4]
+                )
+            ).strip("_")
+            reader = indexer.pool.reader(
+                toc_filename.parent, self.schema, indexname
+            )
+            if reader is not None and docix in reader.all_doc_ixs():
                 return reader
 
     @property
@@ -408,7 +621,9 @@ class Corpus:
         )
 
     def fetch(self, hit, meta, fragment):
-        work = Work(corpus=self, doc=hit)
+        work = self.work_by_docix(hit["docix"]) if "docix" in hit else None
+        if work is None:
+            work = Work(corpus=self, doc=hit)
         urn, reference, text = work.fetch(work, meta, fragment)
         return self.name, work.author, work.title, urn, reference, text
 
@@ -550,10 +765,9 @@ class Corpus:
                         git_origin.pull()
                 except Exception as e:
                     raise e
-        manifest_file = self.path / Path("manifest.json")
-        if manifest_file.exists():
-            with codecs.open(manifest_file, "r", "utf8") as fp:
-                self._manifest = json.load(fp)
+        self.load_manifest()
+        self._docs = None
+        self._works.clear()
         return repo
 
     def __str__(self):
@@ -704,3 +918,67 @@ class Work:
 
     def __eq__(self, other):
         return self.docix == other.docix and self.corpus == other.corpus
+
+
+class CorpusRegistry:
+    """Corpora shared by the process, by name, so that looking a corpus up
+    again (for each hit rendered, say) reuses its manifest, schema and works.
+    A corpus is replaced once its manifest is changed by another process or
+    instance."""
+
+    def __init__(self):
+        self._corpora = {}
+        self._lock = threading.RLock()
+
+    def __getitem__(self, name: str):
+        with self._lock:
+            corpus = self._corpora.get(name)
+            if corpus is None or corpus.stale:
+                corpus = Corpus(name)
+                self._corpora[name] = corpus
+            return corpus
+
+    def __contains__(self, name: str):
+        return name in self._corpora
+
+    def discard(self, name: str):
+        with self._lock:
+            self._corpora.pop(name, None)
+
+    def clear(self):
+        with self._lock:
+            self._corpora.clear()
+
+
+# Corpora shared by the process
+corpora = CorpusRegistry()
+
+
+# Corpus of the current worker process, for parallel indexing
+_worker_corpus = None
+
+
+def _init_worker(name: str):
+    global _worker_corpus
+
+    _worker_corpus = Corpus(name)
+    _worker_corpus.defer_manifest = True
+
+
+def _from_file(
+    path: Path, docix: int, destructive: bool, optimize: bool, limitmb: int
+):
+    w = Work(corpus=_worker_corpus)
+    docix = w.indexer.from_file(
+        path,
+        destructive=destructive,
+        optimize=optimize,
+        docix=docix,
+        limitmb=limitmb,
+    )
+    if docix is not None:
+        return (
+            docix,
+            _worker_corpus.manifest.get(str(docix)),
+            _worker_corpus.docs.doc(docix),
+        )
@@ -6,7 +6,7 @@ from pathlib import Path
 
 from cylleneus import settings
 from cylleneus.corpus.preprocessing import BasePreprocessor
-from cylleneus.engine.analysis.acore import CylleneusToken
+from cylleneus.engine.analysis.acore import CylleneusToken, replay
 from cylleneus.engine.analysis.filters import (
     AnnotationFilter,
     CachedLemmaFilter,
@@ -65,7 +65,7 @@ class CachedTokenizer(Tokenizer):
 
     @property
     def cache(self):
-        return copy.deepcopy(self._cache)
+        return replay(self._cache)
 
     def __call__(
         self,
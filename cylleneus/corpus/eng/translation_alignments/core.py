@@ -1,8 +1,6 @@
-import codecs
-
-import lxml.etree as et
 from nltk.tokenize import word_tokenize
 from cylleneus.utils import stringify
+from cylleneus.corpus.texts import texts, xml
 
 # Description
 description = "The Perseids Project (translation alignment)"
@@ -24,10 +22,7 @@ repo = {
 # Fetch text
 def fetch(work, meta, fragment):
     _, file = work.filename[0]
-    with codecs.open(work.corpus.text_dir / file, "rb") as fp:
-        value = fp.read()
-    parser = et.XMLParser(encoding="utf-8")
-    doc = et.XML(value, parser=parser)
+    doc = texts.load(work.corpus.name, work.corpus.text_dir / file, xml)
 
     # URN
     _, urn = work.urn[0]
@@ -7,6 +7,7 @@ from latinwordnet.latinwordnet import relation_types
 from multiwordnet.wordnet import WordNet
 from nltk.stem import WordNetLemmatizer
 
+from cylleneus.engine.analysis.acore import replay
 from cylleneus.engine.analysis.filters import Filter
 from cylleneus.lang import iso_639
 
@@ -25,7 +26,7 @@ class CachedLemmaFilter(Filter):
 
     @property
     def cache(self):
-        return copy.deepcopy(self._cache)
+        return replay(self._cache)
 
     def __eq__(self, other):
         return (
@@ -160,7 +161,7 @@ class CachedSynsetFilter(Filter):
 
     @property
     def cache(self):
-        return copy.deepcopy(self._cache)
+        return replay(self._cache)
 
     def __eq__(self, other):
         return (
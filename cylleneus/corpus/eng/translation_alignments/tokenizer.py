@@ -1,7 +1,7 @@
 import copy
 import string
 
-from cylleneus.engine.analysis.acore import CylleneusToken
+from cylleneus.engine.analysis.acore import CylleneusToken, replay
 from cylleneus.engine.analysis.tokenizers import Tokenizer
 from nltk.tokenize import word_tokenize
 from cylleneus.utils import flatten, stringify
@@ -17,7 +17,7 @@ class CachedTokenizer(Tokenizer):
 
     @property
     def cache(self):
-        return copy.deepcopy(self._cache)
+        return replay(self._cache)
 
     def __call__(
         self,
@@ -131,14 +131,14 @@ class CachedTokenizer(Tokenizer):
                                 start_char += length
                                 continue
 
-                            t.meta = copy.deepcopy(meta)
+                            t.meta = copy.copy(meta)
 
                             t.text = token
                             if chars:
                                 t.startchar = start_char
                                 t.endchar = start_char + length
                             if mode == "index":
-                                self._cache.append(copy.deepcopy(t))
+                                self._cache.append(copy.copy(t))
                             yield t
 
                             start_char += length
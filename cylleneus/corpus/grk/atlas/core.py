@@ -1,9 +1,7 @@
-import codecs
 import string
 
-import lxml.etree as et
-
 from cylleneus import settings
+from cylleneus.corpus.texts import texts, xml
 
 # Description
 description = "Aligned Text and Linguistic Annotation Server (ATLAS)"
@@ -25,10 +23,7 @@ repo = {
 # Function to fetch text from corpus
 def fetch(work, meta, fragment):
     _, file = work.filename[0]
-    with codecs.open(work.corpus.text_dir / file, "rb") as fp:
-        value = fp.read()
-    parser = et.XMLParser(encoding="utf-8")
-    doc = et.XML(value, parser=parser)
+    doc = texts.load(work.corpus.name, work.corpus.text_dir / file, xml)
 
     # URN
     _, urn = work.urn[0]
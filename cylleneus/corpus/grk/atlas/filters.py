@@ -6,14 +6,24 @@ from greekwordnet import GreekWordNet
 from greekwordnet.greekwordnet import relation_types
 from multiwordnet.wordnet import WordNet
 
+from cylleneus.engine.analysis.acore import replay
 from cylleneus.engine.analysis.filters import Filter
+from cylleneus.engine.analysis.lookups import (
+    WordNetBackend,
+    bulk_lemmas,
+    bulk_synsets,
+)
 from cylleneus.lang import iso_639
 from cylleneus.lang.morpho import leipzig2wn
 from .core import relations
 
+# Default backend for bulk lookups at index time
+GWN_BACKEND = WordNetBackend(GreekWordNet())
+
 
 class CachedLemmaFilter(Filter):
     is_morph = True
+    backend = None
 
     def __init__(self, cached=True, **kwargs):
         super(CachedLemmaFilter, self).__init__()
@@ -24,7 +34,7 @@ class CachedLemmaFilter(Filter):
 
     @property
     def cache(self):
-        return copy.deepcopy(self._cache)
+        return replay(self._cache)
 
     def __eq__(self, other):
         return (
@@ -45,34 +55,13 @@ class CachedLemmaFilter(Filter):
 
             GWN = GreekWordNet()
 
+            pending = []
             for t in tokens:
                 if t.mode == "index":
                     morpho = t.morpho
                     lemma = t.lemma
                     if lemma:
-                        results = GWN.lemmas(lemma=lemma, pos=morpho[0]).get()
-                        if results:
-                            for result in results:
-                                # FIXME
-                                if result["morpho"]:
-                                    morpho = (
-                                        morpho[:-2] + result["morpho"][-2:]
-                                    )
-                                else:
-                                    morpho = morpho[:-2] + "--"
-                                if (
-                                    morpho[5] == "p"
-                                    and result["morpho"][5] == "d"
-                                ):
-                                    morpho = morpho[:5] + "d" + morpho[6:]
-                                t.morpho = f"{result['morpho']}::{result['uri']}:0>{morpho}"
-                                t.text = (
-                                    f"{result['lemma']}:"
-                                    f"{result['uri']}={result['morpho']}"
-                                )
-                                if self.cached:
-                                    self._cache.append(copy.copy(t))
-                                yield t
+                        pending.append(((lemma, morpho[0], None), copy.copy(t)))
                 elif t.mode == "query":
                     # Lexical relation
                     if "::" in t.text:
@@ -178,6 +167,28 @@ class CachedLemmaFilter(Filter):
                                         yield t
                                 else:
                                     yield t
+            if pending:
+                results = bulk_lemmas(
+                    [key for key, t in pending], self.backend or GWN_BACKEND
+                )
+                for key, t in pending:
+                    morpho = t.morpho
+                    for result in results[key] or []:
+                        # FIXME
+                        if result["morpho"]:
+                            morpho = morpho[:-2] + result["morpho"][-2:]
+                        else:
+                            morpho = morpho[:-2] + "--"
+                        if morpho[5] == "p" and result["morpho"][5] == "d":
+                            morpho = morpho[:5] + "d" + morpho[6:]
+                        t.morpho = f"{result['morpho']}::{result['uri']}:0>{morpho}"
+                        t.text = (
+                            f"{result['lemma']}:"
+                            f"{result['uri']}={result['morpho']}"
+                        )
+                        if self.cached:
+                            self._cache.append(copy.copy(t))
+                        yield t
 
 
 class MorphosyntaxFilter(Filter):
@@ -213,6 +224,7 @@ class MorphosyntaxFilter(Filter):
 
 class CachedSynsetFilter(Filter):
     is_morph = True
+    backend = None
 
     def __init__(self, cached=True, **kwargs):
         super(CachedSynsetFilter, self).__init__()
@@ -223,7 +235,7 @@ class CachedSynsetFilter(Filter):
 
     @property
     def cache(self):
-        return copy.deepcopy(self._cache)
+        return replay(self._cache)
 
     def __eq__(self, other):
         return (
@@ -235,6 +247,38 @@ class CachedSynsetFilter(Filter):
     def __ne__(self, other):
         return not self == other
 
+    def _expand(self, tokens):
+        keys = [
+            re.search(r"(\w+)(?::([\w\d]+))?(?:=(.+))?", t.text).groups()
+            if t.text
+            else None
+            for t in tokens
+        ]
+        results = bulk_synsets(
+            [key for key in keys if key], self.backend or GWN_BACKEND
+        )
+
+        for t, key in zip(tokens, keys):
+            if key:
+                for result in results[key]:
+                    for synset in chain(
+                        result["synsets"]["literal"],
+                        result["synsets"]["metonymic"],
+                        result["synsets"]["metaphoric"],
+                    ):
+                        t.code = " ".join(
+                            [semfield["code"] for semfield in synset["semfield"]]
+                        )  ## kludgy
+                        t.text = f"{synset['pos']}#{synset['offset']}"
+                        if self.cached:
+                            self._cache.append(copy.copy(t))
+                        yield t
+                t.code = ""
+                t.text = ""
+            if self.cached:
+                self._cache.append(copy.copy(t))
+            yield t
+
     def __call__(self, tokens, **kwargs):
         if kwargs.get("docix", None) == self._docix and self._cache:
             yield from self.cache
@@ -244,52 +288,10 @@ class CachedSynsetFilter(Filter):
 
             GWN = GreekWordNet()
 
+            pending = []
             for t in tokens:
                 if t.mode == "index":
-                    text = t.text
-                    if text:
-                        keys = ["lemma", "uri", "morpho"]
-                        kwargs = {
-                            k: v
-                            for k, v in zip(
-                                keys,
-                                re.search(
-                                    r"(\w+)(?::([\w\d]+))?(?:=(.+))?", text
-                                ).groups(),
-                            )
-                        }
-
-                        if kwargs["uri"] is not None:
-                            results = GWN.lemmas_by_uri(kwargs["uri"]).synsets
-                        else:
-                            kwargs.pop("uri")
-                            results = GWN.lemmas(**kwargs).synsets
-                        for result in results:
-                            for synset in chain(
-                                result["synsets"]["literal"],
-                                result["synsets"]["metonymic"],
-                                result["synsets"]["metaphoric"],
-                            ):
-                                t.code = " ".join(
-                                    [
-                                        semfield["code"]
-                                        for semfield in synset["semfield"]
-                                    ]
-                                )  ## kludgy
-                                t.text = f"{synset['pos']}#{synset['offset']}"
-                                if self.cached:
-                                    self._cache.append(copy.copy(t))
-                                yield t
-                        else:
-                            t.code = ""
-                            t.text = ""
-                            if self.cached:
-                                self._cache.append(copy.copy(t))
-                            yield t
-                    else:
-                        if self.cached:
-                            self._cache.append(copy.copy(t))
-                        yield t
+                    pending.append(copy.copy(t))
                 elif t.mode == "query":
                     if hasattr(t, "language"):
                         language = t.language
@@ -334,3 +336,5 @@ class CachedSynsetFilter(Filter):
                             yield t
                     else:
                         yield t
+            if pending:
+                yield from self._expand(pending)
@@ -1,7 +1,7 @@
 import copy
 
 from cylleneus.engine.analysis.tokenizers import Tokenizer
-from cylleneus.engine.analysis.acore import CylleneusToken
+from cylleneus.engine.analysis.acore import CylleneusToken, replay
 from cylleneus.corpus.lat.agldt import agldt2wn
 
 
@@ -15,7 +15,7 @@ class CachedTokenizer(Tokenizer):
 
     @property
     def cache(self):
-        return copy.deepcopy(self._cache)
+        return replay(self._cache)
 
     def __call__(
         self,
@@ -15,4 +15,5 @@ meta = CorpusMeta(
     glob,
     fetch,
     repo,
+    sentence_spans,
 )
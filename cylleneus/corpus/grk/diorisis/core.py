@@ -1,10 +1,9 @@
-import codecs
 import re
 from itertools import product
 from cylleneus.lang.grk.beta2unicode import beta2unicode
-import lxml.etree as et
 
 from cylleneus import settings
+from cylleneus.corpus.texts import spans_for, texts, xml
 
 # Description
 description = "Diorisis Ancient Greek Corpus (XML)"
@@ -23,14 +22,53 @@ repo = {
 }
 
 
+# Offsets of the sentences of a text, by id
+def sentence_spans(value: bytes):
+    return {
+        int(m.group(1)): m.span()
+        for m in re.finditer(
+            rb"<sentence\b[^>]*?\bid=[\"'](\d+)[\"'][^>]*>.*?</sentence>",
+            value,
+            flags=re.S,
+        )
+    }
+
+
 # Fetch text
 def fetch(work, meta, fragment):
     _, file = work.filename[0]
+    path = work.corpus.text_dir / file
+
+    start = int(meta["start"]["sent_id"])
+    end = int(meta["end"]["sent_id"])
 
-    with codecs.open(work.corpus.text_dir / file, "rb") as f:
-        value = f.read()
-    parser = et.XMLParser(encoding="utf-8")
-    doc = et.XML(value, parser=parser)
+    # Parse only the sentences needed, if their offsets are known
+    spans = spans_for(work)
+    if spans is not None:
+        with spans:
+            values = {
+                sent_id: spans.read(path, sent_id)
+                for sent_id in range(
+                    start - settings.LINES_OF_CONTEXT,
+                    end + settings.LINES_OF_CONTEXT,
+                )
+            }
+        sentences = {}
+
+        def sentence(sent_id):
+            if sent_id not in sentences:
+                value = values.get(sent_id)
+                sentences[sent_id] = (
+                    xml(value) if value is not None else None
+                )
+            return sentences[sent_id]
+    else:
+        body = texts.load(work.corpus.name, path, xml).find(".//text").find(
+            "body"
+        )
+
+        def sentence(sent_id):
+            return body.find(f"sentence[@id='{sent_id}']")
 
     divs = meta["meta"].split("-")
 
@@ -58,14 +96,9 @@ def fetch(work, meta, fragment):
     )
 
     # Collect text and context
-    start = int(meta["start"]["sent_id"])
-    end = int(meta["end"]["sent_id"])
-
     pre_sentences = []
     for pre_id in range(start - settings.LINES_OF_CONTEXT, start):
-        pre_sentence = (
-            doc.find(".//text").find("body").find(f"sentence[@id='{pre_id}']")
-        )
+        pre_sentence = sentence(pre_id)
         if pre_sentence is not None:
             text = " ".join(
                 beta2unicode(el.get("form", "").upper())
@@ -78,9 +111,7 @@ def fetch(work, meta, fragment):
 
     post_sentences = []
     for post_id in range(end + 1, end + settings.LINES_OF_CONTEXT):
-        post_sentence = (
-            doc.find(".//text").find("body").find(f"sentence[@id='{post_id}']")
-        )
+        post_sentence = sentence(post_id)
         if post_sentence is not None:
             text = " ".join(
                 beta2unicode(el.get("form", "").upper())
@@ -93,11 +124,7 @@ def fetch(work, meta, fragment):
 
     match_sentences = []
     for match_id in range(start, end + 1):
-        match_sentence = (
-            doc.find(".//text")
-                .find("body")
-                .find(f"sentence[@id='{match_id}']")
-        )
+        match_sentence = sentence(match_id)
         if match_sentence is not None:
             ref = match_sentence.get("location").split(".")
             text = " ".join(
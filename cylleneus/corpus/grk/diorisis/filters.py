@@ -6,6 +6,7 @@ from greekwordnet import GreekWordNet
 from greekwordnet.greekwordnet import relation_types
 from multiwordnet.wordnet import WordNet
 
+from cylleneus.engine.analysis.acore import replay
 from cylleneus.engine.analysis.filters import Filter
 from cylleneus.lang import iso_639
 from cylleneus.lang.morpho import leipzig2wn
@@ -23,7 +24,7 @@ class CachedLemmaFilter(Filter):
 
     @property
     def cache(self):
-        return copy.deepcopy(self._cache)
+        return replay(self._cache)
 
     def __eq__(self, other):
         return (
@@ -192,7 +193,7 @@ class CachedSynsetFilter(Filter):
 
     @property
     def cache(self):
-        return copy.deepcopy(self._cache)
+        return replay(self._cache)
 
     def __eq__(self, other):
         return (
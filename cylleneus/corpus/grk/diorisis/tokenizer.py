@@ -2,7 +2,7 @@ import copy
 from unicodedata import normalize
 
 from cylleneus.corpus.grk.tlg import AUTHOR_TAB
-from cylleneus.engine.analysis.acore import CylleneusToken
+from cylleneus.engine.analysis.acore import CylleneusToken, replay
 from cylleneus.engine.analysis.tokenizers import Tokenizer
 from cylleneus.lang.grk.beta2unicode import beta2unicode
 from .core import diorisis2wn
@@ -18,7 +18,7 @@ class CachedTokenizer(Tokenizer):
 
     @property
     def cache(self):
-        return copy.deepcopy(self._cache)
+        return replay(self._cache)
 
     def __call__(
         self,
@@ -124,7 +124,7 @@ class CachedTokenizer(Tokenizer):
                             t.morpho = " ".join(morphos)
 
                             if self.cached:
-                                self._cache.append(copy.deepcopy(t))
+                                self._cache.append(copy.copy(t))
                             yield t
                 else:
                     body = data.find('.//text').find('body')
@@ -1,18 +1,303 @@
+import codecs
+import json
+import os
 import queue
 import shutil
+import threading
+from collections import defaultdict
+from datetime import datetime
 from pathlib import Path
 
+import safer
+
 import cylleneus.engine.index
+from cylleneus import settings
+from cylleneus.corpus.texts import Spans
 from cylleneus.engine.writing import CLEAR
 from cylleneus.settings import CORPUS_DIR
-from cylleneus.utils import Debug, slugify
+from cylleneus.utils import Debug, LRUCache, slugify
+
+
+# Memory limit (in MB) of each index writer's pool
+LIMITMB = 4096
 
 
 class IndexingError(Exception):
     pass
 
 
+def _is_closed(reader):
+    return getattr(reader, "is_closed", False) or any(
+        getattr(r, "is_closed", False) for r in getattr(reader, "readers", [])
+    )
+
+
+class IndexPool:
+    """Keeps indexes and their readers open between accesses, by directory and
+    index name. A reader is refreshed, reusing its unchanged segments, only
+    when the index has been committed to since it was opened; the least
+    recently used indexes are closed when more than ``maxsize`` are open."""
+
+    def __init__(self, maxsize: int = settings.INDEX_POOL_SIZE):
+        self._entries = LRUCache(maxsize, callback=self._close)
+        self._lock = threading.RLock()
+
+    @staticmethod
+    def _close(key, entry):
+        reader = entry.get("reader")
+        if reader is not None and not _is_closed(reader):
+            reader.close()
+
+    @staticmethod
+    def _version(ix):
+        generation = ix.latest_generation()
+        if generation == -1:
+            return None
+        toc = Path(ix.storage.folder) / cylleneus.engine.index.TOC._filename(
+            ix.indexname, generation
+        )
+        try:
+            # A destroyed and re-created index may start over at the same
+            # generation, so the TOC's mtime is part of its version too
+            return generation, os.stat(toc).st_mtime_ns
+        except FileNotFoundError:
+            return None
+
+    def _entry(self, path: Path, schema, indexname: str):
+        key = (str(path), indexname)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                if not cylleneus.engine.index.exists_in(
+                    path, indexname=indexname
+                ):
+                    return None
+                entry = {
+                    "ix":      cylleneus.engine.index.open_dir(
+                        path, schema=schema, indexname=indexname
+                    ),
+                    "reader":  None,
+                    "version": None,
+                }
+                self._entries[key] = entry
+            version = self._version(entry["ix"])
+            if version is None:
+                self.discard(path, indexname)
+                return None
+            return entry, version
+
+    def index(self, path: Path, schema, indexname: str):
+        """Returns the open index, or None if it does not exist."""
+
+        result = self._entry(path, schema, indexname)
+        if result is not None:
+            entry, _ = result
+            return entry["ix"]
+
+    def reader(self, path: Path, schema, indexname: str):
+        """Returns an up-to-date reader of the index, or None if it does not
+        exist."""
+
+        with self._lock:
+            result = self._entry(path, schema, indexname)
+            if result is None:
+                return None
+            entry, version = result
+
+            reader = entry["reader"]
+            if reader is None or _is_closed(reader):
+                entry["reader"] = entry["ix"].reader()
+            elif version != entry["version"]:
+                entry["reader"] = entry["ix"].reader(reuse=reader)
+            entry["version"] = version
+            return entry["reader"]
+
+    def docnums(self, path: Path, schema, indexname: str):
+        """Returns the document numbers of each docix in the index, or None if
+        it does not exist. They are read once for each version of the
+        index."""
+
+        with self._lock:
+            reader = self.reader(path, schema, indexname)
+            if reader is None:
+                return None
+            entry = self._entries.get((str(path), indexname))
+            version, docnums = entry.get("docnums", (None, None))
+            if docnums is None or version != entry["version"]:
+                docnums = defaultdict(list)
+                for docnum in reader.all_doc_ids():
+                    docix = reader.stored_fields(docnum)["docix"]
+                    docnums[docix].append(docnum)
+                docnums = dict(docnums)
+                entry["docnums"] = (entry["version"], docnums)
+            return docnums
+
+    def discard(self, path: Path, indexname: str = None):
+        """Closes the pooled indexes in a directory, or only the one named."""
+
+        with self._lock:
+            for key in self._entries.keys():
+                if key[0] == str(path) and indexname in (None, key[1]):
+                    entry = self._entries.pop(key)
+                    if entry is not None:
+                        self._close(key, entry)
+
+    def clear(self):
+        with self._lock:
+            for key in self._entries.keys():
+                self._close(key, self._entries.pop(key))
+
+
+# Indexes and readers shared by the process
+pool = IndexPool()
+
+
+def _encode(value):
+    if isinstance(value, datetime):
+        return {"$datetime": value.isoformat()}
+    raise TypeError(f"{value!r} is not JSON serializable")
+
+
+def _decode(obj):
+    if "$datetime" in obj:
+        return datetime.fromisoformat(obj["$datetime"])
+    return obj
+
+
+def location(toc_filename: str):
+    """Returns the index name and generation of a TOC filename."""
+
+    indexname, generation = (
+        toc_filename.replace(".toc", "").strip("_").rsplit("_", maxsplit=1)
+    )
+    return indexname, int(generation)
+
+
+class DocTable:
+    """Maps each docix of a corpus to the directory, name and generation of
+    its index and a summary of its stored fields, so that documents can be
+    located without walking the index directory.
+
+    The table is derived from the corpus manifest and kept in ``docs.json``
+    beside it; it is rebuilt in memory whenever the manifest is newer.
+    Stored fields missing from the table are read from the index once, then
+    kept in memory. The table is only written by `save`, when the manifest
+    is."""
+
+    def __init__(self, corpus):
+        self.corpus = corpus
+        self.path = corpus.path / Path("docs.json")
+        self._table = {}
+        self._load()
+
+    def _load(self):
+        manifest_file = self.corpus.path / Path("manifest.json")
+        if (
+            self.path.exists()
+            and manifest_file.exists()
+            and self.path.stat().st_mtime >= manifest_file.stat().st_mtime
+        ):
+            with codecs.open(self.path, "r", "utf8") as fp:
+                self._table = json.load(fp, object_hook=_decode)
+        elif self.corpus.manifest:
+            if self.path.exists():
+                with codecs.open(self.path, "r", "utf8") as fp:
+                    self._table = json.load(fp, object_hook=_decode)
+            self.sync()
+
+    def sync(self):
+        """Reconcile the table with the manifest, keeping the stored fields of
+        documents whose index is unchanged."""
+
+        table = {}
+        for docix, work_manifest in self.corpus.manifest.items():
+            indexname, generation = location(work_manifest["index"][0])
+            entry = {
+                "path":       work_manifest["path"],
+                "indexname":  indexname,
+                "generation": generation,
+                "doc":        None,
+            }
+            previous = self._table.get(docix)
+            if previous and all(
+                previous[key] == entry[key]
+                for key in ["path", "indexname", "generation"]
+            ):
+                entry["doc"] = previous["doc"]
+            table[docix] = entry
+        self._table = table
+
+    def save(self):
+        """Writes the table, if the corpus directory can be written to; the
+        table is only a cache of the manifest and the indexes, so it can
+        always be rebuilt."""
+
+        try:
+            if not self.corpus.path.exists():
+                self.corpus.path.mkdir(parents=True, exist_ok=True)
+            with safer.open(
+                self.path, mode="w", encoding="utf8", temp_file=False
+            ) as fp:
+                json.dump(
+                    self._table, fp, ensure_ascii=False, default=_encode
+                )
+        except OSError as e:
+            Debug.print(Debug.LOW, f"- Could not save {self.path}: {e}")
+
+    def __contains__(self, docix):
+        return str(docix) in self._table
+
+    def __len__(self):
+        return len(self._table)
+
+    def __iter__(self):
+        return (int(docix) for docix in self._table)
+
+    def update(self, docix, doc: dict = None):
+        """Records the stored fields of a newly indexed document."""
+
+        entry = self._table.get(str(docix))
+        if entry is not None and doc is not None:
+            entry["doc"] = {
+                name: doc[name]
+                for name in self.corpus.schema.stored_names()
+                if name in doc
+            }
+
+    def location(self, docix):
+        """Returns the directory, name and generation of a document's index,
+        or None if it is not in the manifest."""
+
+        entry = self._table.get(str(docix))
+        if entry is not None:
+            return (
+                Path(CORPUS_DIR) / Path(entry["path"]),
+                entry["indexname"],
+                entry["generation"],
+            )
+
+    def doc(self, docix):
+        """Returns the stored fields of a document, or None if it is not in the
+        manifest or its index no longer exists."""
+
+        entry = self._table.get(str(docix))
+        if entry is None:
+            return None
+        if entry["doc"] is None:
+            path, indexname, _ = self.location(docix)
+            try:
+                reader = pool.reader(path, self.corpus.schema, indexname)
+            except FileNotFoundError:
+                return None
+            if reader is None:
+                return None
+            self.update(docix, reader.stored_fields(0))
+        return dict(entry["doc"])
+
+
 def doc_for_docix(corpus, docix: int):
+    if docix in corpus.docs:
+        return corpus.docs.doc(docix)
     try:
         toc_filename = next(corpus.index_dir.glob(f"*/*/*_{docix}_*.toc"))
     except StopIteration:
@@ -28,13 +313,8 @@ def doc_for_docix(corpus, docix: int):
         path = Path(toc_filename).parent
 
         try:
-            if cylleneus.engine.index.exists_in(path, indexname=indexname):
-                ix = cylleneus.engine.index.open_dir(
-                    path, schema=corpus.schema, indexname=indexname
-                )
-                doc = ix.reader().stored_fields(0)
-            else:
-                doc = None
+            reader = pool.reader(path, corpus.schema, indexname)
+            doc = reader.stored_fields(0) if reader is not None else None
         except FileNotFoundError:
             return None
         else:
@@ -52,11 +332,9 @@ def docs_for(corpus, author: str = "*", title: str = "*"):
                 )
             ).strip("_")
 
-            if cylleneus.engine.index.exists_in(path, indexname=indexname):
-                ix = cylleneus.engine.index.open_dir(
-                    path, schema=corpus.schema, indexname=indexname
-                )
-                yield from ix.reader().iter_docs()
+            reader = pool.reader(path, corpus.schema, indexname)
+            if reader is not None:
+                yield from reader.iter_docs()
 
 
 class Indexer:
@@ -94,6 +372,10 @@ class Indexer:
         self._corpus = cp
 
     def index_for_docix(self, docix: int):
+        if docix in self.corpus.docs:
+            path, indexname, _ = self.corpus.docs.location(docix)
+            return pool.index(path, self.corpus.schema, indexname)
+
         toc_filename = next(self.path.glob(f"*_{docix}_*.toc"))
 
         indexname = (
@@ -105,28 +387,34 @@ class Indexer:
         ).strip("_")
         path = Path(toc_filename).parent
 
-        if cylleneus.engine.index.exists_in(path, indexname=indexname):
-            return cylleneus.engine.index.open_dir(
-                path, schema=self.corpus.schema, indexname=indexname
-            )
+        return pool.index(path, self.corpus.schema, indexname)
 
     @property
-    def indexes(self):
+    def indexnames(self):
         for index in self._index_files:
-            indexname = (
+            yield (
                 "_".join(
                     index.name.replace(".toc", "").rsplit("_", maxsplit=4)[:4]
                 )
             ).strip("_")
 
-            if cylleneus.engine.index.exists_in(
-                self.path, indexname=indexname
-            ):
-                ix = cylleneus.engine.index.open_dir(
-                    self.path, schema=self.corpus.schema, indexname=indexname
-                )
+    @property
+    def indexes(self):
+        for indexname in self.indexnames:
+            ix = pool.index(self.path, self.corpus.schema, indexname)
+            if ix is not None:
                 yield ix
 
+    @property
+    def readers(self):
+        """Pooled readers of the work's indexes, which the caller must not
+        close."""
+
+        for indexname in self.indexnames:
+            reader = pool.reader(self.path, self.corpus.schema, indexname)
+            if reader is not None:
+                yield reader
+
     @indexes.setter
     def indexes(self, ixs):
         self._indexes = ixs
@@ -141,8 +429,8 @@ class Indexer:
         self._path = p
 
     def iter_docs(self):
-        for ix in self.indexes:
-            yield from ix.reader().iter_docs()
+        for reader in self.readers:
+            yield from reader.iter_docs()
 
     def clear(self):
         for ix in self.indexes:
@@ -151,6 +439,7 @@ class Indexer:
 
     def destroy(self, docix: int = None):
         if self.path and self.path.exists():
+            pool.discard(self.path)
             shutil.rmtree(self.path)
             self._indexes = []
         if docix is not None:
@@ -189,7 +478,12 @@ class Indexer:
         return self.from_file(path, destructive=True)
 
     def from_file(
-        self, path: Path, destructive: bool = False, optimize: bool = False
+        self,
+        path: Path,
+        destructive: bool = False,
+        optimize: bool = False,
+        docix: int = None,
+        limitmb: int = LIMITMB,
     ):
         if not path.exists():
             return
@@ -223,7 +517,7 @@ class Indexer:
                 )
                 self.destroy(existing)
                 docix = existing
-        else:
+        elif docix is None:
             docix = self.corpus.doc_count_all
 
         kwargs["docix"] = docix
@@ -236,13 +530,22 @@ class Indexer:
         indexname = f"{self.corpus.name}_{slugify(kwargs['author'])}_{slugify(kwargs['title'])}_{docix}"
         ix = self.open(indexname=indexname)
 
-        writer = ix.writer(limitmb=4096, procs=1)
+        writer = ix.writer(limitmb=limitmb, procs=1)
         try:
-            writer.add_document(**kwargs)
+            if settings.INDEX_PASSAGES:
+                writer.add_passages(depth=settings.INDEX_PASSAGES, **kwargs)
+            else:
+                writer.add_document(**kwargs)
             writer.commit(mergetype=CLEAR, optimize=optimize)
         except queue.Empty as e:
             pass
 
+        # Offsets of the source text's spans, for fetching hits
+        if self.corpus.meta.spans:
+            with codecs.open(path, "rb") as fp:
+                spans = self.corpus.meta.spans(fp.read())
+            Spans.write(self.path / f"{indexname}.spans", spans, path)
+
         work_manifest = {
             "author":   kwargs["author"],
             "title":    kwargs["title"],
@@ -255,7 +558,7 @@ class Indexer:
                 writer.newsegment.make_filename(".seg"),
             ],
         }
-        self.corpus.update_manifest(docix, work_manifest)
+        self.corpus.update_manifest(docix, work_manifest, doc=kwargs)
         Debug.print(
             Debug.MEDIUM,
             f"- Indexed '{self.corpus.name}' docix {docix}: {kwargs['author']}, {kwargs['title']} ({path})",
@@ -309,7 +612,7 @@ class Indexer:
         indexname = f"{self.corpus.name}_{slugify(kwargs['author'])}_{slugify(kwargs['title'])}_{docix}"
         ix = self.open(indexname=indexname)
 
-        writer = ix.writer(limitmb=4096, procs=1, multisegment=True)
+        writer = ix.writer(limitmb=LIMITMB, procs=1, multisegment=True)
         try:
             Debug.print(
                 Debug.MEDIUM,
@@ -317,7 +620,10 @@ class Indexer:
                     kwargs["author"], kwargs["title"], self.corpus.name, docix,
                 ),
             )
-            writer.add_document(**kwargs)
+            if settings.INDEX_PASSAGES:
+                writer.add_passages(depth=settings.INDEX_PASSAGES, **kwargs)
+            else:
+                writer.add_document(**kwargs)
             writer.commit(optimize=optimize)
         except queue.Empty as e:
             pass
@@ -338,5 +644,5 @@ class Indexer:
             f"- Indexed '{self.corpus.name}' docix {docix}: {kwargs['author']}, {kwargs['title']} (\"{content[:24]}"
             f'...")',
         )
-        self.corpus.update_manifest(docix, work_manifest)
+        self.corpus.update_manifest(docix, work_manifest, doc=kwargs)
         return docix
@@ -2,7 +2,7 @@ import copy
 import re
 
 from cylleneus.engine.analysis.tokenizers import Tokenizer
-from cylleneus.engine.analysis.acore import CylleneusToken
+from cylleneus.engine.analysis.acore import CylleneusToken, replay
 from cylleneus.lang.lat import editorial, jvmap
 from cylleneus.corpus.lat.agldt import agldt2wn
 
@@ -17,7 +17,7 @@ class CachedTokenizer(Tokenizer):
 
     @property
     def cache(self):
-        return copy.deepcopy(self._cache)
+        return replay(self._cache)
 
     def __call__(
         self,
@@ -101,7 +101,7 @@ class CachedTokenizer(Tokenizer):
                                 t.startchar = copy.copy(start_char)
                                 t.endchar = copy.copy(start_char + original_len)
                             if self.cached:
-                                self._cache.append(copy.deepcopy(t))
+                                self._cache.append(copy.copy(t))
                             yield t
 
                             if form in editorial:
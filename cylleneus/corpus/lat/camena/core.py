@@ -1,9 +1,8 @@
-import codecs
 from pathlib import Path
 
-import lxml.etree as et
 from cylleneus.settings import LINES_OF_CONTEXT
 from cylleneus.lang.lat import word_tokenizer
+from cylleneus.corpus.texts import texts, xml
 
 # Description
 description = (
@@ -27,12 +26,7 @@ repo = {
 # Function to fetch text from corpus
 def fetch(work, meta, fragment):
     _, file = work.filename[0]
-    with codecs.open(
-        work.corpus.text_dir / file, "rb"
-    ) as fp:
-        value = fp.read()
-    parser = et.XMLParser(encoding="utf-8")
-    doc = et.XML(value, parser=parser)
+    doc = texts.load(work.corpus.name, work.corpus.text_dir / file, xml)
 
     # URN
     _, urn = work.urn[0]
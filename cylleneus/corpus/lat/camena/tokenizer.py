@@ -2,7 +2,7 @@ import copy
 import re
 import string
 
-from cylleneus.engine.analysis.acore import CylleneusToken
+from cylleneus.engine.analysis.acore import CylleneusToken, replay
 from cylleneus.engine.analysis.tokenizers import Tokenizer
 from cylleneus.lang.lat import enclitics, jvmap, word_tokenizer
 
@@ -17,7 +17,7 @@ class CachedTokenizer(Tokenizer):
 
     @property
     def cache(self):
-        return copy.deepcopy(self._cache)
+        return replay(self._cache)
 
     def __call__(
         self,
@@ -132,7 +132,7 @@ class CachedTokenizer(Tokenizer):
                                             )
                                             if mode == "index":
                                                 self._cache.append(
-                                                    copy.deepcopy(t)
+                                                    copy.copy(t)
                                                 )
                                             yield t
                                             t.text = "ne"
@@ -146,7 +146,7 @@ class CachedTokenizer(Tokenizer):
                                             )
                                             if mode == "index":
                                                 self._cache.append(
-                                                    copy.deepcopy(t)
+                                                    copy.copy(t)
                                                 )
                                             yield t
                                         elif enclitic == "ne":
@@ -157,7 +157,7 @@ class CachedTokenizer(Tokenizer):
                                             )
                                             if mode == "index":
                                                 self._cache.append(
-                                                    copy.deepcopy(t)
+                                                    copy.copy(t)
                                                 )
                                             yield t
                                             t.text = "ne"
@@ -171,7 +171,7 @@ class CachedTokenizer(Tokenizer):
                                             )
                                             if mode == "index":
                                                 self._cache.append(
-                                                    copy.deepcopy(t)
+                                                    copy.copy(t)
                                                 )
                                             yield t
                                         elif enclitic == "st":
@@ -189,7 +189,7 @@ class CachedTokenizer(Tokenizer):
                                                 )
                                                 if mode == "index":
                                                     self._cache.append(
-                                                        copy.deepcopy(t)
+                                                        copy.copy(t)
                                                     )
                                                 yield t
                                                 t.text = "est"
@@ -205,7 +205,7 @@ class CachedTokenizer(Tokenizer):
                                                 )
                                                 if mode == "index":
                                                     self._cache.append(
-                                                        copy.deepcopy(t)
+                                                        copy.copy(t)
                                                     )
                                                 yield t
                                             else:
@@ -222,7 +222,7 @@ class CachedTokenizer(Tokenizer):
                                                 )
                                                 if mode == "index":
                                                     self._cache.append(
-                                                        copy.deepcopy(t)
+                                                        copy.copy(t)
                                                     )
                                                 yield t
                                                 t.text = "est"
@@ -238,7 +238,7 @@ class CachedTokenizer(Tokenizer):
                                                 )
                                                 if mode == "index":
                                                     self._cache.append(
-                                                        copy.deepcopy(t)
+                                                        copy.copy(t)
                                                     )
                                                 yield t
                                         elif enclitic == "'s":
@@ -247,7 +247,7 @@ class CachedTokenizer(Tokenizer):
                                             t.endchar = start_char + len(token)
                                             if mode == "index":
                                                 self._cache.append(
-                                                    copy.deepcopy(t)
+                                                    copy.copy(t)
                                                 )
                                             yield t
                                             t.text = "es"
@@ -261,7 +261,7 @@ class CachedTokenizer(Tokenizer):
                                             )
                                             if mode == "index":
                                                 self._cache.append(
-                                                    copy.deepcopy(t)
+                                                    copy.copy(t)
                                                 )
                                             yield t
                                         else:
@@ -272,7 +272,7 @@ class CachedTokenizer(Tokenizer):
                                             )
                                             if mode == "index":
                                                 self._cache.append(
-                                                    copy.deepcopy(t)
+                                                    copy.copy(t)
                                                 )
                                             yield t
                                             t.text = enclitic
@@ -286,7 +286,7 @@ class CachedTokenizer(Tokenizer):
                                             )
                                             if mode == "index":
                                                 self._cache.append(
-                                                    copy.deepcopy(t)
+                                                    copy.copy(t)
                                                 )
                                             yield t
                                         is_enclitic = True
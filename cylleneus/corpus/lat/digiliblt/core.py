@@ -1,12 +1,10 @@
-import codecs
 import re
 import string
 
-import lxml.etree as et
-
 from cylleneus import settings
 from cylleneus.lang.lat import sent_tokenizer, word_tokenizer
 from cylleneus.utils import nrange
+from cylleneus.corpus.texts import texts, xml
 
 # Description
 description = "Digital Library of Late-Antique Latin Texts (DigilibLT)"
@@ -28,10 +26,7 @@ repo = {
 # Function to fetch text from corpus
 def fetch(work, meta, fragment):
     _, file = work.filename[0]
-    with codecs.open(work.corpus.text_dir / file, "rb") as fp:
-        value = fp.read()
-    parser = et.XMLParser(encoding="utf-8")
-    doc = et.XML(value, parser=parser)
+    doc = texts.load(work.corpus.name, work.corpus.text_dir / file, xml)
 
     # URN
     urn = (
@@ -2,12 +2,12 @@ import copy
 import re
 import string
 
-from cylleneus.engine.analysis.acore import CylleneusToken
+from cylleneus.engine.analysis.acore import CylleneusToken, replay
 from cylleneus.engine.analysis.tokenizers import Tokenizer
 from cylleneus.lang.lat import (
     enclitics,
     jvmap,
-    latin_exceptions,
+    lexicon,
     sent_tokenizer,
     word_tokenizer,
 )
@@ -23,7 +23,7 @@ class CachedTokenizer(Tokenizer):
 
     @property
     def cache(self):
-        return copy.deepcopy(self._cache)
+        return replay(self._cache)
 
     def __call__(
         self,
@@ -183,7 +183,7 @@ class CachedTokenizer(Tokenizer):
                                             if (
                                                 token.endswith(enclitic)
                                                 and token
-                                                not in latin_exceptions
+                                                not in lexicon.latin_exceptions
                                             ):
                                                 if enclitic == "ne":
                                                     t.text = token[
@@ -196,7 +196,7 @@ class CachedTokenizer(Tokenizer):
                                                     )
                                                     if mode == "index":
                                                         self._cache.append(
-                                                            copy.deepcopy(t)
+                                                            copy.copy(t)
                                                         )
                                                     yield t
                                                     t.text = "ne"
@@ -223,7 +223,7 @@ class CachedTokenizer(Tokenizer):
                                                     )
                                                     if mode == "index":
                                                         self._cache.append(
-                                                            copy.deepcopy(t)
+                                                            copy.copy(t)
                                                         )
                                                     yield t
                                                 elif enclitic == "n":
@@ -239,7 +239,7 @@ class CachedTokenizer(Tokenizer):
                                                     )
                                                     if mode == "index":
                                                         self._cache.append(
-                                                            copy.deepcopy(t)
+                                                            copy.copy(t)
                                                         )
                                                     yield t
                                                     t.text = "ne"
@@ -266,7 +266,7 @@ class CachedTokenizer(Tokenizer):
                                                     )
                                                     if mode == "index":
                                                         self._cache.append(
-                                                            copy.deepcopy(t)
+                                                            copy.copy(t)
                                                         )
                                                     yield t
                                                 elif enclitic == "st":
@@ -290,7 +290,7 @@ class CachedTokenizer(Tokenizer):
                                                         )
                                                         if mode == "index":
                                                             self._cache.append(
-                                                                copy.deepcopy(
+                                                                copy.copy(
                                                                     t
                                                                 )
                                                             )
@@ -319,7 +319,7 @@ class CachedTokenizer(Tokenizer):
                                                         )
                                                         if mode == "index":
                                                             self._cache.append(
-                                                                copy.deepcopy(
+                                                                copy.copy(
                                                                     t
                                                                 )
                                                             )
@@ -344,7 +344,7 @@ class CachedTokenizer(Tokenizer):
                                                         )
                                                         if mode == "index":
                                                             self._cache.append(
-                                                                copy.deepcopy(
+                                                                copy.copy(
                                                                     t
                                                                 )
                                                             )
@@ -373,7 +373,7 @@ class CachedTokenizer(Tokenizer):
                                                         )
                                                         if mode == "index":
                                                             self._cache.append(
-                                                                copy.deepcopy(
+                                                                copy.copy(
                                                                     t
                                                                 )
                                                             )
@@ -386,7 +386,7 @@ class CachedTokenizer(Tokenizer):
                                                     )
                                                     if mode == "index":
                                                         self._cache.append(
-                                                            copy.deepcopy(t)
+                                                            copy.copy(t)
                                                         )
                                                     yield t
                                                     t.text = "es"
@@ -402,7 +402,7 @@ class CachedTokenizer(Tokenizer):
                                                     )
                                                     if mode == "index":
                                                         self._cache.append(
-                                                            copy.deepcopy(t)
+                                                            copy.copy(t)
                                                         )
                                                     yield t
                                                 else:
@@ -422,7 +422,7 @@ class CachedTokenizer(Tokenizer):
                                                     )
                                                     if mode == "index":
                                                         self._cache.append(
-                                                            copy.deepcopy(t)
+                                                            copy.copy(t)
                                                         )
                                                     yield t
                                                     t.text = enclitic
@@ -449,7 +449,7 @@ class CachedTokenizer(Tokenizer):
                                                     )
                                                     if mode == "index":
                                                         self._cache.append(
-                                                            copy.deepcopy(t)
+                                                            copy.copy(t)
                                                         )
                                                     yield t
                                                 is_enclitic = True
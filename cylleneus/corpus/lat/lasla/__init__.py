@@ -4,6 +4,7 @@ from .schema import DocumentSchema
 from .tokenizer import CachedTokenizer as Tokenizer
 
 from cylleneus.corpus.meta import CorpusMeta
+from cylleneus.corpus.texts import line_spans
 
 # Manifest information
 meta = CorpusMeta(
@@ -15,4 +16,5 @@ meta = CorpusMeta(
     glob,
     fetch,
     repo,
+    line_spans,
 )
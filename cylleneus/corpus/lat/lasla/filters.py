@@ -1,6 +1,7 @@
 import copy
 import re
 
+from cylleneus.engine.analysis.acore import replay
 from cylleneus.engine.analysis.filters import Filter
 from cylleneus.lang.morpho import leipzig2wn
 from latinwordnet import LatinWordNet
@@ -57,7 +58,7 @@ class CachedLemmaFilter(Filter):
 
     @property
     def cache(self):
-        return copy.deepcopy(self._cache)
+        return replay(self._cache)
 
     def __eq__(self, other):
         return (
@@ -2,7 +2,7 @@ import copy
 import re
 import string
 
-from cylleneus.engine.analysis.acore import CylleneusToken
+from cylleneus.engine.analysis.acore import CylleneusToken, replay
 from cylleneus.engine.analysis.tokenizers import Tokenizer
 from cylleneus.lang.lat import jvmap
 from cylleneus.utils import alnum
@@ -20,7 +20,7 @@ class CachedTokenizer(Tokenizer):
 
     @property
     def cache(self):
-        return copy.deepcopy(self._cache)
+        return replay(self._cache)
 
     def __call__(
         self,
@@ -190,7 +190,7 @@ class CachedTokenizer(Tokenizer):
                         t.endchar = start_char + len(t.original)
 
                         if t.text != t.original:
-                            tc = copy.deepcopy(t)
+                            tc = copy.copy(t)
                             tc.text = t.original
                             yield tc
 
@@ -1,8 +1,8 @@
-import codecs
 import json
 from pathlib import Path
 
 from cylleneus import settings
+from cylleneus.corpus.texts import texts
 from cylleneus.utils import nrange, alnum
 
 # Description
@@ -25,10 +25,7 @@ repo = {
 # Fetch text
 def fetch(work, meta, fragment):
     _, file = work.filename[0]
-    with codecs.open(
-        work.corpus.text_dir / file, "r", "utf8"
-    ) as fp:
-        doc = json.load(fp)
+    doc = texts.load(work.corpus.name, work.corpus.text_dir / file, json.loads)
 
     divs = meta["meta"].split("-")
 
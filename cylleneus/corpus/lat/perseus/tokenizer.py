@@ -2,15 +2,14 @@ import copy
 import re
 import string
 
-from cylleneus.engine.analysis.acore import CylleneusToken
+from cylleneus.engine.analysis.acore import CylleneusToken, replay
 from cylleneus.engine.analysis.tokenizers import Tokenizer
 from cylleneus.lang.lat import (
     PunktLatinCharsVars,
     compound,
     enclitics,
-    exceptions,
     jvmap,
-    proper_names,
+    lexicon,
     punctuation,
     replacements,
     strip_diacritics,
@@ -29,7 +28,7 @@ class CachedTokenizer(Tokenizer):
 
     @property
     def cache(self):
-        return copy.deepcopy(self._cache)
+        return replay(self._cache)
 
     def __call__(
         self,
@@ -99,14 +98,14 @@ class CachedTokenizer(Tokenizer):
                                 temp_tokens[0]
                                     .replace("j", "i")
                                     .replace("v", "u")
-                                not in proper_names.proper_names
+                                not in lexicon.proper_names
                             ):
                                 temp_tokens[0] = temp_tokens[0]
 
                             for ix, token in enumerate(temp_tokens):
-                                ppp = compound.is_ppp(token)
+                                ppp = lexicon.is_ppp(token)
                                 if ppp and ix < len(temp_tokens) - 2:
-                                    copula = compound.is_copula(
+                                    copula = lexicon.is_copula(
                                         temp_tokens[ix + 2]
                                     )  # whitespace
                                     if copula and ppp[1] == copula[2]:
@@ -170,7 +169,7 @@ class CachedTokenizer(Tokenizer):
                             t.meta = meta
 
                             is_enclitic = False
-                            if token not in exceptions:
+                            if token not in lexicon.exceptions:
                                 if t.original in replacements:
                                     for subtoken in replacements[t.original]:
                                         t.text = subtoken
@@ -180,7 +179,7 @@ class CachedTokenizer(Tokenizer):
                                         )
                                         if mode == "index":
                                             self._cache.append(
-                                                copy.deepcopy(t)
+                                                copy.copy(t)
                                             )
                                         yield t
                                     start_char += original_length
@@ -192,7 +191,7 @@ class CachedTokenizer(Tokenizer):
                                     t.startchar = start_char
                                     t.endchar = start_char + len(ppp) + 1
                                     if mode == "index":
-                                        self._cache.append(copy.deepcopy(t))
+                                        self._cache.append(copy.copy(t))
                                     yield t
                                     t.text = copula
                                     t.startchar = start_char + len(ppp)
@@ -200,7 +199,7 @@ class CachedTokenizer(Tokenizer):
                                         start_char + len(ppp) + len(copula)
                                     )
                                     if mode == "index":
-                                        self._cache.append(copy.deepcopy(t))
+                                        self._cache.append(copy.copy(t))
                                     yield t
                                     start_char += original_length
                                     continue
@@ -215,7 +214,7 @@ class CachedTokenizer(Tokenizer):
                                             )
                                             if mode == "index":
                                                 self._cache.append(
-                                                    copy.deepcopy(t)
+                                                    copy.copy(t)
                                                 )
                                             yield t
                                             t.text = "ne"
@@ -229,7 +228,7 @@ class CachedTokenizer(Tokenizer):
                                             )
                                             if mode == "index":
                                                 self._cache.append(
-                                                    copy.deepcopy(t)
+                                                    copy.copy(t)
                                                 )
                                             yield t
                                         elif enclitic == "n":
@@ -244,7 +243,7 @@ class CachedTokenizer(Tokenizer):
                                             )
                                             if mode == "index":
                                                 self._cache.append(
-                                                    copy.deepcopy(t)
+                                                    copy.copy(t)
                                                 )
                                             yield t
                                             t.text = "ne"
@@ -258,7 +257,7 @@ class CachedTokenizer(Tokenizer):
                                             )
                                             if mode == "index":
                                                 self._cache.append(
-                                                    copy.deepcopy(t)
+                                                    copy.copy(t)
                                                 )
                                             yield t
                                         elif enclitic == "st":
@@ -276,7 +275,7 @@ class CachedTokenizer(Tokenizer):
                                                 )
                                                 if mode == "index":
                                                     self._cache.append(
-                                                        copy.deepcopy(t)
+                                                        copy.copy(t)
                                                     )
                                                 yield t
                                                 t.text = "est"
@@ -292,7 +291,7 @@ class CachedTokenizer(Tokenizer):
                                                 )
                                                 if mode == "index":
                                                     self._cache.append(
-                                                        copy.deepcopy(t)
+                                                        copy.copy(t)
                                                     )
                                                 yield t
                                             else:
@@ -309,7 +308,7 @@ class CachedTokenizer(Tokenizer):
                                                 )
                                                 if mode == "index":
                                                     self._cache.append(
-                                                        copy.deepcopy(t)
+                                                        copy.copy(t)
                                                     )
                                                 yield t
                                                 t.text = "est"
@@ -325,7 +324,7 @@ class CachedTokenizer(Tokenizer):
                                                 )
                                                 if mode == "index":
                                                     self._cache.append(
-                                                        copy.deepcopy(t)
+                                                        copy.copy(t)
                                                     )
                                                 yield t
                                         elif enclitic == "'s":
@@ -334,7 +333,7 @@ class CachedTokenizer(Tokenizer):
                                             t.endchar = start_char + len(token)
                                             if mode == "index":
                                                 self._cache.append(
-                                                    copy.deepcopy(t)
+                                                    copy.copy(t)
                                                 )
                                             yield t
                                             t.text = "es"
@@ -348,7 +347,7 @@ class CachedTokenizer(Tokenizer):
                                             )
                                             if mode == "index":
                                                 self._cache.append(
-                                                    copy.deepcopy(t)
+                                                    copy.copy(t)
                                                 )
                                             yield t
                                         else:
@@ -359,7 +358,7 @@ class CachedTokenizer(Tokenizer):
                                             )
                                             if mode == "index":
                                                 self._cache.append(
-                                                    copy.deepcopy(t)
+                                                    copy.copy(t)
                                                 )
                                             yield t
                                             t.text = enclitic
@@ -373,7 +372,7 @@ class CachedTokenizer(Tokenizer):
                                             )
                                             if mode == "index":
                                                 self._cache.append(
-                                                    copy.deepcopy(t)
+                                                    copy.copy(t)
                                                 )
                                             yield t
                                         is_enclitic = True
@@ -386,7 +385,7 @@ class CachedTokenizer(Tokenizer):
                                         start_char + original_length - rdiff
                                     )  # - ndiff - rdiff
                                 if mode == "index":
-                                    self._cache.append(copy.deepcopy(t))
+                                    self._cache.append(copy.copy(t))
                                 yield t
                             start_char += original_length
                             sent_pos += 1
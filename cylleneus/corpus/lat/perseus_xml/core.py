@@ -1,10 +1,9 @@
-import codecs
 from pathlib import Path
 import re
 
-import lxml.etree as et
 from cylleneus import settings
 from cylleneus.utils import alnum, stringify
+from cylleneus.corpus.texts import texts, xml
 
 # Description
 description = "Perseus Digital Library (XML)"
@@ -26,10 +25,7 @@ repo = {
 # Fetch text
 def fetch(work, meta, fragment):
     _, file = work.filename[0]
-    with codecs.open(work.corpus.text_dir / file, "rb") as fp:
-        value = fp.read()
-    parser = et.XMLParser(encoding="utf-8")
-    doc = et.XML(value, parser=parser)
+    doc = texts.load(work.corpus.name, work.corpus.text_dir / file, xml)
 
     # URN
     _, urn = work.urn[0]
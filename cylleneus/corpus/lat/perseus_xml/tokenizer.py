@@ -2,15 +2,14 @@ import copy
 import re
 import string
 
-from cylleneus.engine.analysis.acore import CylleneusToken
+from cylleneus.engine.analysis.acore import CylleneusToken, replay
 from cylleneus.engine.analysis.tokenizers import Tokenizer
 from cylleneus.lang.lat import (
     PunktLatinCharsVars,
     compound,
     enclitics,
-    exceptions,
     jvmap,
-    proper_names,
+    lexicon,
     punctuation,
     replacements,
     convert_diphthongs,
@@ -29,7 +28,7 @@ class CachedTokenizer(Tokenizer):
 
     @property
     def cache(self):
-        return copy.deepcopy(self._cache)
+        return replay(self._cache)
 
     def __call__(
         self,
@@ -156,14 +155,14 @@ class CachedTokenizer(Tokenizer):
                                 temp_tokens[0]
                                     .replace("j", "i")
                                     .replace("v", "u")
-                                not in proper_names.proper_names
+                                not in lexicon.proper_names
                             ):
                                 temp_tokens[0] = temp_tokens[0]
 
                             for ix, token in enumerate(temp_tokens):
-                                ppp = compound.is_ppp(token)
+                                ppp = lexicon.is_ppp(token)
                                 if ppp and ix < len(temp_tokens) - 2:
-                                    copula = compound.is_copula(
+                                    copula = lexicon.is_copula(
                                         temp_tokens[ix + 2]
                                     )  # whitespace
                                     if copula and ppp[1] == copula[2]:
@@ -216,10 +215,10 @@ class CachedTokenizer(Tokenizer):
                                 start_char += original_length
                                 continue
 
-                            t.meta = copy.deepcopy(meta)
+                            t.meta = copy.copy(meta)
 
                             is_enclitic = False
-                            if token not in exceptions:
+                            if token not in lexicon.exceptions:
                                 if t.original in replacements:
                                     for subtoken in replacements[t.original]:
                                         t.text = subtoken
@@ -229,7 +228,7 @@ class CachedTokenizer(Tokenizer):
                                         )
                                         if mode == "index":
                                             self._cache.append(
-                                                copy.deepcopy(t)
+                                                copy.copy(t)
                                             )
                                         yield t
                                     start_char += original_length
@@ -241,7 +240,7 @@ class CachedTokenizer(Tokenizer):
                                     t.startchar = start_char
                                     t.endchar = start_char + len(ppp) + 1
                                     if mode == "index":
-                                        self._cache.append(copy.deepcopy(t))
+                                        self._cache.append(copy.copy(t))
                                     yield t
                                     t.text = copula
                                     t.startchar = start_char + len(ppp)
@@ -249,7 +248,7 @@ class CachedTokenizer(Tokenizer):
                                         start_char + len(ppp) + len(copula)
                                     )
                                     if mode == "index":
-                                        self._cache.append(copy.deepcopy(t))
+                                        self._cache.append(copy.copy(t))
                                     yield t
                                     start_char += original_length
                                     continue
@@ -264,7 +263,7 @@ class CachedTokenizer(Tokenizer):
                                             )
                                             if mode == "index":
                                                 self._cache.append(
-                                                    copy.deepcopy(t)
+                                                    copy.copy(t)
                                                 )
                                             yield t
                                             t.text = "ne"
@@ -278,7 +277,7 @@ class CachedTokenizer(Tokenizer):
                                             )
                                             if mode == "index":
                                                 self._cache.append(
-                                                    copy.deepcopy(t)
+                                                    copy.copy(t)
                                                 )
                                             yield t
                                         elif enclitic == "n":
@@ -293,7 +292,7 @@ class CachedTokenizer(Tokenizer):
                                             )
                                             if mode == "index":
                                                 self._cache.append(
-                                                    copy.deepcopy(t)
+                                                    copy.copy(t)
                                                 )
                                             yield t
                                             t.text = "ne"
@@ -307,7 +306,7 @@ class CachedTokenizer(Tokenizer):
                                             )
                                             if mode == "index":
                                                 self._cache.append(
-                                                    copy.deepcopy(t)
+                                                    copy.copy(t)
                                                 )
                                             yield t
                                         elif enclitic == "st":
@@ -325,7 +324,7 @@ class CachedTokenizer(Tokenizer):
                                                 )
                                                 if mode == "index":
                                                     self._cache.append(
-                                                        copy.deepcopy(t)
+                                                        copy.copy(t)
                                                     )
                                                 yield t
                                                 t.text = "est"
@@ -341,7 +340,7 @@ class CachedTokenizer(Tokenizer):
                                                 )
                                                 if mode == "index":
                                                     self._cache.append(
-                                                        copy.deepcopy(t)
+                                                        copy.copy(t)
                                                     )
                                                 yield t
                                             else:
@@ -358,7 +357,7 @@ class CachedTokenizer(Tokenizer):
                                                 )
                                                 if mode == "index":
                                                     self._cache.append(
-                                                        copy.deepcopy(t)
+                                                        copy.copy(t)
                                                     )
                                                 yield t
                                                 t.text = "est"
@@ -374,7 +373,7 @@ class CachedTokenizer(Tokenizer):
                                                 )
                                                 if mode == "index":
                                                     self._cache.append(
-                                                        copy.deepcopy(t)
+                                                        copy.copy(t)
                                                     )
                                                 yield t
                                         elif enclitic == "'s":
@@ -383,7 +382,7 @@ class CachedTokenizer(Tokenizer):
                                             t.endchar = start_char + len(token)
                                             if mode == "index":
                                                 self._cache.append(
-                                                    copy.deepcopy(t)
+                                                    copy.copy(t)
                                                 )
                                             yield t
                                             t.text = "es"
@@ -397,7 +396,7 @@ class CachedTokenizer(Tokenizer):
                                             )
                                             if mode == "index":
                                                 self._cache.append(
-                                                    copy.deepcopy(t)
+                                                    copy.copy(t)
                                                 )
                                             yield t
                                         else:
@@ -408,7 +407,7 @@ class CachedTokenizer(Tokenizer):
                                             )
                                             if mode == "index":
                                                 self._cache.append(
-                                                    copy.deepcopy(t)
+                                                    copy.copy(t)
                                                 )
                                             yield t
                                             t.text = enclitic
@@ -422,7 +421,7 @@ class CachedTokenizer(Tokenizer):
                                             )
                                             if mode == "index":
                                                 self._cache.append(
-                                                    copy.deepcopy(t)
+                                                    copy.copy(t)
                                                 )
                                             yield t
                                         is_enclitic = True
@@ -435,7 +434,7 @@ class CachedTokenizer(Tokenizer):
                                         start_char + original_length - rdiff
                                     )
                                 if mode == "index":
-                                    self._cache.append(copy.deepcopy(t))
+                                    self._cache.append(copy.copy(t))
                                 yield t
                             start_char += original_length
                         start_char += 1
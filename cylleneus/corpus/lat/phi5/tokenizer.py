@@ -3,15 +3,14 @@ import re
 import string
 from collections import deque
 
-from cylleneus.engine.analysis.acore import CylleneusToken
+from cylleneus.engine.analysis.acore import CylleneusToken, replay
 from cylleneus.engine.analysis.tokenizers import Tokenizer
 from cylleneus.lang.lat import (
     PunktLatinCharsVars,
     compound,
     enclitics,
-    exceptions,
     jvmap,
-    proper_names,
+    lexicon,
     replacements,
     roman_to_arabic,
 )
@@ -27,7 +26,7 @@ class CachedTokenizer(Tokenizer):
 
     @property
     def cache(self):
-        return copy.deepcopy(self._cache)
+        return replay(self._cache)
 
     def __call__(
         self,
@@ -124,7 +123,7 @@ class CachedTokenizer(Tokenizer):
                                             temp_tokens[0]
                                                 .replace("j", "i")
                                                 .replace("v", "u")
-                                            not in proper_names.proper_names
+                                            not in lexicon.proper_names
                                         ):
                                             temp_tokens[0] = temp_tokens[
                                                 0
@@ -175,11 +174,11 @@ class CachedTokenizer(Tokenizer):
                                                     ix + 1, "&1"
                                                 )
                                             if "&" in token:
-                                                ppp = compound.is_ppp(
+                                                ppp = lexicon.is_ppp(
                                                     re.sub(r"[&\d]", "", token)
                                                 )
                                             else:
-                                                ppp = compound.is_ppp(token)
+                                                ppp = lexicon.is_ppp(token)
                                             if ppp:
                                                 if ix == len(temp_tokens) - 1:
                                                     if not buffer:
@@ -192,15 +191,15 @@ class CachedTokenizer(Tokenizer):
                                                         except StopIteration:
                                                             continue
                                                     if "&" in buffer[0][1][0]:
-                                                        copula = compound.is_copula(
+                                                        copula = lexicon.is_copula(
                                                             buffer[0][1][0][2:]
                                                         )
                                                     else:
-                                                        copula = compound.is_copula(
+                                                        copula = lexicon.is_copula(
                                                             buffer[0][1][0]
                                                         )
                                                 else:
-                                                    copula = compound.is_copula(
+                                                    copula = lexicon.is_copula(
                                                         temp_tokens[ix + 1]
                                                     )
 
@@ -357,10 +356,10 @@ class CachedTokenizer(Tokenizer):
                                     t.meta = meta
 
                                     if (
-                                        token not in exceptions
-                                        and token.lower() not in exceptions
+                                        token not in lexicon.exceptions
+                                        and token.lower() not in lexicon.exceptions
                                         and re.sub(r"\d&|&\d", "", token)
-                                        not in exceptions
+                                        not in lexicon.exceptions
                                     ):
                                         if token in replacements:  # t.original
                                             for subtoken in replacements[
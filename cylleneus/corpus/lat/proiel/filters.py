@@ -2,7 +2,9 @@ import copy
 import re
 
 from cylleneus.corpus.lat.perseus import mapping
-from cylleneus.engine.analysis.filters import Filter
+from cylleneus.engine.analysis.acore import replay
+from cylleneus.engine.analysis.filters import Filter, LWN_BACKEND
+from cylleneus.engine.analysis.lookups import bulk_lemmas
 from cylleneus.lang.morpho import leipzig2wn
 from latinwordnet import LatinWordNet
 from latinwordnet.latinwordnet import relation_types
@@ -11,6 +13,7 @@ from .core import relations
 
 class CachedLemmaFilter(Filter):
     is_morph = True
+    backend = None
 
     def __init__(self, cached=True, **kwargs):
         super(CachedLemmaFilter, self).__init__()
@@ -21,7 +24,7 @@ class CachedLemmaFilter(Filter):
 
     @property
     def cache(self):
-        return copy.deepcopy(self._cache)
+        return replay(self._cache)
 
     def __eq__(self, other):
         return (
@@ -43,6 +46,7 @@ class CachedLemmaFilter(Filter):
             LWN = LatinWordNet()
 
             jvmap = str.maketrans("jv", "iu", "")
+            pending = []
             for t in tokens:
                 if t.mode == "index":
                     morpho = t.morpho
@@ -50,25 +54,10 @@ class CachedLemmaFilter(Filter):
                         lemma = t.lemma
                         kwargs = mapping[lemma.replace("#", "")] if "#" in lemma else None
                         if kwargs:
-                            results = LWN.lemmas_by_uri(kwargs["uri"]).get()
+                            key = (None, None, kwargs["uri"])
                         else:
-                            results = LWN.lemmas(lemma, morpho[0]).get()
-                        if results:
-                            for result in results:
-                                morpho = morpho[:-2] + result["morpho"][-2:]
-                                if (
-                                    morpho[5] == "p"
-                                    and result["morpho"][5] == "d"
-                                ):
-                                    morpho = morpho[:5] + "d" + morpho[6:]
-                                t.morpho = f"{result['morpho']}::{result['uri']}:0>{morpho}"
-                                t.text = (
-                                    f"{result['lemma']}:"
-                                    f"{result['uri']}={result['morpho']}"
-                                )
-                                if self.cached:
-                                    self._cache.append(copy.copy(t))
-                                yield t
+                            key = (lemma, morpho[0], None)
+                        pending.append((key, copy.copy(t)))
                 elif t.mode == "query":
                     # Lexical relation
                     if "::" in t.text:
@@ -173,6 +162,24 @@ class CachedLemmaFilter(Filter):
                                         yield t
                                 else:
                                     yield t
+            if pending:
+                results = bulk_lemmas(
+                    [key for key, t in pending], self.backend or LWN_BACKEND
+                )
+                for key, t in pending:
+                    morpho = t.morpho
+                    for result in results[key] or []:
+                        morpho = morpho[:-2] + result["morpho"][-2:]
+                        if morpho[5] == "p" and result["morpho"][5] == "d":
+                            morpho = morpho[:5] + "d" + morpho[6:]
+                        t.morpho = f"{result['morpho']}::{result['uri']}:0>{morpho}"
+                        t.text = (
+                            f"{result['lemma']}:"
+                            f"{result['uri']}={result['morpho']}"
+                        )
+                        if self.cached:
+                            self._cache.append(copy.copy(t))
+                        yield t
 
 
 class MorphosyntaxFilter(Filter):
@@ -2,7 +2,7 @@ import copy
 import re
 
 from cylleneus.engine.analysis.tokenizers import Tokenizer
-from cylleneus.engine.analysis.acore import CylleneusToken
+from cylleneus.engine.analysis.acore import CylleneusToken, replay
 from cylleneus.lang.lat import editorial, jvmap
 from .core import proiel2wn
 
@@ -17,7 +17,7 @@ class CachedTokenizer(Tokenizer):
 
     @property
     def cache(self):
-        return copy.deepcopy(self._cache)
+        return replay(self._cache)
 
     def __call__(
         self,
@@ -112,11 +112,11 @@ class CachedTokenizer(Tokenizer):
                                 t.endchar = (
                                     start_char + len(before) + original_len
                                 )
-                            self._cache.append(copy.deepcopy(t))
+                            self._cache.append(copy.copy(t))
                             yield t
 
                             if form in editorial:
                                 t.text = editorial[form]
-                                self._cache.append(copy.deepcopy(t))
+                                self._cache.append(copy.copy(t))
                                 yield t
                             start_char += len(before) + len(form) + len(after)
@@ -1,8 +1,12 @@
 from collections import namedtuple
+from collections.abc import Mapping
+import codecs
 import importlib
-import pkgutil
+import json
+import threading
+from pathlib import Path
 
-from . import default, __path__
+from . import __path__
 
 CorpusMeta = namedtuple(
     "CorpusMeta",
@@ -15,31 +19,77 @@ CorpusMeta = namedtuple(
         "glob",
         "fetch",
         "repo",
+        "spans",
     ],
+    defaults=(None,),
 )
 
-manifest = {
-    "default": CorpusMeta(
-        default.description,
-        default.language,
-        default.DocumentSchema,
-        default.Tokenizer,
-        default.Preprocessor,
-        default.glob,
-        default.fetch,
-        default.repo,
-    )
-}
-
-for l_finder, l_name, l_is_pkg in pkgutil.walk_packages(
-    __path__, "cylleneus.corpus."
-):
-    if l_is_pkg:
-        l_pkg = importlib.import_module(l_name)
-        for c_finder, c_name, c_is_pkg in pkgutil.walk_packages(
-            l_pkg.__path__, l_pkg.__name__ + "."
-        ):
-            if c_is_pkg:
-                c_pkg = importlib.import_module(c_name)
-                if hasattr(c_pkg, "meta"):
-                    manifest[c_name.split(".")[-1]] = c_pkg.meta
+# What is known of a corpus without importing it, from its corpus.json
+CorpusDescriptor = namedtuple(
+    "CorpusDescriptor",
+    ["name", "module", "description", "language", "glob", "repo"],
+)
+
+
+def _descriptor(name: str, module: str, path: Path):
+    with codecs.open(path, "r", "utf8") as fp:
+        return CorpusDescriptor(name, module, **json.load(fp))
+
+
+class Registry(Mapping):
+    """The corpora available, by name. Corpora are discovered from the
+    descriptor (``corpus.json``) beside each corpus package, and the package,
+    with its tables, is only imported when its meta is first looked up."""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.descriptors = {
+            "default": _descriptor(
+                "default", "cylleneus.corpus.default", self.path / "default.json"
+            )
+        }
+        for file in sorted(self.path.glob("*/*/corpus.json")):
+            name = file.parent.name
+            module = f"cylleneus.corpus.{file.parent.parent.name}.{name}"
+            self.descriptors[name] = _descriptor(name, module, file)
+
+        self._metas = {}
+        self._lock = threading.RLock()
+
+    def __getitem__(self, name: str):
+        if name not in self.descriptors:
+            raise KeyError(name)
+        with self._lock:
+            if name not in self._metas:
+                module = importlib.import_module(self.descriptors[name].module)
+                if name == "default":
+                    self._metas[name] = CorpusMeta(
+                        module.description,
+                        module.language,
+                        module.DocumentSchema,
+                        module.Tokenizer,
+                        module.Preprocessor,
+                        module.glob,
+                        module.fetch,
+                        module.repo,
+                    )
+                else:
+                    self._metas[name] = module.meta
+            return self._metas[name]
+
+    def __contains__(self, name):
+        return name in self.descriptors
+
+    def __iter__(self):
+        return iter(self.descriptors)
+
+    def __len__(self):
+        return len(self.descriptors)
+
+    def loaded(self, name: str):
+        """Whether the corpus has been imported."""
+
+        return name in self._metas
+
+
+manifest = Registry(__path__[0])
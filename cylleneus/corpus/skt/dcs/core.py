@@ -2,6 +2,8 @@ import codecs
 import json
 from pathlib import Path
 
+from cylleneus.corpus.texts import lines, texts
+
 dir = Path(__file__).parent
 
 # Description
@@ -21,6 +23,35 @@ repo = {
 }
 
 
+# Parse text into its chapters and lines
+def parse(value: bytes):
+    chapter = None
+    text_line_id = None
+    text_lines = []
+    text_line = None
+    for line in lines(value):
+        if line.startswith("## chapter: "):
+            chapter = line.split("## chapter: ")[1].strip()
+        elif line.startswith("# text_line: "):
+            text_line = line.split("# text_line: ")[1].strip()
+        elif line.startswith("# text_line_id: "):
+            text_line_id = line.split("# text_line_id: ")[1].strip()
+        elif line.startswith("# text_line_counter: "):
+            if text_line is not None:
+                text_line_counter = line.split("# text_line_counter: ")[
+                    1
+                ].strip()
+                text_lines.append(
+                    (
+                        chapter,
+                        text_line_id,
+                        text_line_counter,
+                        text_line.split(),
+                    )
+                )
+    return text_lines
+
+
 # Fetch text
 def fetch(work, meta, fragment):
     _, file = work.filename[0]
@@ -50,33 +81,7 @@ def fetch(work, meta, fragment):
     )
 
     # Collect text and context
-    with codecs.open(path, "r", "utf8") as fp:
-        lines = fp.readlines()
-
-    chapter = None
-    text_line_id = None
-    text_lines = []
-    text_line = None
-    for line in lines:
-        if line.startswith("## chapter: "):
-            chapter = line.split("## chapter: ")[1].strip()
-        elif line.startswith("# text_line: "):
-            text_line = line.split("# text_line: ")[1].strip()
-        elif line.startswith("# text_line_id: "):
-            text_line_id = line.split("# text_line_id: ")[1].strip()
-        elif line.startswith("# text_line_counter: "):
-            if text_line is not None:
-                text_line_counter = line.split("# text_line_counter: ")[
-                    1
-                ].strip()
-                text_lines.append(
-                    (
-                        chapter,
-                        text_line_id,
-                        text_line_counter,
-                        text_line.split(),
-                    )
-                )
+    text_lines = texts.load(work.corpus.name, path, parse)
 
     hlites = [
         (hlite["chapter"], hlite["line"], hlite["sent_pos"])
@@ -4,6 +4,7 @@ import re
 from multiwordnet.wordnet import WordNet
 from sanskritwordnet import SanskritWordNet, relation_types
 
+from cylleneus.engine.analysis.acore import replay
 from cylleneus.engine.analysis.filters import Filter
 from cylleneus.lang import iso_639
 from cylleneus.lang.morpho import Morph, leipzig2wn
@@ -61,7 +62,7 @@ class CachedLemmaFilter(Filter):
 
     @property
     def cache(self):
-        return copy.deepcopy(self._cache)
+        return replay(self._cache)
 
     def __eq__(self, other):
         return (
@@ -240,7 +241,7 @@ class CachedSynsetFilter(Filter):
 
     @property
     def cache(self):
-        return copy.deepcopy(self._cache)
+        return replay(self._cache)
 
     def __eq__(self, other):
         return (
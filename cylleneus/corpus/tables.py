@@ -0,0 +1,239 @@
+"""Read-only lookup tables compiled from the large literal tables of corpus
+metadata (author and file tables, lemma mappings), so that they need not be
+parsed and held in memory by every process that uses them.
+
+Each table is compiled once from the module that defines it into a file in
+the cache, which is memory-mapped when the table is first used, and so shared
+by every process through the page cache. The file holds a hash index of the
+keys of the table and the value of each key, encoded as JSON, so that a value
+is only decoded when it is looked up. Tables are recompiled whenever the
+module they are compiled from changes."""
+
+import importlib
+import importlib.util
+import json
+import mmap
+import os
+import struct
+import threading
+import zlib
+from array import array
+from collections.abc import Mapping
+from pathlib import Path
+
+from cylleneus import settings
+from cylleneus.utils import Debug, LRUCache
+
+CACHE_DIR = Path(settings.CACHE_DIR) / "tables"
+
+# Tables compiled by `build`, as modules and names
+SOURCES = [
+    ("cylleneus.corpus.grk.tlg_tables", "AUTHOR_TAB"),
+    ("cylleneus.corpus.lat.lasla.tables", "lexicon"),
+    ("cylleneus.corpus.lat.lasla.tables", "mapping"),
+    ("cylleneus.corpus.lat.lasla.tables", "AUTHOR_TAB"),
+    ("cylleneus.corpus.lat.lasla.tables", "FILE_TAB"),
+    ("cylleneus.corpus.lat.latin_library.tables", "FILE_TAB"),
+    ("cylleneus.corpus.lat.latin_library.tables", "AUTHOR_TAB"),
+    ("cylleneus.corpus.lat.phi5.tables", "AUTHOR_TAB"),
+]
+
+# Magic, number of keys, number of slots, size and mtime of the source
+HEADER = struct.Struct("=8sQQqq")
+MAGIC = b"CYLTAB01"
+
+
+def write(path: Path, table: dict, version: tuple = (0, 0)):
+    """Compiles a table, whose keys must be strings and whose values must be
+    encodable as JSON, into a file."""
+
+    keys = [key.encode("utf8") for key in table]
+    values = [
+        json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode(
+            "utf8"
+        )
+        for value in table.values()
+    ]
+
+    # Open addressing, with at least twice as many slots as keys
+    nslots = 8
+    while nslots < 2 * len(keys):
+        nslots *= 2
+    slots = array("I", [0] * nslots)
+    for i, key in enumerate(keys):
+        slot = zlib.crc32(key) & (nslots - 1)
+        while slots[slot]:
+            slot = (slot + 1) & (nslots - 1)
+        slots[slot] = i + 1
+
+    # Each record holds the offsets of the start of its key, and the start and
+    # end of its value, which follows the key
+    records = array("Q")
+    offset = HEADER.size + slots.itemsize * nslots + 3 * 8 * len(keys)
+    for key, value in zip(keys, values):
+        records.extend([offset, offset + len(key), offset + len(key) + len(value)])
+        offset += len(key) + len(value)
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(f".{os.getpid()}.tmp")
+    with open(tmp, "wb") as fp:
+        fp.write(HEADER.pack(MAGIC, len(keys), nslots, *version))
+        slots.tofile(fp)
+        records.tofile(fp)
+        for key, value in zip(keys, values):
+            fp.write(key)
+            fp.write(value)
+    os.replace(tmp, path)
+
+
+class Table(Mapping):
+    """A read-only mapping compiled from the table ``name`` in ``module``,
+    which is only imported to compile it. Values are decoded when looked up,
+    and the most recently used are kept decoded; they are shared, so they must
+    not be modified."""
+
+    def __init__(self, module: str, name: str, path: Path = None, cache: int = 1024):
+        self.module = module
+        self.name = name
+        self.path = (
+            Path(path) if path else CACHE_DIR / f"{module}.{name}.tab"
+        )
+        self._cache = LRUCache(cache)
+        self._lock = threading.Lock()
+        self._mmap = None
+        self._table = None
+
+    def __reduce__(self):
+        return Table, (self.module, self.name, self.path, self._cache.maxsize)
+
+    @property
+    def source(self):
+        return Path(importlib.util.find_spec(self.module).origin)
+
+    def version(self):
+        stat = self.source.stat()
+        return stat.st_size, stat.st_mtime_ns
+
+    def load(self):
+        """Imports the table from its module."""
+
+        return getattr(importlib.import_module(self.module), self.name)
+
+    def build(self):
+        """Compiles the table from its module."""
+
+        version = self.version()
+        write(self.path, self.load(), version)
+        Debug.print(Debug.MEDIUM, f"- Compiled table: {self.module}.{self.name}")
+
+    def _open(self):
+        with self._lock:
+            if self._mmap is not None or self._table is not None:
+                return
+            try:
+                if not self._map():
+                    self.build()
+                    if not self._map():
+                        raise OSError(f"invalid table: {self.path}")
+            except OSError as e:
+                # Fall back on the table itself
+                Debug.print(Debug.MEDIUM, f"- Could not compile table: {e}")
+                self._table = self.load()
+
+    def _map(self):
+        try:
+            with open(self.path, "rb") as fp:
+                mm = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            return False
+        if len(mm) < HEADER.size:
+            mm.close()
+            return False
+        magic, nkeys, nslots, *version = HEADER.unpack_from(mm)
+        if magic != MAGIC or tuple(version) != self.version():
+            mm.close()
+            return False
+
+        start = HEADER.size
+        end = start + 4 * nslots
+        self._slots = memoryview(mm)[start:end].cast("I")
+        self._records = memoryview(mm)[end: end + 3 * 8 * nkeys].cast("Q")
+        self._nkeys = nkeys
+        self._mmap = mm
+        return True
+
+    def _find(self, key):
+        # The record of a key, or None
+        if not isinstance(key, str):
+            return None
+        key = key.encode("utf8")
+        mask = len(self._slots) - 1
+        slot = zlib.crc32(key) & mask
+        while self._slots[slot]:
+            i = self._slots[slot] - 1
+            start, end = self._records[3 * i], self._records[3 * i + 1]
+            if self._mmap[start:end] == key:
+                return i
+            slot = (slot + 1) & mask
+        return None
+
+    def __getitem__(self, key):
+        self._open()
+        if self._table is not None:
+            return self._table[key]
+
+        value = self._cache.get(key)
+        if value is None:
+            i = self._find(key)
+            if i is None:
+                raise KeyError(key)
+            start, end = self._records[3 * i + 1], self._records[3 * i + 2]
+            value = json.loads(self._mmap[start:end].decode("utf8"))
+            self._cache[key] = value
+        return value
+
+    def __contains__(self, key):
+        self._open()
+        if self._table is not None:
+            return key in self._table
+        return key in self._cache or self._find(key) is not None
+
+    def __iter__(self):
+        self._open()
+        if self._table is not None:
+            yield from self._table
+        else:
+            for i in range(self._nkeys):
+                start, end = self._records[3 * i], self._records[3 * i + 1]
+                yield self._mmap[start:end].decode("utf8")
+
+    def __len__(self):
+        self._open()
+        if self._table is not None:
+            return len(self._table)
+        return self._nkeys
+
+    def close(self):
+        with self._lock:
+            if self._mmap is not None:
+                self._slots.release()
+                self._records.release()
+                self._mmap.close()
+                self._mmap = None
+            self._table = None
+            self._cache.clear()
+
+
+def build(sources: list = None):
+    """Compiles the tables of corpus metadata that are missing or out of
+    date, and returns the tables."""
+
+    tables = []
+    for module, name in sources or SOURCES:
+        table = Table(module, name)
+        if not table._map():
+            table.build()
+        table.close()
+        tables.append(table)
+    return tables
@@ -0,0 +1,170 @@
+"""Parsed source texts, shared by the hits rendered from each work."""
+
+import codecs
+import mmap
+from array import array
+from pathlib import Path
+
+import lxml.etree as et
+
+from cylleneus import settings
+from cylleneus.utils import Debug, LRUCache
+
+
+class TextCache:
+    """Keeps the most recently used source texts in memory once parsed, keyed
+    by corpus, filename and modification time, so that rendering every hit
+    in a work costs a single parse. The cache is bounded by the total size of
+    the source files, in bytes."""
+
+    def __init__(self, maxsize: int = settings.TEXT_CACHE_SIZE * 1024 * 1024):
+        self._texts = LRUCache(maxsize, sizeof=lambda item: item[0])
+
+    def load(self, corpus: str, path: Path, parse):
+        """Returns the text at ``path`` as parsed by ``parse``, which is called
+        with the contents of the file as bytes. Parsed texts are shared, so
+        they must not be modified."""
+
+        stat = Path(path).stat()
+        key = (corpus, str(path), stat.st_mtime_ns)
+        item = self._texts.get(key)
+        if item is None:
+            with codecs.open(path, "rb") as fp:
+                value = fp.read()
+            item = (stat.st_size, parse(value))
+            self._texts[key] = item
+            Debug.print(Debug.HIGH, f"- Parsed '{corpus}' text: {path}")
+        return item[1]
+
+    def clear(self):
+        self._texts.clear()
+
+
+def xml(value: bytes):
+    parser = et.XMLParser(encoding="utf-8")
+    return et.XML(value, parser=parser)
+
+
+def lines(value: bytes):
+    # Split as line_spans does, so that lines are numbered alike
+    return [line.decode("utf8") for line in value.splitlines(keepends=True)]
+
+
+# Texts shared by the process
+texts = TextCache()
+
+
+class Spans:
+    """The byte offsets of the numbered spans of a source text (its lines or
+    sentences, say), read from a sidecar file written beside the work's index
+    when the text was indexed. The sidecar holds the size and modification
+    time of the source it was written for, then a start and end offset for
+    each number, as native 64-bit integers, and is memory-mapped, so that a
+    span can be read from the source without parsing the whole text."""
+
+    HEADER = 2
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._fp = open(self.path, "rb")
+        if self.path.stat().st_size:
+            self._mmap = mmap.mmap(
+                self._fp.fileno(), 0, access=mmap.ACCESS_READ
+            )
+            self._view = memoryview(self._mmap).cast("Q")
+        else:
+            self._mmap = None
+            self._view = memoryview(array("Q"))
+        self.source = tuple(self._view[:self.HEADER])
+        self._offsets = self._view[self.HEADER:]
+
+    def is_current(self, source: Path):
+        """Returns True if the sidecar was written for ``source`` as it is
+        now, that is, if its size and modification time are unchanged."""
+
+        try:
+            stat = Path(source).stat()
+        except OSError:
+            return False
+        return self.source == (stat.st_size, stat.st_mtime_ns)
+
+    def __len__(self):
+        return len(self._offsets) // 2
+
+    def get(self, key: int):
+        """Returns the start and end offsets of a span, or None if there is
+        no such span."""
+
+        if 0 <= key < len(self):
+            start, end = self._offsets[2 * key], self._offsets[2 * key + 1]
+            if end > start:
+                return start, end
+
+    def read(self, source: Path, first: int, last: int = None):
+        """Returns the bytes of the source text from the start of span
+        ``first`` to the end of span ``last``, or None if either is
+        missing."""
+
+        start = self.get(first)
+        end = self.get(first if last is None else last)
+        if start is None or end is None:
+            return None
+        with open(source, "rb") as fp:
+            with mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return mm[start[0]: end[1]]
+
+    def close(self):
+        self._offsets.release()
+        self._view.release()
+        if self._mmap is not None:
+            self._mmap.close()
+        self._fp.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    @staticmethod
+    def write(path: Path, spans: dict, source: Path):
+        """Writes a sidecar for a mapping of span numbers to start and end
+        offsets in ``source``."""
+
+        stat = Path(source).stat()
+        offsets = array("Q", [0, 0] * (max(spans, default=-1) + 1))
+        for key, (start, end) in spans.items():
+            offsets[2 * key], offsets[2 * key + 1] = start, end
+        with open(path, "wb") as fp:
+            array("Q", [stat.st_size, stat.st_mtime_ns]).tofile(fp)
+            offsets.tofile(fp)
+
+
+def spans_for(work):
+    """Opens the spans sidecar of a work, or returns None if it has none or
+    if its source text has changed since it was written."""
+
+    if not work.docix:
+        return None
+    location = work.corpus.docs.location(work.docix[0])
+    if location is not None:
+        path, indexname, _ = location
+        sidecar = path / f"{indexname}.spans"
+        if sidecar.exists():
+            _, file = work.filename[0]
+            spans = Spans(sidecar)
+            if spans.is_current(work.corpus.text_dir / file):
+                return spans
+            spans.close()
+            Debug.print(Debug.HIGH, f"- Stale spans: {sidecar}")
+
+
+def line_spans(value: bytes):
+    """Returns the spans of the lines of a text, numbered from 0."""
+
+    spans = {}
+    start = 0
+    for i, line in enumerate(value.splitlines(keepends=True)):
+        spans[i] = (start, start + len(line))
+        start += len(line)
+    return spans
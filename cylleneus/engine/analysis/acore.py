@@ -44,6 +44,16 @@ def unstopped(tokenstream):
     return (t for t in tokenstream if not t.stopped)
 
 
+def replay(tokens):
+    """Yields fresh copies of a document's cached tokens, so that the output of
+    a tokenizer or filter, computed once per document, can be shared by the
+    analyzers of every field. Filters only ever reassign token attributes, so
+    a shallow copy of each token suffices.
+    """
+    for t in tokens:
+        yield t.copy()
+
+
 def entoken(
     textstream,
     positions=False,
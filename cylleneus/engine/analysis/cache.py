@@ -0,0 +1,254 @@
+"""Persistent key/value caches for expensive analysis lookups."""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+from cylleneus.utils import Debug
+
+
+class PersistentCache:
+    """A size-bounded, on-disk cache of JSON-serializable values, backed by
+    SQLite so that it can be shared between documents, indexing runs and
+    processes.
+
+    The most recently used entries are loaded into memory when the cache is
+    first opened (warm start). When the number of entries exceeds ``maxsize``,
+    the least recently used entries are evicted down to ``lowater`` of
+    ``maxsize``.
+
+    The database connection is opened lazily and re-opened after a fork, so
+    instances can be created at import time and used by worker processes.
+    """
+
+    def __init__(
+        self,
+        path,
+        maxsize: int = 1000000,
+        warm: int = 100000,
+        lowater: float = 0.9,
+        sync_every: int = 1000,
+    ):
+        """
+        :param path: the SQLite database file.
+        :param maxsize: the maximum number of entries kept on disk.
+        :param warm: the number of most recently used entries to preload into
+            memory when the cache is opened.
+        :param lowater: the fraction of ``maxsize`` to evict down to.
+        :param sync_every: the number of pending writes after which they are
+            committed to disk.
+        """
+
+        self.path = Path(path)
+        self.maxsize = maxsize
+        self.warm = warm
+        self.lowater = lowater
+        self.sync_every = sync_every
+
+        self._lock = threading.RLock()
+        self._conn = None
+        self._pid = None
+        self._memory = {}
+        self._pending = {}
+        self._touched = {}
+        self._count = 0
+        self._nbytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def __getstate__(self):
+        return {
+            "path":       self.path,
+            "maxsize":    self.maxsize,
+            "warm":       self.warm,
+            "lowater":    self.lowater,
+            "sync_every": self.sync_every,
+        }
+
+    def __setstate__(self, state):
+        self.__init__(**state)
+
+    @property
+    def conn(self):
+        if self._conn is None or self._pid != os.getpid():
+            self._open()
+        return self._conn
+
+    def _open(self):
+        with self._lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(
+                str(self.path), timeout=60, check_same_thread=False
+            )
+            self._pid = os.getpid()
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache ("
+                "key TEXT PRIMARY KEY, "
+                "value TEXT NOT NULL, "
+                "size INTEGER NOT NULL, "
+                "atime REAL NOT NULL)"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS cache_atime ON cache (atime)"
+            )
+            self._conn.commit()
+
+            self._memory = {}
+            self._pending = {}
+            self._touched = {}
+            self._count, self._nbytes = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM cache"
+            ).fetchone()
+
+            if self.warm:
+                for key, value in self._conn.execute(
+                    "SELECT key, value FROM cache ORDER BY atime DESC LIMIT ?",
+                    (self.warm,),
+                ):
+                    self._memory[key] = json.loads(value)
+            Debug.print(
+                Debug.MEDIUM,
+                f"- Opened cache {self.path}: {self._count} entries, "
+                f"{len(self._memory)} preloaded",
+            )
+
+    def get(self, key, default=None):
+        with self._lock:
+            conn = self.conn
+            if key in self._memory:
+                self.hits += 1
+                self._touched[key] = time.time()
+                return self._memory[key]
+
+            row = conn.execute(
+                "SELECT value FROM cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return default
+
+            self.hits += 1
+            value = json.loads(row[0])
+            self._memory[key] = value
+            self._touched[key] = time.time()
+            return value
+
+    def set(self, key, value):
+        with self._lock:
+            _ = self.conn
+            self._memory[key] = value
+            self._pending[key] = json.dumps(value, ensure_ascii=False)
+            if len(self._pending) >= self.sync_every:
+                self.flush()
+
+    def __getitem__(self, key):
+        value = self.get(key, KeyError)
+        if value is KeyError:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key, value):
+        self.set(key, value)
+
+    def __contains__(self, key):
+        return self.get(key, KeyError) is not KeyError
+
+    def __len__(self):
+        with self._lock:
+            _ = self.conn
+            return self._count + len(self._pending)
+
+    @property
+    def nbytes(self):
+        """The approximate number of bytes of serialized values on disk."""
+
+        with self._lock:
+            _ = self.conn
+            return self._nbytes + sum(
+                len(value.encode("utf8")) for value in self._pending.values()
+            )
+
+    def flush(self):
+        """Commits pending writes and access times, then evicts the least
+        recently used entries if the cache has grown too large."""
+
+        with self._lock:
+            if self._conn is None or self._pid != os.getpid():
+                return
+            conn = self._conn
+            now = time.time()
+            if self._pending:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO cache (key, value, size, atime) "
+                    "VALUES (?, ?, ?, ?)",
+                    [
+                        (key, value, len(value.encode("utf8")), now)
+                        for key, value in self._pending.items()
+                    ],
+                )
+            if self._touched:
+                conn.executemany(
+                    "UPDATE cache SET atime = ? WHERE key = ?",
+                    [(atime, key) for key, atime in self._touched.items()],
+                )
+            conn.commit()
+            self._pending = {}
+            self._touched = {}
+            self._count, self._nbytes = conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM cache"
+            ).fetchone()
+
+            if self.maxsize and self._count > self.maxsize:
+                self.evict(self._count - int(self.maxsize * self.lowater))
+
+    def evict(self, n: int):
+        """Removes the ``n`` least recently used entries."""
+
+        with self._lock:
+            conn = self.conn
+            keys = [
+                key
+                for key, in conn.execute(
+                    "SELECT key FROM cache ORDER BY atime ASC, rowid ASC LIMIT ?",
+                    (n,),
+                )
+            ]
+            conn.executemany(
+                "DELETE FROM cache WHERE key = ?", [(key,) for key in keys]
+            )
+            conn.commit()
+            for key in keys:
+                self._memory.pop(key, None)
+            self._count, self._nbytes = conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM cache"
+            ).fetchone()
+            Debug.print(
+                Debug.MEDIUM, f"- Evicted {len(keys)} entries from {self.path}"
+            )
+
+    def clear(self):
+        with self._lock:
+            conn = self.conn
+            conn.execute("DELETE FROM cache")
+            conn.commit()
+            self._memory = {}
+            self._pending = {}
+            self._touched = {}
+            self._count = self._nbytes = 0
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None and self._pid == os.getpid():
+                self.flush()
+                self._conn.close()
+            self._conn = None
+            self._pid = None
+            self._memory = {}
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(path={str(self.path)!r}, maxsize={self.maxsize})"
@@ -27,11 +27,16 @@
 # those of the authors and should not be interpreted as representing official
 # policies, either expressed or implied, of Matt Chaput.
 
+import atexit
 import copy
 import re
 from itertools import chain
+from pathlib import Path
 
-from cylleneus.engine.analysis.acore import Composable
+from cylleneus import settings
+from cylleneus.engine.analysis.acore import Composable, replay
+from cylleneus.engine.analysis.cache import PersistentCache
+from cylleneus.engine.analysis.lookups import WordNetBackend, bulk_synsets
 from cylleneus.lang import iso_639
 from cylleneus.lang.morpho import leipzig2wn
 
@@ -42,6 +47,35 @@ from whoosh.util.text import rcompile
 
 LWN = LatinWordNet()
 
+# Form -> lemmatization results, shared across documents and processes
+LEMMA_CACHE = PersistentCache(
+    Path(settings.CACHE_DIR) / "lemmata.db",
+    maxsize=settings.LEMMA_CACHE_SIZE,
+    warm=settings.LEMMA_CACHE_WARM,
+)
+atexit.register(LEMMA_CACHE.flush)
+
+# Default backend for bulk synset lookups at index time
+LWN_BACKEND = WordNetBackend(LWN)
+
+
+def lemmatize(form: str):
+    """Lemmatize a word form with the Latin WordNet, consulting the persistent
+    lemma cache first."""
+
+    if not settings.LEMMA_CACHE:
+        return LWN.lemmatize(form)
+
+    results = LEMMA_CACHE.get(form)
+    if results is None:
+        results = LWN.lemmatize(form)
+        # A failed request is indistinguishable from a form without lemmas,
+        # so only lemmas found are kept across runs
+        if results:
+            LEMMA_CACHE[form] = results
+    return results
+
+
 # Default list of stop words (words so common it's usually wasteful to index
 # them). This list is used by the StopFilter class, which allows you to supply
 # an optional list to override this one.
@@ -563,7 +597,7 @@ class CachedLemmaFilter(Filter):
 
     @property
     def cache(self):
-        return copy.deepcopy(self._cache)
+        return replay(self._cache)
 
     def __eq__(self, other):
         return (
@@ -582,11 +616,13 @@ class CachedLemmaFilter(Filter):
             self._cache = []
             self._docix = kwargs.get("docix", None)
 
+            mode = None
             for t in tokens:
+                mode = t.mode
                 if t.mode == "index":
                     if t.text:
                         text = t.text
-                        results = LWN.lemmatize(text)
+                        results = lemmatize(text)
                         if results:
                             for i, lemma in enumerate(results):
                                 t.morpho = (
@@ -697,6 +733,10 @@ class CachedLemmaFilter(Filter):
                                         t.text = f"{result['lemma']}:{result['uri']}={result['morpho']}"
                                         yield t
 
+            # Persist newly lemmatized forms once the document is done
+            if mode == "index" and settings.LEMMA_CACHE:
+                LEMMA_CACHE.flush()
+
 
 class AnnotationFilter(Filter):
     is_morph = True
@@ -740,7 +780,7 @@ class AnnotationFilter(Filter):
                     for i, v in enumerate(annotation):
                         if v != "-":
                             text = f"{'-' * i}{v}{'-' * (9 - i)}"
-                            t.text = f"{text}::([\w\d$]+):(\d+):(\d+)$"
+                            t.text = f"{text}::{annotation}"
                             yield t
 
 
@@ -787,7 +827,12 @@ class SemfieldFilter(Filter):
 
 
 class CachedSynsetFilter(Filter):
+    """Expands lemma tokens to their synsets. In index mode, the distinct
+    lemmas of a document are resolved together through ``backend`` (by
+    default, the Latin WordNet) before the expanded tokens are streamed."""
+
     is_morph = True
+    backend = None
 
     def __init__(self, **kwargs):
         super(CachedSynsetFilter, self).__init__()
@@ -798,7 +843,7 @@ class CachedSynsetFilter(Filter):
 
     @property
     def cache(self):
-        return copy.deepcopy(self._cache)
+        return replay(self._cache)
 
     def __eq__(self, other):
         return (
@@ -810,6 +855,38 @@ class CachedSynsetFilter(Filter):
     def __ne__(self, other):
         return not self == other
 
+    def _expand(self, tokens):
+        keys = [
+            re.search(r"(\w+)(?::([A-z0-9]+))?(?:=(.+))?", t.text).groups()
+            if t.text
+            else None
+            for t in tokens
+        ]
+        results = bulk_synsets(
+            [key for key in keys if key], self.backend or LWN_BACKEND
+        )
+
+        for t, key in zip(tokens, keys):
+            if key:
+                for result in results[key]:
+                    for synset in chain(
+                        result["synsets"]["literal"],
+                        result["synsets"]["metonymic"],
+                        result["synsets"]["metaphoric"],
+                    ):
+                        t.code = " ".join(
+                            [semfield["code"] for semfield in synset["semfield"]]
+                        )  ## kludgy
+                        t.text = f"{synset['pos']}#{synset['offset']}"
+                        if self.cached:
+                            self._cache.append(copy.copy(t))
+                        yield t
+                t.code = ""
+                t.text = ""
+            if self.cached:
+                self._cache.append(copy.copy(t))
+            yield t
+
     def __call__(self, tokens, **kwargs):
         if kwargs.get("docix", None) == self._docix and self._cache:
             yield from self.cache
@@ -817,51 +894,10 @@ class CachedSynsetFilter(Filter):
             self._cache = []
             self._docix = kwargs.get("docix", None)
 
+            pending = []
             for t in tokens:
                 if t.mode == "index":
-                    text = t.text
-                    if text:
-                        keys = ["lemma", "uri", "morpho"]
-                        kwargs = {
-                            k: v
-                            for k, v in zip(
-                                keys,
-                                re.search(
-                                    r"(\w+)(?::([A-z0-9]+))?(?:=(.+))?", text
-                                ).groups(),
-                            )
-                        }
-                        if kwargs["uri"] is not None:
-                            results = LWN.lemmas_by_uri(kwargs["uri"]).synsets
-                        else:
-                            kwargs.pop("uri")
-                            results = LWN.lemmas(**kwargs).synsets
-                        for result in results:
-                            for synset in chain(
-                                result["synsets"]["literal"],
-                                result["synsets"]["metonymic"],
-                                result["synsets"]["metaphoric"],
-                            ):
-                                t.code = " ".join(
-                                    [
-                                        semfield["code"]
-                                        for semfield in synset["semfield"]
-                                    ]
-                                )  ## kludgy
-                                t.text = f"{synset['pos']}#{synset['offset']}"
-                                if self.cached:
-                                    self._cache.append(copy.copy(t))
-                                yield t
-                        else:
-                            t.code = ""
-                            t.text = ""
-                            if self.cached:
-                                self._cache.append(copy.copy(t))
-                            yield t
-                    else:
-                        if self.cached:
-                            self._cache.append(copy.copy(t))
-                        yield t
+                    pending.append(copy.copy(t))
                 elif t.mode == "query":
                     if hasattr(t, "language"):
                         language = t.language
@@ -912,6 +948,8 @@ class CachedSynsetFilter(Filter):
                                 yield t
                     else:
                         yield t
+            if pending:
+                yield from self._expand(pending)
 
 
 class CaseFilter(Filter):
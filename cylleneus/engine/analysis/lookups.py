@@ -0,0 +1,130 @@
+"""Bulk lemma and synset lookups for index-time analysis.
+
+Lemma and synset filters collect the distinct lookups required by a document
+and resolve them together through a backend, rather than querying the WordNet
+once per token.
+
+Lemma lookups are keyed by ``(lemma, pos, uri)`` and synset lookups by
+``(lemma, uri, morpho)``; unused elements are ``None``. A lookup by URI takes
+precedence over one by lemma.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+from cylleneus import settings
+from cylleneus.utils import Debug
+
+
+def chunks(items: list, size: int):
+    for i in range(0, len(items), size):
+        yield items[i : i + size]
+
+
+class WordNetBackend:
+    """Resolves lookups against a WordNet API client (e.g., ``LatinWordNet``,
+    ``GreekWordNet``).
+
+    The WordNet API has no bulk endpoint, so each chunk of lookups is issued
+    concurrently over the client's session.
+    """
+
+    def __init__(self, wordnet, workers: int = settings.WORDNET_WORKERS):
+        self.wordnet = wordnet
+        self.workers = workers
+
+    def _lemmas(self, key):
+        lemma, pos, uri = key
+        if uri is not None:
+            return self.wordnet.lemmas_by_uri(uri).get()
+        return self.wordnet.lemmas(lemma=lemma, pos=pos).get()
+
+    def _synsets(self, key):
+        lemma, uri, morpho = key
+        if uri is not None:
+            return self.wordnet.lemmas_by_uri(uri).synsets
+        return self.wordnet.lemmas(lemma=lemma, morpho=morpho).synsets
+
+    def _map(self, f, keys: list):
+        if self.workers > 1 and len(keys) > 1:
+            with ThreadPoolExecutor(max_workers=self.workers) as executor:
+                return dict(zip(keys, executor.map(f, keys)))
+        return {key: f(key) for key in keys}
+
+    def lemmas(self, keys: list) -> dict:
+        return self._map(self._lemmas, keys)
+
+    def synsets(self, keys: list) -> dict:
+        return self._map(self._synsets, keys)
+
+
+class LocalBackend:
+    """Resolves lookups against a list of lemma records, as returned by the
+    WordNet API, each optionally carrying its ``synsets``. Serves as an offline
+    stand-in for ``WordNetBackend``."""
+
+    def __init__(self, records: list):
+        self.records = records
+        self.requests = 0
+
+    def _match(self, lemma, uri, pos=None, morpho=None):
+        if uri is not None:
+            return [record for record in self.records if record["uri"] == uri]
+        return [
+            record
+            for record in self.records
+            if record["lemma"] == lemma
+            and (pos is None or record["morpho"][0] == pos)
+            and (morpho is None or record["morpho"] == morpho)
+        ]
+
+    def lemmas(self, keys: list) -> dict:
+        self.requests += 1
+        return {
+            key: [
+                {k: v for k, v in record.items() if k != "synsets"}
+                for record in self._match(key[0], key[2], pos=key[1])
+            ]
+            for key in keys
+        }
+
+    def synsets(self, keys: list) -> dict:
+        self.requests += 1
+        return {
+            key: [
+                record
+                for record in self._match(key[0], key[1], morpho=key[2])
+                if "synsets" in record
+            ]
+            for key in keys
+        }
+
+
+def _resolve(method: str, keys, backend, chunksize: int) -> dict:
+    keys = list(dict.fromkeys(keys))
+    results = {}
+    for chunk in chunks(keys, chunksize):
+        results.update(getattr(backend, method)(chunk))
+    Debug.print(
+        Debug.MEDIUM,
+        f"- Resolved {len(keys)} {method} in {-(-len(keys) // chunksize)} "
+        f"requests",
+    )
+    return results
+
+
+def bulk_lemmas(
+    keys, backend, chunksize: int = settings.WORDNET_CHUNK_SIZE
+) -> dict:
+    """Resolve the distinct ``(lemma, pos, uri)`` keys to their lemma records,
+    in chunks of ``chunksize``."""
+
+    return _resolve("lemmas", keys, backend, chunksize)
+
+
+def bulk_synsets(
+    keys, backend, chunksize: int = settings.WORDNET_CHUNK_SIZE
+) -> dict:
+    """Resolve the distinct ``(lemma, uri, morpho)`` keys to their lemma records
+    with synsets, in chunks of ``chunksize``."""
+
+    return _resolve("synsets", keys, backend, chunksize)
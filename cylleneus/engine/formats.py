@@ -31,7 +31,11 @@ The field format essentially determines what information is stored about each
 occurance of a term.
 """
 
+import sys
+from array import array
 from collections import defaultdict
+from itertools import accumulate
+from operator import add, sub
 
 from cylleneus.engine.analysis.acore import unstopped, entoken
 from cylleneus.engine.compat import iteritems, dumps, loads, b
@@ -533,24 +537,249 @@ class CylleneusCharacters(Positions):
             value = self.encode(poslist)
             yield (w, len(poslist), weights[w] * fb, value)
 
+    def passage_values(self, value, analyzer, passage, **kwargs):
+        """Like ``word_values``, but divides the postings of each word between
+        the passages of the value, as given by calling ``passage`` with the
+        meta of each token. Returns a dictionary of each passage to its list
+        of (word, frequency, weight, value) tuples, in the order of the first
+        token of each passage.
+        """
+
+        fb = self.field_boost
+        seen = {}
+        weights = defaultdict(float)
+
+        kwargs["positions"] = True
+        kwargs["chars"] = True
+        kwargs["boosts"] = True
+        for t in tokens(value, analyzer, kwargs):
+            meta = getattr(t, "meta", None) or {}
+            key = passage(meta)
+            words = seen.get(key)
+            if words is None:
+                words = seen[key] = defaultdict(list)
+            words[t.text].append(
+                (
+                    t.pos,
+                    t.startchar,
+                    t.endchar,
+                    tuple(f"{k}={v}" for k, v in meta.items()),
+                )
+            )
+            weights[key, t.text] += t.boost
+
+        return {
+            key: [
+                (w, len(poslist), weights[key, w] * fb, self.encode(poslist))
+                for w, poslist in iteritems(words)
+            ]
+            for key, words in iteritems(seen)
+        }
+
     def encode(self, poslist):
-        deltas = []
+        # Positions, start characters and lengths are stored as columns of
+        # deltas, and the meta of each posting as a column per key, of the
+        # integer value or the index of the string value in a table of the
+        # distinct strings
+        positions, starts, lengths = [], [], []
+        keys, strings, values = {}, {}, []
         posbase = 0
         charbase = 0
         for pos, startchar, endchar, meta in poslist:
-            deltas.append(
-                (
-                    pos - posbase,
-                    startchar - charbase,
-                    endchar - startchar,
-                    meta,
-                )
-            )
+            positions.append(pos - posbase)
+            starts.append(startchar - charbase)
+            lengths.append(endchar - startchar)
             posbase = pos
             charbase = endchar
-        return pack_uint(len(deltas)) + dumps(deltas, -1)
+
+            row = {}
+            for item in meta:
+                key, _, value = item.partition("=")
+                if (
+                    value.isascii()
+                    and value.isdigit()
+                    and str(int(value)) == value
+                    and int(value) < _MAX_INT
+                ):
+                    code = 2 * int(value) + 1
+                else:
+                    code = 2 * strings.setdefault(value, len(strings)) + 2
+                row[keys.setdefault(key, len(keys))] = code
+            values.append(row)
+
+        columns = [
+            _pack_ints(positions),
+            _pack_ints(starts),
+            _pack_ints(lengths),
+            _pack_ints([len(keys), len(strings)]),
+            _pack_strings(keys),
+            _pack_strings(strings),
+        ]
+        for ix in range(len(keys)):
+            columns.append(_pack_ints([row.get(ix, 0) for row in values]))
+
+        # Tokenizers add some keys only to some tokens, so the keys of a
+        # posting are not always in the order in which they were first seen:
+        # if so, the order of the keys of each posting follows, as a table of
+        # the distinct orders and a column of the order of each posting
+        orders = {}
+        orderids = [
+            orders.setdefault(tuple(row), len(orders)) for row in values
+        ]
+        if any(list(order) != sorted(order) for order in orders):
+            columns.append(_pack_ints([len(orders)]))
+            columns.append(_pack_ints([len(order) for order in orders]))
+            columns.append(_pack_ints([ix for order in orders for ix in order]))
+            columns.append(_pack_ints(orderids))
+        return pack_uint(len(poslist)) + _COLUMNS + b"".join(columns)
+
+    def _columns(self, valuestring, meta=True):
+        # The columns of a posting: its position, start and length deltas and,
+        # if ``meta``, its meta keys and strings, a column of values for each
+        # key, and the distinct orders of the keys with a column of the order
+        # of each posting, or None if every posting has its keys in order
+        n = unpack_uint(valuestring[:_INT_SIZE])[0]
+        offset = _INT_SIZE + 1
+        positions, offset = _unpack_ints(valuestring, offset, n)
+        if not meta:
+            return n, positions
+        starts, offset = _unpack_ints(valuestring, offset, n)
+        lengths, offset = _unpack_ints(valuestring, offset, n)
+        (nkeys, nstrings), offset = _unpack_ints(valuestring, offset, 2)
+        keys, offset = _unpack_strings(valuestring, offset, nkeys)
+        strings, offset = _unpack_strings(valuestring, offset, nstrings)
+        values = []
+        for _ in range(nkeys):
+            column, offset = _unpack_ints(valuestring, offset, n)
+            values.append(column)
+
+        # Postings with their keys in order, and postings written before the
+        # order of keys was stored, end with their values
+        orders = orderids = None
+        if offset < len(valuestring):
+            (norders,), offset = _unpack_ints(valuestring, offset, 1)
+            sizes, offset = _unpack_ints(valuestring, offset, norders)
+            flat, offset = _unpack_ints(valuestring, offset, sum(sizes))
+            orders = []
+            start = 0
+            for size in sizes:
+                orders.append(tuple(flat[start: start + size]))
+                start += size
+            orderids, offset = _unpack_ints(valuestring, offset, n)
+        return (
+            n,
+            positions,
+            starts,
+            lengths,
+            keys,
+            strings,
+            values,
+            orders,
+            orderids,
+        )
 
     def decode_characters(self, valuestring):
+        if valuestring[_INT_SIZE: _INT_SIZE + 1] != _COLUMNS:
+            return self._decode_pickled_characters(valuestring)
+
+        (
+            n,
+            positions,
+            starts,
+            lengths,
+            keys,
+            strings,
+            values,
+            orders,
+            orderids,
+        ) = self._columns(valuestring)
+        # Each distinct value of each key is decoded once
+        items = []
+        for key, column in zip(keys, values):
+            decoded = {
+                code: f"{key}="
+                + (str(code // 2) if code % 2 else strings[code // 2 - 1])
+                for code in set(column)
+                if code
+            }
+            items.append([decoded.get(code) for code in column])
+        if orders is not None:
+            metas = (
+                (tuple(items[ix][i] for ix in orders[orderid]),)
+                for i, orderid in enumerate(orderids)
+            )
+        elif any(0 in column for column in values):
+            metas = (
+                (tuple(item for item in row if item is not None),)
+                for row in zip(*items)
+            )
+        elif items:
+            metas = ((row,) for row in zip(*items))
+        else:
+            metas = [((),)] * n
+
+        endchars = list(accumulate(map(add, starts, lengths)))
+        startchars = map(sub, endchars, lengths)
+        return list(zip(accumulate(positions), startchars, endchars, metas))
+
+    def decode_character_columns(self, valuestring):
+        if valuestring[_INT_SIZE: _INT_SIZE + 1] != _COLUMNS:
+            return character_columns(
+                self._decode_pickled_characters(valuestring)
+            )
+
+        (
+            n,
+            positions,
+            starts,
+            lengths,
+            keys,
+            strings,
+            values,
+            orders,
+            orderids,
+        ) = self._columns(valuestring)
+        endchars = array("q", accumulate(map(add, starts, lengths)))
+        startchars = array("q", map(sub, endchars, lengths))
+
+        # Each distinct row of meta values, in its order of keys, is decoded
+        # once
+        if orderids is None:
+            orderids = [None] * n
+        rows = {}
+        metaids = array(
+            "l",
+            [
+                rows.setdefault(row, len(rows))
+                for row in zip(orderids, *values)
+            ],
+        )
+        everykey = range(len(keys))
+        metas = []
+        for orderid, *codes in rows:
+            order = everykey if orderid is None else orders[orderid]
+            metas.append(
+                tuple(
+                    f"{keys[ix]}="
+                    + (
+                        str(codes[ix] // 2)
+                        if codes[ix] % 2
+                        else strings[codes[ix] // 2 - 1]
+                    )
+                    for ix in order
+                    if codes[ix]
+                )
+            )
+        return (
+            array("q", accumulate(positions)),
+            startchars,
+            endchars,
+            metaids,
+            metas,
+        )
+
+    def _decode_pickled_characters(self, valuestring):
+        # Postings written before meta was stored in columns
         if not valuestring.endswith(b(".")):
             valuestring += b(".")
         codes = loads(valuestring[_INT_SIZE:])
@@ -566,6 +795,10 @@ class CylleneusCharacters(Positions):
         return posns_chars
 
     def decode_positions(self, valuestring):
+        if valuestring[_INT_SIZE: _INT_SIZE + 1] == _COLUMNS:
+            _, positions = self._columns(valuestring, meta=False)
+            return list(accumulate(positions))
+
         if not valuestring.endswith(b(".")):
             valuestring += b(".")
         codes = loads(valuestring[_INT_SIZE:])
@@ -579,11 +812,81 @@ class CylleneusCharacters(Positions):
     def combine(self, vs):
         s = {}
         for v in vs:
-            for pos, sc, ec in self.decode_characters(v):
+            for pos, sc, ec, (meta,) in self.decode_characters(v):
                 if pos in s:
-                    old_sc, old_ec = pos[s]
-                    s[pos] = (min(sc, old_sc), max(ec, old_ec))
+                    old_sc, old_ec, meta = s[pos]
+                    s[pos] = (min(sc, old_sc), max(ec, old_ec), meta)
                 else:
-                    s[pos] = (sc, ec)
-        poses = [(pos, s[pos][0], s[pos][1]) for pos in sorted(s.keys())]
+                    s[pos] = (sc, ec, meta)
+        poses = [(pos, sc, ec, meta) for pos, (sc, ec, meta) in sorted(s.items())]
         return self.encode(poses)
+
+
+# Marks postings stored as columns, following their count; pickled postings
+# start with the pickle protocol instead
+_COLUMNS = b"\x00"
+# Larger integer meta values are stored as strings
+_MAX_INT = 1 << 40
+
+
+def _pack_ints(values):
+    # A column of integers, as the narrowest type that holds them, followed
+    # by the integers in little-endian order. Deltas of overlapping postings
+    # may be negative, and are stored as signed integers
+    top = max(values, default=0)
+    bottom = min(values, default=0)
+    if bottom < 0:
+        for typecode in "bhiq":
+            bits = 8 * array(typecode).itemsize - 1
+            if -(1 << bits) <= bottom and top < 1 << bits:
+                break
+    else:
+        for typecode in "BHIQ":
+            if top < 1 << (8 * array(typecode).itemsize):
+                break
+    column = array(typecode, values)
+    if sys.byteorder == "big":
+        column.byteswap()
+    return typecode.encode("ascii") + column.tobytes()
+
+
+def _unpack_ints(valuestring, offset: int, n: int):
+    column = array(chr(valuestring[offset]))
+    end = offset + 1 + column.itemsize * n
+    column.frombytes(valuestring[offset + 1: end])
+    if sys.byteorder == "big":
+        column.byteswap()
+    return column, end
+
+
+def _pack_strings(strings):
+    encoded = [string.encode("utf8") for string in strings]
+    return _pack_ints([len(string) for string in encoded]) + b"".join(encoded)
+
+
+def _unpack_strings(valuestring, offset: int, n: int):
+    lengths, offset = _unpack_ints(valuestring, offset, n)
+    strings = []
+    for length in lengths:
+        strings.append(valuestring[offset: offset + length].decode("utf8"))
+        offset += length
+    return strings, offset
+
+
+def character_columns(chars):
+    """Returns the (position, startchar, endchar[, meta]) tuples of a posting
+    as parallel arrays of its positions, start characters and end characters,
+    and of the index of the meta of each in a list of its distinct metas,
+    which is returned last, as ``decode_character_columns`` does.
+    """
+
+    positions, startchars, endchars = array("q"), array("q"), array("q")
+    rows = {}
+    metaids = array("l")
+    for pos, startchar, endchar, *meta in chars:
+        positions.append(pos)
+        startchars.append(startchar)
+        endchars.append(endchar)
+        row = meta[0][0] if meta and meta[0] else ()
+        metaids.append(rows.setdefault(row, len(rows)))
+    return positions, startchars, endchars, metaids, list(rows)
@@ -7,6 +7,17 @@ import cylleneus.engine.searching
 from cylleneus import settings
 import whoosh.highlight
 from cylleneus.engine.compat import htmlescape
+from cylleneus.engine.formats import character_columns
+
+
+def match_divs(match):
+    """The divs of a match, without its position in them."""
+
+    return tuple(
+        v
+        for k, v in match.meta.items()
+        if k not in ["sent_pos", "sect_pos", "pos"]
+    )
 
 
 class CylleneusFragment(object):
@@ -16,6 +27,18 @@ class CylleneusFragment(object):
     fragment or do much else.
     """
 
+    __slots__ = (
+        "text",
+        "_matches",
+        "startchar",
+        "endchar",
+        "matched_terms",
+        "meta",
+        "start",
+        "end",
+        "_divs",
+    )
+
     def __init__(
         self,
         text,
@@ -53,6 +76,36 @@ class CylleneusFragment(object):
         self.start = start
         self.end = end
 
+    @property
+    def matches(self):
+        return self._matches
+
+    @matches.setter
+    def matches(self, matches):
+        self._matches = matches
+        self._divs = None
+
+    @property
+    def divs(self):
+        """The set of the divs of the matches."""
+
+        if self._divs is None:
+            self._divs = {match_divs(match) for match in self._matches}
+        return self._divs
+
+    def copy(self):
+        fragment = CylleneusFragment.__new__(CylleneusFragment)
+        fragment.text = self.text
+        fragment._matches = list(self._matches)
+        fragment._divs = None if self._divs is None else set(self._divs)
+        fragment.startchar = self.startchar
+        fragment.endchar = self.endchar
+        fragment.matched_terms = set(self.matched_terms)
+        fragment.meta = self.meta
+        fragment.start = self.start
+        fragment.end = self.end
+        return fragment
+
     def __repr__(self):
         return "<Fragment %d:%d %d>" % (
             self.startchar,
@@ -64,25 +117,7 @@ class CylleneusFragment(object):
         return self.endchar - self.startchar
 
     def has_same_divs(self, other):
-        self_values = {
-            tuple(
-                v
-                for k, v in match.meta.items()
-                if k not in ["sent_pos", "sect_pos", "pos"]
-            )
-            for match in self.matches
-        }
-
-        other_values = {
-            tuple(
-                v
-                for k, v in match.meta.items()
-                if k not in ["sent_pos", "sect_pos", "pos"]
-            )
-            for match in other.matches
-        }
-
-        return bool(len(self_values.intersection(other_values)))
+        return not self.divs.isdisjoint(other.divs)
 
     def is_adjacent(self, other):
         return other.matches[0].startchar - self.matches[-1].endchar == 1
@@ -128,11 +163,12 @@ class CylleneusFragment(object):
                 self.startchar == other.startchar
                 and self.endchar == other.endchar
                 and self.text == other.text
-                and (self.pos == other.pos if hasattr(self, "pos") else True)
             )
 
     def __hash__(self):
-        return hash(tuple(sorted(self.__dict__)))
+        # Fragments without characters are equal by their meta data, which
+        # some may have more of than others, so they only hash by characters
+        return hash((self.startchar, self.endchar))
 
 
 # Highlighting
@@ -236,10 +272,12 @@ class CylleneusHighlighter(object):
 
     @staticmethod
     def _load_chars(results, fieldname, texts, to_bytes):
-        # For each docnum, create a mapping of text -> [(startchar, endchar)]
-        # for the matched terms
+        # For each docnum, create a mapping of text -> (positions, startchars,
+        # endchars, metaids, metas) columns for the matched terms
 
         results._char_cache[fieldname] = cache = {}
+        field = results.searcher.schema[fieldname]
+        columnar = field.supports("character_columns")
         sorted_ids = sorted(docnum for _, docnum in results.top_n)
 
         for docnum in sorted_ids:
@@ -253,7 +291,12 @@ class CylleneusHighlighter(object):
                 if docnum in docset:
                     m.skip_to(docnum)
                     assert m.id() == docnum
-                    cache[docnum][text] = m.value_as("characters")
+                    if columnar:
+                        cache[docnum][text] = m.value_as("character_columns")
+                    else:
+                        cache[docnum][text] = character_columns(
+                            m.value_as("characters")
+                        )
 
     @staticmethod
     def _merge_matched_tokens(tokens):
@@ -282,6 +325,46 @@ class CylleneusHighlighter(object):
         if token is not None:
             yield token
 
+    @staticmethod
+    def _merge_columns(cmap, words, charlimit):
+        # The columns of the matches of each of the words, up to the character
+        # limit, merged in order of start character, with the word of each
+        # match and the index of its meta in a list of the metas of them all
+        words = list(words)
+        wordids, positions, startchars, endchars = [], [], [], []
+        metaids, metas = [], []
+        for wordid, word in enumerate(words):
+            wpositions, wstartchars, wendchars, wmetaids, wmetas = cmap[word]
+            n = len(wendchars)
+            if charlimit:
+                n = next(
+                    (
+                        k
+                        for k, endchar in enumerate(wendchars)
+                        if endchar > charlimit
+                    ),
+                    n,
+                )
+            offset = len(metas)
+            wordids.extend([wordid] * n)
+            positions.extend(wpositions[:n])
+            startchars.extend(wstartchars[:n])
+            endchars.extend(wendchars[:n])
+            metaids.extend([metaid + offset for metaid in wmetaids[:n]])
+            metas.extend(wmetas)
+
+        # Sort matches by position in text
+        order = sorted(range(len(startchars)), key=startchars.__getitem__)
+        return (
+            words,
+            [wordids[k] for k in order],
+            [positions[k] for k in order],
+            [startchars[k] for k in order],
+            [endchars[k] for k in order],
+            [metaids[k] for k in order],
+            metas,
+        )
+
     def fragment_hit(self, hitobj, fieldname, text=None):
         results = hitobj.results
         schema = results.searcher.schema
@@ -304,7 +387,7 @@ class CylleneusHighlighter(object):
 
         # If we can do "pinpoint" highlighting...
         if self.can_load_chars(results, fieldname):
-            # Build the docnum->[(startchar, endchar),] map
+            # Build the docnum->{word: columns} map
             if fieldname not in results._char_cache:
                 self._load_chars(
                     results, fieldname, words, to_bytes
@@ -315,40 +398,56 @@ class CylleneusHighlighter(object):
                 if term[0] == fieldname
             )
 
-            # Grab the word->[(startchar, endchar)] map for this docnum
+            # Grab the word->columns map for this docnum
             cmap = results._char_cache[fieldname][hitobj.docnum]
-
-            # A list of Token objects for matched words
-            tokens = []
-            charlimit = self.fragmenter.charlimit
-            for word in hitterms:
-                chars = cmap[word]
-                boost = None
-
-                while boost is None:
-                    boost = get_boost(hitobj.results.q, word)
-
-                for pos, startchar, endchar, meta in chars:
-                    if charlimit and endchar > charlimit:
-                        break
+            (
+                words,
+                wordids,
+                positions,
+                startchars,
+                endchars,
+                metaids,
+                metas,
+            ) = self._merge_columns(cmap, hitterms, self.fragmenter.charlimit)
+            boosts = [get_boost(hitobj.results.q, word) for word in words]
+            docnum = hitobj["docix"]
+            fieldtype = field.__class__.__name__.lower()
+            # The meta of each distinct row is shared by its matches
+            metadicts = {}
+
+            def tokens(i, j):
+                # The Token objects of the matched words i through j
+                matches = []
+                for k in range(i, j + 1):
+                    wordid = wordids[k]
                     t = cylleneus.engine.analysis.acore.CylleneusToken(
-                        docnum=hitobj["docix"],
-                        text=word,
-                        pos=pos,
-                        startchar=startchar,
-                        endchar=endchar,
-                        boost=boost,
-                        fieldname=field.__class__.__name__.lower(),
+                        docnum=docnum,
+                        text=words[wordid],
+                        pos=positions[k],
+                        startchar=startchars[k],
+                        endchar=endchars[k],
+                        boost=boosts[wordid],
+                        fieldname=fieldtype,
                     )
-                    t.meta = dict([item.split("=") for item in meta[0]])
-                    tokens.append(t)
-
-            # Sort tokens by position in text
-            tokens.sort(key=lambda t: t.startchar)
+                    metaid = metaids[k]
+                    if metaid not in metadicts:
+                        metadicts[metaid] = dict(
+                            item.split("=") for item in metas[metaid]
+                        )
+                    t.meta = metadicts[metaid]
+                    matches.append(t)
+                return matches
 
             if text is None:
                 text = hitobj.get("content", "")
-            fragments = self.fragmenter.fragment_matches(text, tokens)
+            if hasattr(self.fragmenter, "fragment_columns"):
+                fragments = self.fragmenter.fragment_columns(
+                    text, positions, startchars, endchars, tokens
+                )
+            else:
+                fragments = self.fragmenter.fragment_matches(
+                    text, tokens(0, len(positions) - 1)
+                )
         else:
             # Retokenize the text
             analyzer = results.searcher.schema[fieldname].analyzer
@@ -403,26 +502,26 @@ class CylleneusHighlighter(object):
                 if term[0] == fieldname
             )
 
-            # Grab the word->[(startchar, endchar)] map for this docnum
+            # Grab the word->columns map for this docnum
             cmap = results._char_cache[fieldname][hitobj["docnum"]]
+            words, wordids, positions, startchars, endchars, _, _ = (
+                self._merge_columns(
+                    cmap, hitterms, self.fragmenter.charlimit
+                )
+            )
             # A list of Token objects for matched words
-            tokens = []
-            charlimit = self.fragmenter.charlimit
-            for word in hitterms:
-                chars = cmap[word]
-                for pos, startchar, endchar in chars:
-                    if charlimit and endchar > charlimit:
-                        break
-                    tokens.append(
-                        cylleneus.engine.analysis.acore.CylleneusToken(
-                            docnum=hitobj["docnum"],
-                            text=word,
-                            pos=pos,
-                            startchar=startchar,
-                            endchar=endchar,
-                        )
-                    )
-            tokens.sort(key=lambda t: t.startchar)
+            tokens = [
+                cylleneus.engine.analysis.acore.CylleneusToken(
+                    docnum=hitobj["docnum"],
+                    text=words[wordid],
+                    pos=pos,
+                    startchar=startchar,
+                    endchar=endchar,
+                )
+                for wordid, pos, startchar, endchar in zip(
+                    wordids, positions, startchars, endchars
+                )
+            ]
             tokens = [
                 max(group, key=lambda t: t.endchar - t.startchar)
                 for key, group in groupby(tokens, lambda t: t.startchar)
@@ -622,45 +721,74 @@ class CylleneusPinpointFragmenter(whoosh.highlight.Fragmenter):
                 yield fragment
         else:
             tokens = sorted(tokens, key=lambda t: t.startchar)
+            startchars = [t.startchar for t in tokens]
+            endchars = [t.endchar for t in tokens]
 
-            maxchars = self.maxchars
-            surround = self.surround
-            autotrim = self.autotrim
-            charlimit = self.charlimit
-
-            j = -1
-
-            for i, t in enumerate(tokens):
-                if j >= i:
-                    continue
-                j = i
-                left = t.startchar
-                right = t.endchar
-                if charlimit and right > charlimit:
-                    break
-
-                currentlen = right - left
-                while j < len(tokens) - 1 and currentlen < maxchars:
-                    next = tokens[j + 1]
-                    ec = next.endchar
-                    if ec - right <= surround and ec - left <= maxchars:
-                        j += 1
-                        right = ec
-                        currentlen += ec - next.startchar
-                    else:
-                        break
-
-                if text:
-                    left = max(0, left - surround)
-                    right = min(len(text), right + surround)
-
+            for i, j, left, right in self._spans(text, startchars, endchars):
                 fragment = CylleneusFragment(
                     text, tokens[i: j + 1], left, right
                 )
-                if autotrim:
+                if self.autotrim:
+                    self._autotrim(fragment)
+                yield fragment
+
+    def fragment_columns(self, text, positions, startchars, endchars, tokens):
+        """Like ``fragment_matches``, for matches sorted by start character
+        and given as parallel arrays of their positions, start characters and
+        end characters. ``tokens(i, j)`` returns the tokens of the matches i
+        through j, so that tokens are only made for the matches in fragments.
+        """
+
+        # For corpora without pinpoint support, return each token as a fragment
+        if any(
+            pos == 0 and startchar == 0 and endchar == 0
+            for pos, startchar, endchar in zip(positions, startchars, endchars)
+        ):
+            yield from self.fragment_matches(
+                text, tokens(0, len(positions) - 1)
+            )
+        else:
+            for i, j, left, right in self._spans(text, startchars, endchars):
+                fragment = CylleneusFragment(text, tokens(i, j), left, right)
+                if self.autotrim:
                     self._autotrim(fragment)
                 yield fragment
 
+    def _spans(self, text, startchars, endchars):
+        # The first and last matches, and the start and end characters, of
+        # each fragment of matches sorted by start character
+        maxchars = self.maxchars
+        surround = self.surround
+        charlimit = self.charlimit
+        n = len(startchars)
+
+        j = -1
+
+        for i in range(n):
+            if j >= i:
+                continue
+            j = i
+            left = startchars[i]
+            right = endchars[i]
+            if charlimit and right > charlimit:
+                break
+
+            currentlen = right - left
+            while j < n - 1 and currentlen < maxchars:
+                ec = endchars[j + 1]
+                if ec - right <= surround and ec - left <= maxchars:
+                    j += 1
+                    right = ec
+                    currentlen += ec - startchars[j]
+                else:
+                    break
+
+            if text:
+                left = max(0, left - surround)
+                right = min(len(text), right + surround)
+
+            yield i, j, left, right
+
 
 def get_text(original, token, replace):
     """Convenience function for getting the text to use for a match when
@@ -0,0 +1,104 @@
+"""Morphology indexes of the annotation field of an index.
+
+Every analysis of a form is indexed in the annotation field as a term
+``annotation::uri:n:i``, where the annotation holds the value of each of its
+features by position (e.g. ``n-s---fa1-``), and ``uri:n:i`` identifies the
+analysis within its lemma (its lemma group), as well as a term for each of
+its features alone (e.g. ``--s-------::uri:n:i``), which queries match.
+
+A morphology index holds, for each feature, a bitmap of the analyses in the
+lexicon having it, and the lemma group of each analysis as an integer, so
+that the lemma groups with an analysis having every feature of a query are
+found by intersecting bitmaps, rather than by matching every term of each
+feature against a pattern."""
+
+import threading
+import weakref
+from array import array
+
+
+def _members(bitmap: int):
+    # The ordinals set in a bitmap
+    data = bitmap.to_bytes((bitmap.bit_length() + 7) // 8, "little")
+    for i, byte in enumerate(data):
+        if byte:
+            for j in range(8):
+                if byte >> j & 1:
+                    yield i * 8 + j
+
+
+class MorphologyIndex(object):
+    """The analyses of an annotation lexicon, as ``(annotation, group)``
+    pairs, by feature."""
+
+    def __init__(self, analyses):
+        self.groups = []
+        self.ordinals = array("I")
+
+        groupids = {}
+        features = {}
+        for k, (annotation, group) in enumerate(analyses):
+            groupid = groupids.get(group)
+            if groupid is None:
+                groupid = groupids[group] = len(self.groups)
+                self.groups.append(group)
+            self.ordinals.append(groupid)
+            for position, value in enumerate(annotation):
+                if value != "-":
+                    features.setdefault((position, value), []).append(k)
+
+        size = (len(self.ordinals) + 7) // 8
+        self.bitmaps = {}
+        for feature, ks in features.items():
+            bitmap = bytearray(size)
+            for k in ks:
+                bitmap[k >> 3] |= 1 << (k & 7)
+            self.bitmaps[feature] = int.from_bytes(bitmap, "little")
+
+    @classmethod
+    def from_reader(cls, reader, fieldname: str = "annotation"):
+        from_bytes = reader.schema[fieldname].from_bytes
+
+        def analyses():
+            for btext in reader.lexicon(fieldname):
+                annotation, _, group = from_bytes(btext).partition("::")
+                yield annotation, group
+
+        return cls(analyses())
+
+    def __len__(self):
+        return len(self.ordinals)
+
+    def lemma_groups(self, annotation: str):
+        """The lemma groups with an analysis having every feature of an
+        annotation, in order."""
+
+        bitmap = -1
+        for position, value in enumerate(annotation):
+            if value != "-":
+                bitmap &= self.bitmaps.get((position, value), 0)
+                if not bitmap:
+                    return []
+        if bitmap == -1:
+            return []
+        return sorted(
+            {self.groups[self.ordinals[k]] for k in _members(bitmap)}
+        )
+
+
+_indexes = weakref.WeakKeyDictionary()
+_lock = threading.Lock()
+
+
+def morphology(reader, fieldname: str = "annotation"):
+    """The morphology index of the annotation field of a reader, which is
+    built when it is first needed and kept for as long as the reader."""
+
+    with _lock:
+        indexes = _indexes.setdefault(reader, {})
+        index = indexes.get(fieldname)
+    if index is None:
+        index = MorphologyIndex.from_reader(reader, fieldname)
+        with _lock:
+            index = indexes.setdefault(fieldname, index)
+    return index
@@ -487,6 +487,9 @@ class CylleneusQueryParser(QueryParser):
         self.phraseclass = phraseclass
         self.group = group
         self.plugins = []
+        # Processed texts of terms, by field, so that terms shared by the
+        # queries parsed are looked up only once
+        self._texts = {}
 
         if plugins is None:
             plugins = self.default_set()
@@ -587,15 +590,19 @@ class CylleneusQueryParser(QueryParser):
 
             # Otherwise, ask the field to process the text into a list of
             # tokenized strings
-            texts = list(
-                field.process_text(
-                    text,
-                    mode="query",
-                    tokenize=tokenize,
-                    removestops=removestops,
-                    docix=None,
+            key = (fieldname, text, tokenize, removestops)
+            texts = self._texts.get(key)
+            if texts is None:
+                texts = list(
+                    field.process_text(
+                        text,
+                        mode="query",
+                        tokenize=tokenize,
+                        removestops=removestops,
+                        docix=None,
+                    )
                 )
-            )
+                self._texts[key] = texts
             # If the analyzer returned more than one token, use the field's
             # multitoken_query attribute to decide what query class, if any, to
             # use to put the tokens together
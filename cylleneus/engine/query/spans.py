@@ -44,6 +44,7 @@ For example, to find documents containing "whoosh" at most 5 positions before
 """
 
 import re
+from bisect import bisect_left
 from difflib import SequenceMatcher
 
 import cylleneus.engine.matching.binary
@@ -155,7 +156,8 @@ class Span(object):
         return folldiv and self.start > span.start
 
     def __hash__(self):
-        return hash(tuple(int(v) if v.isnumeric() else v for k, v in self.meta.items() if k != "meta"))
+        # Equal spans have the same positions and characters
+        return hash((self.start, self.end, self.startchar, self.endchar))
 
     @classmethod
     def merge(cls, spans):
@@ -296,6 +298,28 @@ def bisect_spans_by_meta(spans, startmeta):
     return lo
 
 
+def is_sorted(values):
+    """Whether a list of positions or characters is in order."""
+
+    return None not in values and all(
+        x <= y for x, y in zip(values, values[1:])
+    )
+
+
+def span_key(span):
+    """The token and div of a span, which spans with each other share."""
+
+    return (
+        span.startchar,
+        span.endchar,
+        tuple(
+            int(v) if v.isnumeric() else v
+            for k, v in span.meta.items()
+            if k != "meta"
+        ),
+    )
+
+
 # Base matchers
 
 
@@ -620,13 +644,28 @@ class SpanNear(SpanQuery):
             ordered = self.ordered
             spans = set()
 
-            bspans = self.b.spans()
+            bspans = [bspan for bspan in self.b.spans() if bspan is not None]
+
+            # Spans of B that end too far in front of a span of A, or that
+            # start in front of it when ordered, are never near it, so when
+            # they are in order they are skipped by a binary search
+            ends = [bspan.end for bspan in bspans]
+            if not is_sorted(ends):
+                ends = None
+            startchars = [bspan.startchar for bspan in bspans]
+            if not ordered or not is_sorted(startchars):
+                startchars = None
+
             for aspan in self.a.spans():
                 if aspan is None:
                     continue
-                for bspan in bspans:
-                    if bspan is None:
-                        continue
+                j = 0
+                if ends is not None:
+                    j = bisect_left(ends, aspan.start - slop)
+                if startchars is not None and aspan.startchar is not None:
+                    j = max(j, bisect_left(startchars, aspan.startchar))
+                for k in range(j, len(bspans)):
+                    bspan = bspans[k]
                     if bspan.end < aspan.start - slop or (
                         ordered and aspan.startchar > bspan.startchar
                     ):
@@ -841,6 +880,7 @@ class SpanNear2(SpanQuery):
             i = 1
             while i < len(ms) and aspans:
                 bspans = ms[i].spans()
+                bstarts = [bspan.start for bspan in bspans]
                 spans = set()
                 for aspan in aspans:
                     # Use a binary search to find the first position we should
@@ -848,7 +888,7 @@ class SpanNear2(SpanQuery):
                     start = (
                         aspan.start if ordered else max(0, aspan.start - slop)
                     )
-                    j = bisect_spans(bspans, start)
+                    j = bisect_left(bstarts, start)
 
                     while j < len(bspans):
                         bspan = bspans[j]
@@ -1207,54 +1247,23 @@ class SpanWith2(SpanQuery):
             return self
 
         def _get_spans(self):
-            slop = self.slop
-            mindist = self.mindist
-            ordered = self.ordered
-
             ms = self.ms
             aspans = ms[0].spans()
 
             i = 1
             while i < len(ms) and aspans:
-                bspans = ms[i].spans()
+                # Spans are with each other when they are of the same token
+                # in the same div, so the spans of B are looked up by token
+                bspans = {}
+                for bspan in ms[i].spans():
+                    bspans.setdefault(span_key(bspan), []).append(bspan)
+
                 spans = set()
                 for aspan in aspans:
-                    # Use a binary search to find the first position we should
-                    # start looking for possible matches
-                    startmeta = aspan.meta
-                    if not startmeta:
+                    if not aspan.meta:
                         continue
-                    j = bisect_spans_by_meta(bspans, startmeta)
-
-                    while j < len(bspans):
-                        bspan = bspans[j]
-                        j += 1
-
-                        if (
-                            bspan.startchar == aspan.startchar
-                            and bspan.endchar == aspan.endchar
-                            and tuple(
-                            int(v) if v.isnumeric() else v
-                            for k, v in bspan.meta.items()
-                            if k != "meta"
-                        )
-                            == tuple(
-                            int(v) if v.isnumeric() else v
-                            for k, v in aspan.meta.items()
-                            if k != "meta"
-                        )
-                        ):
-                            spans.add(aspan.to(bspan))
-                        elif bspan.startchar > aspan.endchar and tuple(
-                            int(v) if v.isnumeric() else v
-                            for k, v in bspan.meta.items()
-                            if k != "meta"
-                        ) > tuple(
-                            int(v) if v.isnumeric() else v
-                            for k, v in aspan.meta.items()
-                            if k != "meta"
-                        ):
-                            break
+                    for bspan in bspans.get(span_key(aspan), ()):
+                        spans.add(aspan.to(bspan))
                 aspans = spans
                 i += 1
 
@@ -37,6 +37,7 @@ from cylleneus.engine.analysis.acore import CylleneusToken
 from cylleneus.engine.query import qcore
 import cylleneus.engine.query
 from cylleneus.engine.compat import bytes_type, text_type, u
+from cylleneus.engine.morphology import morphology
 from whoosh.lang.morph_en import variations
 
 
@@ -1349,6 +1350,10 @@ class Variations(ExpandingTerm):
         return q
 
 
+# An annotation, with the value of each of its features by position
+ANALYSIS = re.compile(r"[\w-]{10}")
+
+
 class Annotation(Regex):
     """Matches documents containing the given term (fieldname+annotation)."""
 
@@ -1422,6 +1427,22 @@ class Annotation(Regex):
     def __hash__(self):
         return hash(self.fieldname) ^ hash(self.text) ^ hash(self.boost)
 
+    def _features(self):
+        # The feature matched, and the annotation whose features the analyses
+        # matched must all have
+        feature, _, annotation = self.text.partition("::")
+        if not ANALYSIS.fullmatch(annotation):
+            annotation = feature
+        return feature, annotation
+
+    def _btexts(self, ixreader):
+        # Only the terms of the lemma groups with an analysis having every
+        # feature of the annotation
+        feature, annotation = self._features()
+        to_bytes = ixreader.schema[self.fieldname].to_bytes
+        for group in morphology(ixreader, self.fieldname).lemma_groups(annotation):
+            yield to_bytes(f"{feature}::{group}")
+
     def has_terms(self):
         return True
 
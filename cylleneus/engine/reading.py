@@ -321,12 +321,13 @@ class IndexReader(object):
         raise NotImplementedError
 
     def all_doc_ixs(self):
-        is_deleted = self.is_deleted
-        return (
-            fields["docix"]
-            for docnum, fields in self.iter_docs()
-            if not is_deleted(docnum)
-        )
+        # The passages of a work are documents sharing its docix
+        seen = set()
+        for docnum in self.all_doc_ids():
+            docix = self.stored_fields(docnum)["docix"]
+            if docix not in seen:
+                seen.add(docix)
+                yield docix
 
     def all_doc_ids(self):
         """Returns an iterator of all (undeleted) document IDs in the reader.
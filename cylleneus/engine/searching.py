@@ -1732,6 +1732,39 @@ class CylleneusResults(Results):
         self.collector = None
         self._total = None
         self._char_cache = {}
+        self._requirements = {}
+        self._context = None
+
+    @property
+    def context(self):
+        """The :class:`HitContext` shared by every hit of these results, and
+        by the results of the other indexes of the same search, if it was
+        given one."""
+
+        if self._context is None:
+            self._context = HitContext()
+        return self._context
+
+    @context.setter
+    def context(self, context):
+        self._context = context
+
+    def requirements(self, q=None):
+        """Returns the :class:`TermRequirements` of a query of these results
+        (by default, the query that created them), which are compiled once
+        and shared by every hit. Terms are expanded against the lexicon of
+        this index, so requirements are not shared with other indexes.
+        """
+
+        q = self.q if q is None else q
+        # Queries are kept with their requirements, so that their ids are
+        # not reused
+        if id(q) not in self._requirements:
+            self._requirements[id(q)] = (
+                q,
+                TermRequirements.from_query(q, self.searcher.reader()),
+            )
+        return self._requirements[id(q)][1]
 
     def __getitem__(self, n):
         if isinstance(n, slice):
@@ -1832,9 +1865,9 @@ field_order = {
 }
 
 
-def query_term_lists(query, ixreader):
-    """Returns the terms in the query tree, with the query hierarchy
-    represented as nested lists.
+def query_terms(query, ixreader):
+    """Returns the terms in the query tree that are required, and the lists of
+    terms of which one is required.
     """
 
     def _get_term_lists(q):
@@ -1876,7 +1909,15 @@ def query_term_lists(query, ixreader):
             )
         return and_terms, or_terms
 
-    and_terms, or_terms = _get_term_lists(query)
+    return _get_term_lists(query)
+
+
+def query_term_lists(query, ixreader):
+    """Returns the terms in the query tree, with the query hierarchy
+    represented as nested lists.
+    """
+
+    and_terms, or_terms = query_terms(query, ixreader)
     term_lists = []
     if len(and_terms) != 0:
         if or_terms:
@@ -1891,6 +1932,147 @@ def query_term_lists(query, ixreader):
     )
 
 
+class TermRequirements(object):
+    """The terms a fragment must match to match a query, compiled from the
+    query tree: every required term, and one term of each clause. Each of the
+    term lists of `query_term_lists` holds the required terms and one term of
+    each clause, so these answer the same questions as the term lists without
+    expanding every combination of the clauses.
+    """
+
+    def __init__(self, required, clauses):
+        self.required = list(required)
+        self.clauses = [frozenset(clause) for clause in clauses]
+
+        self._required = frozenset(self.required)
+        self._clauses_by_term = defaultdict(list)
+        for i, clause in enumerate(self.clauses):
+            for term in clause:
+                self._clauses_by_term[term].append(i)
+
+        # No term list can be made if any clause is empty
+        self.satisfiable = all(self.clauses)
+        if self.satisfiable:
+            self.terms = self._required.union(*self.clauses)
+        else:
+            self.terms = frozenset()
+
+        # The number of terms, and of terms by field, in a term list
+        self.size = len(self.required) + len(self.clauses)
+        self.field_counts = Counter(
+            [field for field, value in self.required]
+            + [min(clause)[0] for clause in self.clauses if clause]
+        )
+
+    @classmethod
+    def from_query(cls, query, ixreader):
+        return cls(*query_terms(query, ixreader))
+
+    def __repr__(self):
+        return "%s(%r, %r)" % (
+            self.__class__.__name__,
+            self.required,
+            [sorted(clause) for clause in self.clauses],
+        )
+
+    def satisfied_by(self, terms):
+        """Whether the terms include every term of some term list."""
+
+        return self._required.issubset(terms) and all(
+            not clause.isdisjoint(terms) for clause in self.clauses
+        )
+
+    def covers(self, terms):
+        """Whether some term list includes every one of the terms."""
+
+        if not self.satisfiable:
+            return False
+
+        # Each term that is not required must be one of a different clause
+        terms = [term for term in set(terms) if term not in self._required]
+        if len(terms) > len(self.clauses):
+            return False
+
+        assigned = {}
+
+        def assign(term, seen):
+            for i in self._clauses_by_term.get(term, ()):
+                if i not in seen:
+                    seen.add(i)
+                    if i not in assigned or assign(assigned[i], seen):
+                        assigned[i] = term
+                        return True
+            return False
+
+        return all(assign(term, set()) for term in terms)
+
+
+class HitContext(object):
+    """What the fragment filters of every hit of a search share, across all
+    of the indexes it searches, computed when first needed: a WordNet client
+    for each language, and the lemmas of each synset and semantic field.
+    """
+
+    wordnets = {
+        "grk": greekwordnet.GreekWordNet,
+        "skt": sanskritwordnet.SanskritWordNet,
+        "lat": latinwordnet.LatinWordNet,
+    }
+
+    def __init__(self):
+        self._wordnets = {}
+        self._uris = {}
+
+    def _language(self, language):
+        # Languages without a WordNet of their own use the Latin one
+        return language if language in self.wordnets else "lat"
+
+    def wordnet(self, language):
+        """Returns the WordNet client of a language (by default, Latin)."""
+
+        language = self._language(language)
+        if language not in self._wordnets:
+            self._wordnets[language] = self.wordnets[language]()
+        return self._wordnets[language]
+
+    def uris(self, terms, language):
+        """Returns the URIs of the lemmas required by the terms of a query,
+        directly or by their synsets and semantic fields."""
+
+        language = self._language(language)
+        uris = set()
+        for term in terms:
+            if term[0] not in ("lemma", "synset", "semfield"):
+                continue
+            key = (language, term)
+            if key not in self._uris:
+                self._uris[key] = self._term_uris(term, language)
+            uris.update(self._uris[key])
+        return uris
+
+    def _term_uris(self, term, language):
+        if term[0] == "lemma":
+            return {term[1].split("=")[0].split(":")[1]}
+
+        WN = self.wordnet(language)
+        lemmas = set()
+        if term[0] == "synset":
+            pos, offset = term[1].split("#")
+            for synset in WN.synsets(pos=pos, offset=offset).lemmas:
+                for signification in synset["lemmas"]:
+                    lemmas.update(
+                        [
+                            hdict(lemma)
+                            for lemma in synset["lemmas"][signification]
+                        ]
+                    )
+        else:
+            code = term[1]
+            for semfield in WN.semfields(code=code).lemmas:
+                lemmas.update([hdict(lemma) for lemma in semfield["lemmas"]])
+        return {lemma["uri"] for lemma in lemmas}
+
+
 class CylleneusHit(Hit):
     """ Hit object for Cylleneus searches """
 
@@ -1900,20 +2082,14 @@ class CylleneusHit(Hit):
         """
 
         if self._fields is None:
-            self._fields = self.searcher.stored_fields(0)
+            self._fields = self.searcher.stored_fields(self.docnum)
         return self._fields
 
-    def filter_by_annotation(self, query, termlists, fragments):
+    def filter_by_annotation(self, query, requirements, fragments):
         """ For compound annotation queries, preserve same-analysis groups """
 
-        if self["language"] == "grk":
-            WN = greekwordnet.GreekWordNet()
-        elif self["language"] == "skt":
-            WN = sanskritwordnet.SanskritWordNet()
-        else:
-            WN = latinwordnet.LatinWordNet()
-
-        term_field_counts = Counter([field for field, value in termlists[0]])
+        context = self.results.context
+        term_field_counts = requirements.field_counts
 
         if isinstance(
             query, cylleneus.engine.query.positional.Collocation
@@ -1949,16 +2125,12 @@ class CylleneusHit(Hit):
                             if len(annotations) >= len(
                                 {
                                     term
-                                    for terms in termlists
-                                    for term in terms
+                                    for term in requirements.terms
                                     if term[0] == "annotation"
                                 }
-                            ) and any(
-                                all(
-                                    ("annotation", annotation) in terms
-                                    for annotation in annotations
-                                )
-                                for terms in termlists
+                            ) and requirements.covers(
+                                ("annotation", annotation)
+                                for annotation in annotations
                             ):
                                 morphos.append((uri, lemma, group))
 
@@ -1995,40 +2167,10 @@ class CylleneusHit(Hit):
                     key=lambda x: x[0],
                 )
 
-                if len(semifinalists) >= len(termlists[0]) and any(
-                    all(item in terms for item in tt) for terms in termlists
+                if len(semifinalists) >= requirements.size and requirements.covers(
+                    tt
                 ):
-                    lemmas = set()
-                    uris = set()
-                    for terms in termlists:
-                        for term in terms:
-                            if term[0] == "lemma":
-                                uris.add(term[1].split("=")[0].split(":")[1])
-                            elif term[0] == "synset":
-                                pos, offset = term[1].split("#")
-                                for synset in WN.synsets(
-                                    pos=pos, offset=offset
-                                ).lemmas:
-                                    for signification in synset["lemmas"]:
-                                        lemmas.update(
-                                            [
-                                                hdict(lemma)
-                                                for lemma in synset["lemmas"][
-                                                    signification
-                                                ]
-                                            ]
-                                        )
-                                uris.update([lemma["uri"] for lemma in lemmas])
-                            elif term[0] == "semfield":
-                                code = term[1]
-                                for semfield in WN.semfields(code=code).lemmas:
-                                    lemmas.update(
-                                        [
-                                            hdict(lemma)
-                                            for lemma in semfield["lemmas"]
-                                        ]
-                                    )
-                                uris.update([lemma["uri"] for lemma in lemmas])
+                    uris = context.uris(requirements.terms, self["language"])
                     for semifinalist in semifinalists:
                         if semifinalist.fieldname == "annotation":
                             if uris:
@@ -2056,29 +2198,15 @@ class CylleneusHit(Hit):
                     key=lambda x: x[0],
                 )
 
-                field_counts_by_meta = {}
+                field_counts_by_meta = defaultdict(Counter)
                 for finalist in finalists:
                     meta = hdict(finalist.meta)
                     for k in ["sent_pos", "sect_pos"]:
                         if k in meta:
                             meta.pop(k)
-                    if meta not in field_counts_by_meta:
-                        field_counts_by_meta[meta] = Counter(
-                            [
-                                f.fieldname
-                                for f in finalists
-                                if hdict(
-                                    {
-                                        k: v
-                                        for k, v in f.meta.items()
-                                        if k not in ["sent_pos", "sect_pos"]
-                                    }
-                                )
-                                == meta
-                            ]
-                        )
-                if len(finalists) >= len(termlists[0]) and any(
-                    all(item in terms for item in tt) for terms in termlists
+                    field_counts_by_meta[meta][finalist.fieldname] += 1
+                if len(finalists) >= requirements.size and requirements.covers(
+                    tt
                 ):
                     meta_counts = Counter(
                         [
@@ -2105,11 +2233,9 @@ class CylleneusHit(Hit):
                                 }
                             )
                         ]
-                           >= len(termlists[0])
+                           >= requirements.size
                            and (finalist.fieldname, finalist.text.split("::")[0])
-                           in {
-                               term for termlist in termlists for term in termlist
-                           }
+                           in requirements.terms
                            and all(
                             field_counts_by_meta[
                                 hdict(
@@ -2138,19 +2264,37 @@ class CylleneusHit(Hit):
     def merge_fragments(fragments):
         """ Merge overlapping, adjacent, and same-passage fragments together """
 
+        def _key(match):
+            return match.startchar, match.fieldname
+
+        def _last(matches, last=None):
+            # The match that is last once matches are sorted
+            for match in matches:
+                if last is None or _key(match) >= _key(last):
+                    last = match
+            return last
+
+        def _merged(fragment):
+            # Matches are sorted once, when the fragment is done
+            fragment.matches.sort(key=_key)
+            return fragment
+
         fragment = None
+        last = None
 
         for other in fragments:
             if fragment is None:
-                fragment = copy.deepcopy(other)
+                fragment = other.copy()
+                last = _last(fragment.matches)
             elif (
-                fragment.is_adjacent(other)
+                other.matches[0].startchar - last.endchar == 1
                 or fragment.overlaps(other)
                 or fragment.has_same_divs(other)
             ):
-                fragment.matches += other.matches
-                fragment.matches.sort(key=lambda x: (x.startchar, x.fieldname))
+                fragment.matches.extend(other.matches)
+                fragment.divs.update(other.divs)
                 fragment.matched_terms.update(other.matched_terms)
+                last = _last(other.matches, last)
 
                 if other.startchar < fragment.startchar:
                     fragment.startchar = other.startchar
@@ -2158,14 +2302,16 @@ class CylleneusHit(Hit):
                 if fragment.endchar < other.endchar:
                     fragment.endchar = other.endchar
 
-                i = other.text.find(fragment.text)
-                fragment.text += other.text[i:]
+                if other.text != fragment.text:
+                    i = other.text.find(fragment.text)
+                    fragment.text += other.text[i:]
             else:
-                yield fragment
-                fragment = copy.deepcopy(other)
+                yield _merged(fragment)
+                fragment = other.copy()
+                last = _last(fragment.matches)
 
         if fragment is not None:
-            yield fragment
+            yield _merged(fragment)
 
     def filter_by_sequence(self, query, fragments):
         def _ordering_diff(a, b):
@@ -2312,22 +2458,17 @@ class CylleneusHit(Hit):
                             )
                         )
                     else:
-                        termlists = query_term_lists(subquery, self.reader)
+                        terms = self.results.requirements(subquery).terms
                         matches.update(
                             set(
                                 [
                                     match
                                     for match in fragment.matches
-                                    if any(
-                                        [
-                                            (
-                                                match.fieldname,
-                                                match.text.split("::")[0],
-                                            )
-                                            in termlist
-                                            for termlist in termlists
-                                        ]
+                                    if (
+                                        match.fieldname,
+                                        match.text.split("::")[0],
                                     )
+                                    in terms
                                 ]
                             )
                         )
@@ -2339,7 +2480,7 @@ class CylleneusHit(Hit):
                 newfragments.append(fragment)
         return newfragments
 
-    def filter_by_score(self, query, termlists, fragments):
+    def filter_by_score(self, query, requirements, fragments):
         scored = []
         for fragment in fragments:
             if len(fragment.matches) != 0:
@@ -2348,19 +2489,16 @@ class CylleneusHit(Hit):
                     for match in fragment.matches
                 }
 
-                if len(fterms) != 0 and any(
-                    all(term in fterms for term in terms)
-                    for terms in termlists
-                ):
+                if len(fterms) != 0 and requirements.satisfied_by(fterms):
                     score = self.results.highlighter.scorer(query, fragment)
                     if score:
                         scored.append((score, fragment))
         return scored
 
     def filter_fragments(self, query, minscore: int = 1):
-        termlists = query_term_lists(query, self.reader)
+        requirements = self.results.requirements(query)
 
-        fieldnames = {term[0] for terms in termlists for term in terms}
+        fieldnames = {term[0] for term in requirements.terms}
         results = [
             fragment
             for fieldname in fieldnames
@@ -2380,7 +2518,7 @@ class CylleneusHit(Hit):
         Debug.print(Debug.MEDIUM, "- Merged fragments: {}".format(len(merged)))
 
         # Preserve same-analysis groupings in compound queries
-        filtered = self.filter_by_annotation(query, termlists, merged)
+        filtered = self.filter_by_annotation(query, requirements, merged)
         Debug.print(
             Debug.MEDIUM, "- Filtered by annotation: {}".format(len(filtered))
         )
@@ -2392,7 +2530,7 @@ class CylleneusHit(Hit):
         )
 
         # Keep only fragments that reach the minimum score threshold
-        scored = self.filter_by_score(query, termlists, filtered)
+        scored = self.filter_by_score(query, requirements, filtered)
         Debug.print(
             Debug.MEDIUM, "- Filtered by score: {}".format(len(scored))
         )
@@ -2650,10 +2788,11 @@ class CylleneusSearcher(Searcher):
 
         return c
 
-    def search(self, q, **kwargs):
+    def search(self, q, hitcontext=None, **kwargs):
         """Runs a :class:`whoosh.query.Query` object on this searcher and
-        returns a :class:`Results` object.
-        information.
+        returns a :class:`Results` object. The hits of the results share
+        ``hitcontext``, a :class:`HitContext`, if one is given, so that the
+        searches of several indexes can share one.
         """
 
         # Call the collector() method to build a collector based on the
@@ -2663,6 +2802,8 @@ class CylleneusSearcher(Searcher):
         # Call the lower-level method to run the collector
         self.search_with_collector(q, c)
         results = c.results()
+        if hitcontext is not None:
+            results.context = hitcontext
 
         if DEBUG_LEVEL and results:
             docixs = [hit["docix"] for hit in results]
@@ -2675,4 +2816,4 @@ class CylleneusSearcher(Searcher):
                 ),
             )
         # Return the results object from the collector
-        return c.results()
+        return results
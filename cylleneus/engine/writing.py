@@ -662,11 +662,12 @@ class SegmentWriter(IndexWriter):
                     creader = creader.raw_column()
                 cols[fieldname] = creader
 
-        for docnum, stored in reader.iter_docs():
+        for docnum in reader.all_doc_ids():
+            stored = reader.stored_fields(docnum)
             if docmap is not None:
-                docmap[docnum] = docnum
+                docmap[docnum] = self.docnum
 
-            pdw.start_doc(docnum)
+            pdw.start_doc(self.docnum)
             for fieldname in fieldnames:
                 fieldobj = schema[fieldname]
 
@@ -709,16 +710,70 @@ class SegmentWriter(IndexWriter):
 
     def add_document(self, **fields):
         self._check_state()
+        fieldnames = sorted(
+            [name for name in fields.keys() if not name.startswith("_")]
+        )
+        self._check_fields(self.schema, fieldnames)
+        self._add_document(fields, fieldnames)
+
+    def add_passages(self, depth=1, **fields):
+        """Adds a document as a series of documents, one for each passage of
+        it, where a passage is a value of its first ``depth`` divs (as given
+        by the "meta" of its tokens, e.g. each book of a work whose meta is
+        "book-line"). Fields whose postings hold the meta of each token are
+        divided between the passages, and every other field is added to every
+        passage whole, so that each passage is stored as the document it is
+        a passage of. Returns the number of passages added.
+        """
+
+        self._check_state()
+        schema = self.schema
+        fieldnames = sorted(
+            [name for name in fields.keys() if not name.startswith("_")]
+        )
+        self._check_fields(schema, fieldnames)
+
+        def passage(meta):
+            divs = meta.get("meta", "").split("-")[:depth]
+            return tuple(meta.get(div) for div in divs)
+
+        # Each field is analyzed once, for all of the passages
+        passages = {}
+        for fieldname in fieldnames:
+            field = schema[fieldname]
+            value = fields.get(fieldname)
+            if (
+                value is None
+                or not field.indexed
+                or not hasattr(field.format, "passage_values")
+            ):
+                continue
+            values = field.format.passage_values(
+                value,
+                field.analyzer,
+                passage,
+                mode="index",
+                docix=fields["docix"],
+            )
+            for key, items in values.items():
+                passages.setdefault(key, {})[fieldname] = items
+
+        if not passages:
+            self._add_document(fields, fieldnames)
+            return 1
+        for items in passages.values():
+            self._add_document(fields, fieldnames, items)
+        return len(passages)
+
+    def _add_document(self, fields, fieldnames, passage=None):
+        # Adds a document, or a passage of one, given the words of each of
+        # its fields that are divided between passages
         perdocwriter = self.perdocwriter
         schema = self.schema
         docnum = self.docnum
         add_post = self.pool.add
 
         docboost = self._doc_boost(fields)
-        fieldnames = sorted(
-            [name for name in fields.keys() if not name.startswith("_")]
-        )
-        self._check_fields(schema, fieldnames)
 
         perdocwriter.start_doc(docnum)
         for fieldname in fieldnames:
@@ -734,7 +789,13 @@ class SegmentWriter(IndexWriter):
                 fieldboost = self._field_boost(fields, fieldname, docboost)
                 # Ask the field to return a list of (text, weight, vbytes)
                 # tuples
-                items = field.index(value, docix=fields["docix"])
+                if passage is not None and fieldname in passage:
+                    items = [
+                        (utf8encode(text)[0], freq, weight, vbytes)
+                        for text, freq, weight, vbytes in passage[fieldname]
+                    ]
+                else:
+                    items = field.index(value, docix=fields["docix"])
 
                 # Only store the length if the field is marked scorable
                 scorable = field.scorable
@@ -756,9 +817,16 @@ class SegmentWriter(IndexWriter):
             if vformat:
                 analyzer = field.analyzer
                 # Call the format's word_values method to get posting values
-                vitems = vformat.word_values(
-                    value, analyzer, mode="index", docix=fields["docix"]
-                )
+                if (
+                    passage is not None
+                    and fieldname in passage
+                    and vformat is field.format
+                ):
+                    vitems = passage[fieldname]
+                else:
+                    vitems = vformat.word_values(
+                        value, analyzer, mode="index", docix=fields["docix"]
+                    )
                 # Remove unused frequency field from the tuple
                 vitems = sorted(
                     (text, weight, vbytes)
@@ -7441,25 +7441,15 @@ copulas = [
 ]
 
 
+# Use the compiled tables of cylleneus.lang.lat.lexicon, which look forms up
+# in constant time
 def is_ppp(token: str):
-    for gender in endings:
-        for number in endings[gender]:
-            for case in endings[gender][number]:
-                if (
-                    token.endswith(case)
-                    and token.rsplit(case, 1)[0] in past_participles
-                ):
-                    return gender, number
-    else:
-        return None
+    from .lexicon import is_ppp
+
+    return is_ppp(token)
 
 
 def is_copula(token: str):
-    for tense in copula:
-        for mood in copula[tense]:
-            for number in copula[tense][mood]:
-                for ix, form in enumerate(copula[tense][mood][number]):
-                    if token == form:
-                        return tense, mood, number, ix
-    else:
-        return None
+    from .lexicon import is_copula
+
+    return is_copula(token)
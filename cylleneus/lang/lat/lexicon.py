@@ -0,0 +1,118 @@
+"""Compiled lookup tables for the Latin lexical resources used when
+tokenizing: hashed sets of proper names and exceptions, the inflected forms
+of the past participles and an inverted map of the forms of the copula.
+
+The tables are compiled once and cached on disk, and are recompiled whenever
+one of the resources they are compiled from changes."""
+
+import os
+import pickle
+from pathlib import Path
+
+from cylleneus import settings
+from cylleneus.utils import Debug
+
+CACHE_FILE = Path(settings.CACHE_DIR) / "lat_lexicon.pickle"
+
+# Modules the tables are compiled from
+SOURCES = [
+    Path(__file__).parent / name
+    for name in [
+        "__init__.py",
+        "compound.py",
+        "latin_exceptions.py",
+        "proper_names.py",
+        "lexicon.py",
+    ]
+]
+
+
+def _version():
+    return [
+        (source.name, source.stat().st_size, source.stat().st_mtime_ns)
+        for source in SOURCES
+    ]
+
+
+def compile_tables():
+    """Compiles the lookup tables from the lexical resources."""
+
+    # Imported only when compiling, as the resources are slow to load
+    from . import compound, exceptions as _exceptions, proper_names
+    from .latin_exceptions import latin_exceptions as _latin_exceptions
+
+    # Each form maps to the first gender and number, in order of the endings,
+    # whose ending it bears on one of the stems
+    participles = {}
+    stems = set(compound.past_participles)
+    for gender in compound.endings:
+        for number in compound.endings[gender]:
+            for case in compound.endings[gender][number]:
+                for stem in stems:
+                    participles.setdefault(stem + case, (gender, number))
+
+    copulas = {}
+    for tense in compound.copula:
+        for mood in compound.copula[tense]:
+            for number in compound.copula[tense][mood]:
+                for ix, form in enumerate(compound.copula[tense][mood][number]):
+                    copulas.setdefault(form, (tense, mood, number, ix))
+
+    return {
+        "proper_names":     frozenset(proper_names.proper_names),
+        "exceptions":       frozenset(_exceptions),
+        "latin_exceptions": frozenset(_latin_exceptions),
+        "participles":      participles,
+        "copulas":          copulas,
+    }
+
+
+def load_tables(path: Path = CACHE_FILE):
+    """Loads the lookup tables from the cache, compiling and caching them if
+    they are missing or out of date."""
+
+    version = _version()
+    try:
+        with open(path, "rb") as fp:
+            cached = pickle.load(fp)
+        if cached["version"] == version:
+            return cached["tables"]
+    except (OSError, EOFError, KeyError, pickle.UnpicklingError):
+        pass
+
+    tables = compile_tables()
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp, "wb") as fp:
+            pickle.dump(
+                {"version": version, "tables": tables},
+                fp,
+                protocol=pickle.HIGHEST_PROTOCOL,
+            )
+        os.replace(tmp, path)
+    except OSError as e:
+        Debug.print(Debug.MEDIUM, f"- Could not cache Latin lexicon: {e}")
+    return tables
+
+
+_tables = load_tables()
+
+proper_names = _tables["proper_names"]
+exceptions = _tables["exceptions"]
+latin_exceptions = _tables["latin_exceptions"]
+participles = _tables["participles"]
+copulas = _tables["copulas"]
+
+
+def is_ppp(token: str):
+    """Returns the gender and number of a form of a past participle, or None."""
+
+    return participles.get(token)
+
+
+def is_copula(token: str):
+    """Returns the tense, mood and number of a form of the copula, and its
+    index among the forms, or None."""
+
+    return copulas.get(token)
@@ -1,7 +1,10 @@
 import codecs
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
 import json
 import re
 from datetime import datetime
+from itertools import islice
 from math import ceil
 from pathlib import Path
 from typing import Iterable
@@ -10,7 +13,8 @@ import docx
 import safer
 
 from cylleneus import __version__, settings
-from cylleneus.corpus.core import Corpus, Work
+from cylleneus.corpus.core import Corpus, Work, corpora
+from cylleneus.corpus.indexer import pool
 from cylleneus.engine import scoring
 from cylleneus.engine.highlight import (
     CylleneusBasicFragmentScorer,
@@ -18,8 +22,8 @@ from cylleneus.engine.highlight import (
     CylleneusPinpointFragmenter,
 )
 from cylleneus.engine.qparser.default import CylleneusQueryParser
-from cylleneus.engine.searching import CylleneusSearcher, HitRef
-from cylleneus.utils import Debug, slugify
+from cylleneus.engine.searching import CylleneusSearcher, HitContext, HitRef
+from cylleneus.utils import Debug, LRUCache, slugify
 
 
 class Collection:
@@ -77,7 +81,7 @@ class Collection:
 
         if name in collections:
             self.works = [
-                Corpus(corpus).work_by_docix(docix)
+                corpora[corpus].work_by_docix(docix)
                 for corpus, docixs in collections[name]
                 for docix in docixs
             ]
@@ -110,9 +114,17 @@ class Collection:
 
 
 class Searcher:
-    def __init__(self, collection: Collection = None):
+    def __init__(
+        self,
+        collection: Collection = None,
+        jobs: int = settings.SEARCH_JOBS,
+        backend: str = settings.SEARCH_BACKEND,
+    ):
         self._searches = []
         self._collection = collection
+        self._queries = LRUCache(settings.QUERY_CACHE_SIZE)
+        self.jobs = jobs
+        self.backend = backend
 
     @property
     def collection(self):
@@ -125,11 +137,81 @@ class Searcher:
     def search(self, spec: str, minscore=None):
         """ Execute the specified search specification """
 
-        search = Search(spec, self.collection, minscore=minscore)
+        search = Search(
+            spec,
+            self.collection,
+            minscore=minscore,
+            queries=self._queries,
+            jobs=self.jobs,
+            backend=self.backend,
+        )
         _ = search.run()
         self.searches.append(search)
         return search
 
+    def stream(
+        self, spec: str, minscore=None, offset: int = 0, page_size: int = None
+    ):
+        """ Execute the specified search specification, yielding a page of
+        highlights as they are produced (see `Search.stream`) """
+
+        search = Search(
+            spec, self.collection, minscore=minscore, queries=self._queries
+        )
+        self.searches.append(search)
+        return search.stream(offset=offset, page_size=page_size)
+
+    def search_many(self, specs: Iterable[str], minscore=None):
+        """ Execute several search specifications at once, returning the
+        searches by specification. The specifications are all parsed up
+        front, sharing the lookups of the terms they have in common, and each
+        index of the collection is opened once and searched for all of
+        them """
+
+        specs = list(dict.fromkeys(specs))
+        searches = {
+            spec: Search(
+                spec, self.collection, minscore=minscore, queries=self._queries
+            )
+            for spec in specs
+        }
+        if not searches:
+            return searches
+
+        start_dt = datetime.now()
+        results = {spec: [] for spec in specs}
+        parsers = {}
+        for corpus, path, indexname, docnums in searches[specs[0]]._shards():
+            if corpus.name not in parsers:
+                parser = CylleneusQueryParser("form", corpus.schema)
+                for spec in specs:
+                    _parse(corpus, spec, self._queries, parser=parser)
+                parsers[corpus.name] = parser
+
+            reader = pool.reader(path, corpus.schema, indexname)
+            if reader is None:
+                continue
+            with CylleneusSearcher(
+                reader, weighting=scoring.NullWeighting, closereader=False
+            ) as searcher:
+                for spec, search in searches.items():
+                    search.query = search.parse(corpus)
+                    results[spec] += _search_highlights(
+                        searcher,
+                        search.query,
+                        docnums,
+                        search.options,
+                        search.context,
+                    )
+        end_dt = datetime.now()
+
+        for spec, search in searches.items():
+            search.start_dt = start_dt
+            search.end_dt = end_dt
+            search.results = results[spec]
+            self.searches.append(search)
+        return searches
+
     @property
     def searches(self):
         return self._searches
@@ -145,12 +227,23 @@ class Search:
         spec: str,
         collection: Collection,
         minscore=None,
-        top=1000000
+        top=1000000,
+        queries=None,
+        jobs: int = 1,
+        backend: str = "thread",
     ):
         self._spec = spec
         self._collection = collection
         self._minscore = minscore
         self._top = top
+        # Parsed queries by (corpus, spec)
+        self._queries = queries if queries is not None else {}
+        # Worker threads or processes among which the indexes of the
+        # collection are searched by `run`
+        if backend not in ("thread", "process"):
+            raise ValueError(f"unknown search backend: {backend}")
+        self.jobs = jobs
+        self.backend = backend
 
         self._query = None
         self._start_dt = None
@@ -158,6 +251,8 @@ class Search:
         self._results = None
         self._count = None
         self._highlights = None
+        # WordNet clients and lookups shared by the hits of every index
+        self.context = HitContext()
 
         self._maxchars = 70  # width of one line
         self._surround = (
@@ -171,7 +266,7 @@ class Search:
             spec=obj["spec"],
             collection=Collection(
                 works=[
-                    Corpus(corpus).work_by_docix(docix)
+                    corpora[corpus].work_by_docix(docix)
                     for corpus, docix in obj["collection"]
                 ]
             ),
@@ -273,12 +368,7 @@ class Search:
             self._highlights = []
             if self.results:
                 for hit, meta, fragment in self.results:
-                    c = Corpus(hit["corpus"])
-                    corpus, author, title, urn, reference, text = c.fetch(
-                        hit, meta, fragment
-                    )
-                    href = HitRef(corpus, author, title, urn, reference, text)
-                    self._highlights.append(href)
+                    self._highlights.append(_fetch(hit, meta, fragment))
         yield from self._highlights
 
     @highlights.setter
@@ -448,48 +538,133 @@ class Search:
 
     def run(self):
         self.start_dt = datetime.now()
-        self.results = []
+        if self.jobs > 1:
+            self._run_parallel()
+        else:
+            self.results = list(self.iter_results())
+        self.end_dt = datetime.now()
+        return self.count
 
-        for work in self.collection:
-            if work.searchable:
-                parser = CylleneusQueryParser("form", work.corpus.schema)
-                self.query = parser.parse(self.spec)
-                Debug.print(Debug.LOW, "Query: {}".format(self.query))
-
-                for ix in work.indexes:
-                    reader = ix.reader()
-                    with CylleneusSearcher(
-                        reader, weighting=scoring.NullWeighting
-                    ) as searcher:
-                        results = searcher.search(
-                            self.query, terms=True, limit=None
-                        )
+    def _run_parallel(self):
+        # Each index is searched, and its highlights fetched, by one of the
+        # workers, and the results are merged in the order of the indexes.
+        # The query is parsed here, once for each corpus, and shipped to the
+        # workers with each index
+        shards = []
+        for corpus, path, indexname, docnums in self._shards():
+            self.query = self.parse(corpus)
+            shards.append((corpus.name, path, indexname, docnums, self.query))
+
+        # Worker processes share a context of their own
+        if self.backend == "process":
+            executor, context = ProcessPoolExecutor, None
+        else:
+            executor, context = ThreadPoolExecutor, self.context
+        search = partial(_search_shard, self.options, context=context)
+
+        results, highlights = [], []
+        with executor(max_workers=self.jobs) as ex:
+            for shard in ex.map(search, shards):
+                for fields, meta, fragment, href in shard:
+                    results.append((fields, meta, fragment))
+                    highlights.append(href)
+        self.results = results
+        self.highlights = highlights
+
+    def stream(self, offset: int = 0, page_size: int = None):
+        """Yields the highlights of the search, as `HitRef`s, from ``offset``
+        and at most ``page_size`` of them. Works are searched one by one as
+        highlights are consumed, so the search stops as soon as the page is
+        filled, and only the highlights of the page are fetched. The results
+        are not kept, so `count` does not apply; see `estimate`."""
 
-                        if results:
-                            results.fragmenter = CylleneusPinpointFragmenter(
-                                autotrim=True,
-                                charlimit=None,
-                                maxchars=self.maxchars,
-                                surround=self.surround,
-                            )
-                            results.scorer = CylleneusBasicFragmentScorer()
-                            results.formatter = CylleneusDefaultFormatter()
-
-                            for hit in sorted(
-                                results,
-                                key=lambda x: (
-                                    x["corpus"],
-                                    x["author"],
-                                    x["title"],
-                                ),
-                            ):
-                                self.results += hit.highlights(
-                                    fieldname="content",
-                                    top=self.top,
-                                    minscore=self.minscore,
-                                )
+        self.start_dt = datetime.now()
+        stop = offset + page_size if page_size is not None else None
+        for hit, meta, fragment in islice(self.iter_results(), offset, stop):
+            yield _fetch(hit, meta, fragment)
         self.end_dt = datetime.now()
-        return self.count
+
+    def estimate(self):
+        """Counts the documents and corpora matched by the search, without
+        highlighting any matches."""
+
+        docs = set()
+        for corpus, path, indexname, docnums in self._shards():
+            query = self.parse(corpus)
+            reader = pool.reader(path, corpus.schema, indexname)
+            if reader is None:
+                continue
+            with CylleneusSearcher(
+                reader, weighting=scoring.NullWeighting, closereader=False
+            ) as searcher:
+                for hit in searcher.search(query, limit=None, filter=docnums):
+                    docs.add((hit["corpus"], hit["docix"]))
+        return len(docs), len({corpus for corpus, _ in docs})
+
+    def iter_results(self):
+        """Yields the results of the search, each a hit with the meta and text
+        of one of its highlights, work by work."""
+
+        for corpus, path, indexname, docnums in self._shards():
+            self.query = self.parse(corpus)
+            # Readers are pooled, and stay open for later searches
+            reader = pool.reader(path, corpus.schema, indexname)
+            if reader is not None:
+                yield from _highlights(
+                    reader, self.query, docnums, self.options, self.context
+                )
+
+    def _shards(self):
+        # The indexes of the works of the collection, as the corpus, path and
+        # name of each, with the documents, if not all, to search in it
+        merged = {}
+        for work in self.collection:
+            # Works in corpora with a consolidated index are searched
+            # together, as a filter on the documents of that index. Whether
+            # a corpus has one is checked once
+            corpus = work.corpus
+            if corpus.name not in merged:
+                merged[corpus.name] = (
+                    (corpus, set()) if corpus.merged else None
+                )
+            if merged[corpus.name] is not None:
+                _, docixs = merged[corpus.name]
+                docixs.update(work.docix or [])
+            elif work.searchable:
+                for indexname in work.indexer.indexnames:
+                    yield corpus, work.indexer.path, indexname, None
+
+        for item in merged.values():
+            if item is None:
+                continue
+            corpus, docixs = item
+            docnums_by_docix = corpus.merged_docnums
+            docnums = {
+                docnum
+                for docix in docixs
+                for docnum in docnums_by_docix.get(docix, [])
+            }
+            if len(docnums) == corpus.merged_reader.doc_count():
+                docnums = None
+            yield corpus, corpus.merged_dir, corpus.name, docnums
+
+    @property
+    def options(self):
+        """The options of the search that determine its highlights."""
+
+        return {
+            "top":      self.top,
+            "minscore": self.minscore,
+            "maxchars": self.maxchars,
+            "surround": self.surround,
+        }
+
+    def parse(self, corpus: Corpus):
+        """Parse the search specification against the schema of a corpus. The
+        parsed query, whose terms may have been expanded by lexical lookups, is
+        reused for every work of the corpus."""
+
+        return _parse(corpus, self.spec, self._queries)
 
     @property
     def query(self):
@@ -511,3 +686,98 @@ class Search:
 
     def __bool__(self):
         return any(self.count)
+
+
+def _parse(corpus: Corpus, spec: str, queries, parser=None):
+    key = (corpus.name, spec)
+    query = queries.get(key)
+    if query is None:
+        if parser is None:
+            parser = CylleneusQueryParser("form", corpus.schema)
+        query = parser.parse(spec)
+        queries[key] = query
+        Debug.print(Debug.LOW, "Query: {}".format(query))
+    return query
+
+
+def _highlights(reader, query, docnums: set, options: dict, context=None):
+    # Each hit of a query in a reader with the meta and text of each of its
+    # highlights, in order of corpus, author and title
+    with CylleneusSearcher(
+        reader, weighting=scoring.NullWeighting, closereader=False
+    ) as searcher:
+        yield from _search_highlights(
+            searcher, query, docnums, options, context
+        )
+
+
+def _search_highlights(
+    searcher, query, docnums: set, options: dict, context=None
+):
+    # When works are indexed by passage (see settings.INDEX_PASSAGES), each
+    # passage is a hit of its own, and `top` caps the highlights of each
+    # passage. The hits are not limited, since any of them may yet be
+    # dropped by the filters on its fragments: a search is cut short only
+    # by streaming it
+    results = searcher.search(
+        query, hitcontext=context, terms=True, limit=None, filter=docnums
+    )
+
+    if results:
+        results.fragmenter = CylleneusPinpointFragmenter(
+            autotrim=True,
+            charlimit=None,
+            maxchars=options["maxchars"],
+            surround=options["surround"],
+        )
+        results.scorer = CylleneusBasicFragmentScorer()
+        results.formatter = CylleneusDefaultFormatter()
+
+        for hit in sorted(
+            results, key=lambda x: (x["corpus"], x["author"], x["title"],),
+        ):
+            yield from hit.highlights(
+                fieldname="content",
+                top=options["top"],
+                minscore=options["minscore"],
+            )
+
+
+def _fetch(hit, meta, fragment):
+    corpus, author, title, urn, reference, text = corpora[hit["corpus"]].fetch(
+        hit, meta, fragment
+    )
+    return HitRef(corpus, author, title, urn, reference, text)
+
+
+# The context shared by the hits searched by a worker process
+_worker_context = None
+
+
+def _search_shard(options: dict, shard: tuple, context=None):
+    # Searches one index for a parsed query, in a worker thread or process,
+    # and fetches its highlights. The stored fields of each hit stand for the
+    # hit, so that results can be returned from another process
+    name, path, indexname, docnums, query = shard
+    corpus = corpora[name]
+    if context is None:
+        global _worker_context
+        if _worker_context is None:
+            _worker_context = HitContext()
+        context = _worker_context
+
+    # Pooled readers are not safe to share between threads, so each search
+    # opens a reader of its own
+    ix = pool.index(path, corpus.schema, indexname)
+    if ix is None:
+        return []
+    reader = ix.reader()
+    try:
+        return [
+            (dict(hit.fields()), meta, fragment, _fetch(hit, meta, fragment))
+            for hit, meta, fragment in _highlights(
+                reader, query, docnums, options, context
+            )
+        ]
+    finally:
+        reader.close()
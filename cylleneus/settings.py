@@ -15,7 +15,22 @@ ROOT_DIR = os.path.dirname(os.path.abspath(__path__[0]))
 # Corpus settings
 CORPUS_DIR = user_data_dir("corpus", "Cylleneus")
 
+# Analysis settings
+CACHE_DIR = os.path.join(CORPUS_DIR, ".cache")
+LEMMA_CACHE = True
+LEMMA_CACHE_SIZE = 1000000  # maximum number of cached word forms
+LEMMA_CACHE_WARM = 100000  # most recently used forms preloaded into memory
+WORDNET_CHUNK_SIZE = 500  # distinct lookups resolved per bulk request
+WORDNET_WORKERS = 8  # concurrent WordNet requests per bulk request
+
 # Search settings
+QUERY_CACHE_SIZE = 256  # parsed queries kept by each Searcher
+INDEX_POOL_SIZE = 256  # indexes kept open, with their readers, per process
+TEXT_CACHE_SIZE = 256  # MB of source texts kept parsed for rendering hits
+WORK_CACHE_SIZE = 4096  # works kept, by docix, by each corpus
+SEARCH_JOBS = 1  # workers among which a collection's indexes are searched
+SEARCH_BACKEND = "thread"  # "thread" or "process"
+INDEX_PASSAGES = 0  # depth of the divs by which works are indexed as passages (0 for whole works)
 LINES_OF_CONTEXT = 2
 CHARS_OF_CONTEXT = LINES_OF_CONTEXT * 70
 
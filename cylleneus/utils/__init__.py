@@ -1,7 +1,9 @@
 import math
 import re
 import sys
+import threading
 import unicodedata
+from collections import OrderedDict
 from collections.abc import Iterable, Mapping
 from datetime import datetime
 from enum import IntEnum
@@ -319,6 +321,83 @@ class hdict(dict):
         return hash(tuple(sorted(self.items())))
 
 
+# Size-bounded mapping
+class LRUCache:
+    """A thread-safe mapping that holds at most ``maxsize`` items, discarding
+    the least recently used item when full. If given, ``sizeof`` is called
+    with each value to weigh it, and ``maxsize`` bounds the total weight
+    instead, though the most recent item is always kept. If given,
+    ``callback`` is called with the key and value of each discarded item."""
+
+    def __init__(self, maxsize: int = 128, callback=None, sizeof=None):
+        self.maxsize = maxsize
+        self.callback = callback
+        self.sizeof = sizeof
+        self.size = 0
+        self._items = OrderedDict()
+        self._sizes = {}
+        self._lock = threading.RLock()
+
+    def get(self, key, default=None):
+        with self._lock:
+            if key not in self._items:
+                return default
+            self._items.move_to_end(key)
+            return self._items[key]
+
+    def __getitem__(self, key):
+        with self._lock:
+            value = self._items[key]
+            self._items.move_to_end(key)
+            return value
+
+    def __setitem__(self, key, value):
+        with self._lock:
+            if key in self._items:
+                self.size -= self._sizes.pop(key)
+            self._items[key] = value
+            self._items.move_to_end(key)
+            self._sizes[key] = self.sizeof(value) if self.sizeof else 1
+            self.size += self._sizes[key]
+            while self.size > self.maxsize and len(self._items) > 1:
+                discarded = self._items.popitem(last=False)
+                self.size -= self._sizes.pop(discarded[0])
+                if self.callback:
+                    self.callback(*discarded)
+
+    def __delitem__(self, key):
+        with self._lock:
+            del self._items[key]
+            self.size -= self._sizes.pop(key)
+
+    def pop(self, key, default=None):
+        with self._lock:
+            if key not in self._items:
+                return default
+            self.size -= self._sizes.pop(key)
+            return self._items.pop(key)
+
+    def __contains__(self, key):
+        return key in self._items
+
+    def __len__(self):
+        return len(self._items)
+
+    def keys(self):
+        with self._lock:
+            return list(self._items.keys())
+
+    def values(self):
+        with self._lock:
+            return list(self._items.values())
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+            self._sizes.clear()
+            self.size = 0
+
+
 def nested_dict_iter(nested, path=None):
     if not path:
         path = []
@@ -0,0 +1,158 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Fixtures shared by the tests: tokens, a tokenizer of plain text, and a
+corpus of plain texts to index and search."""
+
+
+import codecs
+import re
+import shutil
+import tempfile
+import unittest
+from datetime import datetime
+from pathlib import Path
+from unittest import mock
+
+from cylleneus import settings
+from cylleneus.corpus.meta import CorpusDescriptor, CorpusMeta, manifest
+from cylleneus.corpus.preprocessing import BasePreprocessor
+from cylleneus.corpus.texts import lines, texts
+from cylleneus.engine.analysis.acore import CylleneusToken
+from cylleneus.engine.analysis.tokenizers import Tokenizer
+from cylleneus.engine.fields import FORM, STORED
+from cylleneus.engine.schemas import BaseSchema
+
+
+def make_token(text, pos, meta=None, **kwargs):
+    """Returns a token of ``text`` at ``pos``, starting ten characters to a
+    position unless ``startchar`` is given."""
+
+    kwargs.setdefault("startchar", pos * 10)
+    kwargs.setdefault("endchar", kwargs["startchar"] + len(text))
+    return CylleneusToken(text=text, pos=pos, meta=meta or {}, **kwargs)
+
+
+class SpaceTokenizer(Tokenizer):
+    """Tokenizes text on whitespace. The meta of each token is its line,
+    numbered from 1, and its position in the line."""
+
+    def __call__(self, value, positions=False, chars=False, mode="", **kwargs):
+        pos = offset = 0
+        for line, text in enumerate(value.splitlines(keepends=True), start=1):
+            for i, word in enumerate(re.finditer(r"\S+", text)):
+                yield make_token(
+                    word.group(),
+                    pos,
+                    {
+                        "meta":     "line",
+                        "line":     str(line),
+                        "sent_id":  str(line),
+                        "sent_pos": str(i),
+                    },
+                    startchar=offset + word.start(),
+                    endchar=offset + word.end(),
+                    positions=positions,
+                    chars=chars,
+                    mode=mode,
+                )
+                pos += 1
+            offset += len(text)
+
+
+class DocumentSchema(BaseSchema):
+    meta = STORED()
+    urn = STORED()
+    form = FORM(analyzer=SpaceTokenizer(), vector=True)
+
+
+class Preprocessor(BasePreprocessor):
+    def parse(self, file: Path):
+        path = file.relative_to(self.corpus.text_dir)
+        with codecs.open(file, "r", "utf8") as fp:
+            doc = fp.read()
+
+        return {
+            "author":   path.parent.name,
+            "title":    path.stem,
+            "language": "lat",
+            "meta":     "line",
+            "urn":      f"urn:test:{path.parent.name}.{path.stem}",
+            "form":     doc,
+            "filename": path.as_posix(),
+            "datetime": datetime.now(),
+        }
+
+
+def fetch(work, meta, fragment):
+    _, file = work.filename[0]
+    content = texts.load(work.corpus.name, work.corpus.text_dir / file, lines)
+
+    start, end = int(meta["start"]["line"]), int(meta["end"]["line"])
+    reference = f"line: {start}" if start == end else f"line: {start}-{end}"
+
+    hlites = {(hlite["line"], hlite["sent_pos"]) for hlite in meta["hlites"]}
+    text = "\n".join(
+        " ".join(
+            f"<em>{word}</em>" if (str(line), str(i)) in hlites else word
+            for i, word in enumerate(content[line - 1].split())
+        )
+        for line in range(start, end + 1)
+    )
+    _, urn = work.urn[0]
+
+    return urn, reference, text
+
+
+meta = CorpusMeta(
+    "Test corpus",
+    "lat",
+    DocumentSchema,
+    SpaceTokenizer,
+    Preprocessor,
+    "*/*.txt",
+    fetch,
+    {"location": "local"},
+)
+
+
+class CorpusTestCase(unittest.TestCase):
+    """Sets up a corpus named 'test', of plain texts by author and title, in a
+    corpus directory of its own."""
+
+    def setUp(self):
+        """Set up test fixtures, if any."""
+
+        from cylleneus.corpus.core import corpora
+        from cylleneus.corpus.indexer import pool
+
+        self.tmpdir = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.tmpdir)
+        for patch in (
+            mock.patch.object(settings, "CORPUS_DIR", self.tmpdir),
+            mock.patch("cylleneus.corpus.indexer.CORPUS_DIR", self.tmpdir),
+            mock.patch.dict(
+                manifest.descriptors,
+                test=CorpusDescriptor(
+                    "test", __name__, meta.description, meta.language,
+                    meta.glob, meta.repo,
+                ),
+            ),
+            mock.patch.dict(manifest._metas, test=meta),
+        ):
+            patch.start()
+            self.addCleanup(patch.stop)
+        self.addCleanup(corpora.discard, "test")
+        self.addCleanup(pool.clear)
+        self.addCleanup(texts.clear)
+
+    def add_texts(self, works: dict):
+        """Writes the text of each (author, title) of ``works`` to the text
+        directory of the corpus."""
+
+        from cylleneus.corpus.core import corpora
+
+        for (author, title), text in works.items():
+            path = corpora["test"].text_dir / author / f"{title}.txt"
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(text, encoding="utf8")
@@ -0,0 +1,54 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Tests for the analysis pipeline."""
+
+
+import unittest
+
+
+class TestAnalysis(unittest.TestCase):
+    """Tests for `cylleneus.engine.analysis`."""
+
+    def test_replay(self):
+        """Test that cached tokens are replayed as independent copies."""
+
+        from cylleneus.engine.analysis.acore import CylleneusToken, replay
+
+        cache = []
+        t = CylleneusToken(mode="index")
+        for i, text in enumerate(["arma", "uirumque", "cano"]):
+            t.text = text
+            t.meta = {"meta": "line", "line": str(i + 1)}
+            cache.append(t.copy())
+
+        for field in ["form", "lemma"]:
+            tokens = list(replay(cache))
+            assert [t.text for t in tokens] == ["arma", "uirumque", "cano"]
+            assert [t.meta["line"] for t in tokens] == ["1", "2", "3"]
+            for t in tokens:
+                t.text = field
+        assert [t.text for t in cache] == ["arma", "uirumque", "cano"]
+
+    def test_shared_filter(self):
+        """Test that a filter shared by several fields runs once per document."""
+
+        from cylleneus.engine.analysis.acore import CylleneusToken
+        from cylleneus.engine.analysis.filters import CachedSynsetFilter
+        from cylleneus.engine.analysis.lookups import LocalBackend
+
+        def tokens():
+            t = CylleneusToken(mode="index")
+            t.text = "cano:c0480=v1spia--3-"
+            yield t
+
+        backend = LocalBackend([])
+        Synsets = CachedSynsetFilter(backend=backend)
+        for field in ["synset", "semfield"]:
+            for t in Synsets(tokens(), docix=0):
+                assert t.text == ""
+                t.text = field
+        assert backend.requests == 1
+
+        list(Synsets(tokens(), docix=1))
+        assert backend.requests == 2
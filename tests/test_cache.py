@@ -0,0 +1,86 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Tests for the persistent analysis caches."""
+
+
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+
+class TestPersistentCache(unittest.TestCase):
+    """Tests for `cylleneus.engine.analysis.cache`."""
+
+    def setUp(self):
+        """Set up test fixtures, if any."""
+
+        self.tmpdir = tempfile.mkdtemp()
+        self.path = Path(self.tmpdir) / "cache.db"
+
+    def tearDown(self):
+        """Tear down test fixtures, if any."""
+
+        shutil.rmtree(self.tmpdir)
+
+    def test_persistence(self):
+        """Test that entries survive re-opening the cache."""
+
+        from cylleneus.engine.analysis.cache import PersistentCache
+
+        cache = PersistentCache(self.path)
+        cache["arma"] = [{"lemma": {"lemma": "arma", "uri": "a2156"}}]
+        cache["virumque"] = []
+        cache.close()
+
+        cache = PersistentCache(self.path, warm=1)
+        assert len(cache) == 2
+        assert cache.nbytes > 0
+        assert cache["virumque"] == []
+        assert cache.get("arma")[0]["lemma"]["uri"] == "a2156"
+        assert cache.get("cano") is None
+        assert "cano" not in cache
+        cache.close()
+
+    def test_eviction(self):
+        """Test that the least recently used entries are evicted."""
+
+        from cylleneus.engine.analysis.cache import PersistentCache
+
+        cache = PersistentCache(self.path, maxsize=10, lowater=0.5, sync_every=1)
+        for i in range(10):
+            cache[str(i)] = i
+        assert len(cache) == 10
+
+        cache["10"] = 10
+        assert len(cache) == 5
+        assert cache.get("10") == 10
+        assert "0" not in cache
+        cache.close()
+
+    def test_lemmatize(self):
+        """Test that only forms with lemmas are cached, so that a failed
+        lookup is tried again."""
+
+        from cylleneus import settings
+        from cylleneus.engine.analysis import filters
+        from cylleneus.engine.analysis.cache import PersistentCache
+
+        cache = PersistentCache(self.path)
+        lemmas = [{"lemma": {"lemma": "arma", "uri": "a2156"}}]
+        with mock.patch.object(settings, "LEMMA_CACHE", True), mock.patch.multiple(
+            filters, LEMMA_CACHE=cache, LWN=mock.DEFAULT
+        ) as patched:
+            patched["LWN"].lemmatize.side_effect = [[], lemmas]
+            assert filters.lemmatize("arma") == []
+            assert "arma" not in cache
+            assert filters.lemmatize("arma") == lemmas
+            assert filters.lemmatize("arma") == lemmas
+            assert patched["LWN"].lemmatize.call_count == 2
+        cache.close()
+
+        cache = PersistentCache(self.path)
+        assert cache["arma"] == lemmas
+        cache.close()
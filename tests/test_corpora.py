@@ -0,0 +1,154 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Tests for the corpora shared by the process."""
+
+
+import os
+import shutil
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+
+def init_worker(name):
+    pass
+
+
+def from_file(path, docix, destructive, optimize, limitmb):
+    # Stands in for indexing a work in a worker process
+    if path.stem == "broken":
+        raise ValueError(path.name)
+    time.sleep(0.2)
+    slug = path.stem
+    return (
+        docix,
+        {
+            "author":   "Vergil",
+            "title":    slug,
+            "filename": path.name,
+            "path":     f"lat/latin_library/index/vergil/{slug}",
+            "index":    [f"_latin_library_vergil_{slug}_{docix}_1.toc"],
+        },
+        {"docix": docix, "author": "Vergil", "title": slug},
+    )
+
+
+class TestCorpusRegistry(unittest.TestCase):
+    """Tests for `cylleneus.corpus.core.CorpusRegistry`."""
+
+    def setUp(self):
+        """Set up test fixtures, if any."""
+
+        self.tmpdir = Path(tempfile.mkdtemp())
+
+    def tearDown(self):
+        """Tear down test fixtures, if any."""
+
+        shutil.rmtree(self.tmpdir)
+
+    def test_registry(self):
+        """Test that corpora and their works are shared until the manifest is
+        changed by another instance."""
+
+        from cylleneus import settings
+        from cylleneus.corpus.core import CorpusRegistry
+
+        with mock.patch.object(settings, "CORPUS_DIR", str(self.tmpdir)):
+            corpora = CorpusRegistry()
+            corpus = corpora["latin_library"]
+            assert corpora["latin_library"] is corpus
+            assert corpus.work_by_docix(0) is None
+
+            corpus.update_manifest(
+                0,
+                {
+                    "author":   "Vergil",
+                    "title":    "Aeneid",
+                    "filename": "vergil/aen.txt",
+                    "path":     "lat/latin_library/index/vergil/aeneid",
+                    "index":    ["_latin_library_vergil_aeneid_0_1.toc", "a.seg"],
+                },
+                doc={"docix": 0, "author": "Vergil", "title": "Aeneid"},
+            )
+            assert corpora["latin_library"] is corpus
+            work = corpus.work_by_docix(0)
+            assert (work.author, work.title) == ("Vergil", "Aeneid")
+            assert corpus.work_by_docix("0") is work
+
+            manifest_file = corpus.path / "manifest.json"
+            manifest_file.write_text("{}")
+            stat = manifest_file.stat()
+            os.utime(
+                manifest_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1000000)
+            )
+            assert corpus.stale
+            other = corpora["latin_library"]
+            assert other is not corpus and other.manifest == {}
+            assert corpora["latin_library"] is other
+
+
+class TestCorpusCreate(unittest.TestCase):
+    """Tests for `cylleneus.corpus.core.Corpus.create`."""
+
+    def setUp(self):
+        """Set up test fixtures, if any."""
+
+        self.tmpdir = Path(tempfile.mkdtemp())
+
+    def tearDown(self):
+        """Tear down test fixtures, if any."""
+
+        shutil.rmtree(self.tmpdir)
+
+    def test_failure(self):
+        """Test that a work failing to be indexed is raised only once every
+        other work is in the manifest."""
+
+        from cylleneus import settings
+        from cylleneus.corpus import core
+
+        with mock.patch.object(
+            settings, "CORPUS_DIR", str(self.tmpdir)
+        ), mock.patch.multiple(
+            core, _init_worker=init_worker, _from_file=from_file
+        ):
+            corpus = core.Corpus("latin_library")
+            (corpus.text_dir / "vergil").mkdir(parents=True)
+            for name in ("aeneid", "broken", "eclogues", "georgics"):
+                (corpus.text_dir / "vergil" / f"{name}.txt").write_text("arma")
+
+            with self.assertRaises(ValueError):
+                corpus.create(jobs=2)
+            assert sorted(
+                work["title"] for work in corpus.manifest.values()
+            ) == ["aeneid", "eclogues", "georgics"]
+            assert corpus.docs.doc(2)["title"] == "eclogues"
+
+            other = core.Corpus("latin_library")
+            assert other.manifest == corpus.manifest
+
+    def test_renumber(self):
+        """Test that works already in the manifest keep their docix, and new
+        works are numbered after them."""
+
+        from cylleneus import settings
+        from cylleneus.corpus import core
+
+        with mock.patch.object(
+            settings, "CORPUS_DIR", str(self.tmpdir)
+        ), mock.patch.multiple(
+            core, _init_worker=init_worker, _from_file=from_file
+        ):
+            corpus = core.Corpus("latin_library")
+            (corpus.text_dir / "vergil").mkdir(parents=True)
+            for name in ("aeneid", "eclogues", "georgics", "bucolica"):
+                (corpus.text_dir / "vergil" / f"{name}.txt").write_text("arma")
+                corpus.create(jobs=2)
+
+            assert {
+                work["title"]: int(docix)
+                for docix, work in corpus.manifest.items()
+            } == {"aeneid": 0, "eclogues": 1, "georgics": 2, "bucolica": 3}
@@ -0,0 +1,114 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Tests for the table of document locations."""
+
+
+import shutil
+import tempfile
+import unittest
+from datetime import datetime
+from pathlib import Path
+from unittest import mock
+
+
+class Corpus:
+    def __init__(self, path, manifest, schema):
+        self.path = path
+        self.manifest = manifest
+        self.schema = schema
+
+
+class TestDocTable(unittest.TestCase):
+    """Tests for `cylleneus.corpus.indexer.DocTable`."""
+
+    def setUp(self):
+        """Set up test fixtures, if any."""
+
+        self.tmpdir = Path(tempfile.mkdtemp())
+
+    def tearDown(self):
+        """Tear down test fixtures, if any."""
+
+        shutil.rmtree(self.tmpdir)
+
+    def test_table(self):
+        """Test that documents are located from the manifest and their stored
+        fields persist until their index changes."""
+
+        from cylleneus.corpus.indexer import DocTable
+        from cylleneus.engine.fields import STORED, Schema
+
+        schema = Schema(docix=STORED(), author=STORED(), datetime=STORED())
+        manifest = {
+            "0": {
+                "author":   "Vergil",
+                "title":    "Aeneid",
+                "filename": "aeneid.txt",
+                "path":     "lat/test/index/vergil/aeneid",
+                "index":    ["_test_vergil_aeneid_0_3.toc", "xyz.seg"],
+            }
+        }
+        corpus = Corpus(self.tmpdir, manifest, schema)
+        (self.tmpdir / "manifest.json").write_text("{}")
+
+        table = DocTable(corpus)
+        assert len(table) == 1 and 0 in table and 1 not in table
+        path, indexname, generation = table.location(0)
+        assert path.parts[-2:] == ("vergil", "aeneid")
+        assert (indexname, generation) == ("test_vergil_aeneid_0", 3)
+
+        now = datetime.now()
+        table.update(0, {"docix": 0, "author": "Vergil", "datetime": now, "form": ""})
+        table.save()
+        table = DocTable(corpus)
+        assert table.doc(0) == {"docix": 0, "author": "Vergil", "datetime": now}
+
+        manifest["0"]["index"][0] = "_test_vergil_aeneid_0_4.toc"
+        table.sync()
+        assert table.location(0)[2] == 4
+        assert table._table["0"]["doc"] is None
+
+        manifest.clear()
+        table.sync()
+        assert len(table) == 0
+
+    def test_read_only(self):
+        """Test that reading documents never writes the table, and that a
+        table that cannot be written is not an error."""
+
+        from cylleneus.corpus import indexer
+        from cylleneus.corpus.indexer import DocTable
+        from cylleneus.engine.fields import STORED, Schema
+
+        schema = Schema(docix=STORED(), author=STORED())
+        manifest = {
+            str(docix): {
+                "author":   "Vergil",
+                "title":    title,
+                "filename": f"{title}.txt",
+                "path":     f"lat/test/index/vergil/{title}",
+                "index":    [f"_test_vergil_{title}_{docix}_1.toc", "xyz.seg"],
+            }
+            for docix, title in enumerate(["aeneid", "georgics"])
+        }
+        corpus = Corpus(self.tmpdir, manifest, schema)
+        (self.tmpdir / "manifest.json").write_text("{}")
+
+        reader = mock.Mock()
+        reader.stored_fields.return_value = {"docix": 0, "author": "Vergil"}
+        table = DocTable(corpus)
+        with mock.patch.object(indexer.pool, "reader", return_value=reader):
+            for _ in range(2):
+                assert table.doc(0) == {"docix": 0, "author": "Vergil"}
+                assert table.doc(1) == {"docix": 0, "author": "Vergil"}
+        assert reader.stored_fields.call_count == 2
+        assert not table.path.exists()
+
+        with mock.patch.object(
+            indexer.safer, "open", side_effect=PermissionError
+        ):
+            table.save()
+        assert not table.path.exists()
+        table.save()
+        assert DocTable(corpus).doc(1) == {"docix": 0, "author": "Vergil"}
@@ -0,0 +1,143 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Tests for the encoding of postings."""
+
+
+import unittest
+
+
+class TestCylleneusCharacters(unittest.TestCase):
+    """Tests for `cylleneus.engine.formats.CylleneusCharacters`."""
+
+    def setUp(self):
+        """Set up test fixtures, if any."""
+
+        self.poslist = [
+            (
+                i * 3,
+                i * 20,
+                i * 20 + 5,
+                (
+                    "meta=book-poem-line",
+                    f"book={i // 50 + 1}",
+                    f"poem={i // 10:04d}",
+                    f"line={i % 10}a" if i % 7 == 0 else f"line={i % 10}",
+                ),
+            )
+            for i in range(200)
+        ]
+
+    def test_roundtrip(self):
+        """Test that postings decode as they were encoded, meta and all."""
+
+        from cylleneus.engine.formats import CylleneusCharacters
+
+        fmt = CylleneusCharacters()
+        value = fmt.encode(self.poslist)
+        assert fmt.decode_frequency(value) == 200
+        assert fmt.decode_characters(value) == [
+            (pos, startchar, endchar, (meta,))
+            for pos, startchar, endchar, meta in self.poslist
+        ]
+        assert fmt.decode_positions(value) == [pos for pos, *_ in self.poslist]
+
+        # Overlapping postings, and postings without all or any meta
+        mixed = [
+            (0, 0, 1, ("book=1", "line=2")),
+            (1, 2, 9, ("book=1",)),
+            (1, 2, 3, ()),
+        ]
+        assert fmt.decode_characters(fmt.encode(mixed)) == [
+            (pos, startchar, endchar, (meta,))
+            for pos, startchar, endchar, meta in mixed
+        ]
+        assert fmt.decode_characters(fmt.encode([])) == []
+
+    def test_columns(self):
+        """Test that postings decode as columns of the same postings, with
+        each distinct meta decoded once."""
+
+        from cylleneus.engine.formats import CylleneusCharacters
+
+        fmt = CylleneusCharacters()
+        mixed = [
+            (0, 0, 1, ("book=1", "line=2")),
+            (1, 2, 9, ("book=1",)),
+            (1, 2, 3, ()),
+            (2, 4, 5, ("book=1", "line=2")),
+        ]
+        for poslist in (self.poslist, mixed, []):
+            value = fmt.encode(poslist)
+            positions, startchars, endchars, metaids, metas = (
+                fmt.decode_character_columns(value)
+            )
+            assert len(metas) == len({meta for *_, meta in poslist})
+            assert [
+                (pos, startchar, endchar, (metas[metaid],))
+                for pos, startchar, endchar, metaid in zip(
+                    positions, startchars, endchars, metaids
+                )
+            ] == fmt.decode_characters(value)
+
+    def test_conditional_keys(self):
+        """Test that the meta of a token decodes in the same order in every
+        posting, whichever keys the other tokens of the posting have."""
+
+        from cylleneus.engine.formats import CylleneusCharacters
+        from cylleneus.engine.query.spans import Span, span_key
+
+        fmt = CylleneusCharacters()
+        token = (5, 10, 14, ("book=1", "act=2", "line=9"))
+        alone = fmt.decode_characters(fmt.encode([token]))[0]
+        for poslist in (
+            [(0, 0, 4, ("book=1", "line=1")), token],
+            [(0, 0, 4, ("scene=3", "line=1")), token, (6, 15, 19, ())],
+        ):
+            value = fmt.encode(poslist)
+            decoded = fmt.decode_characters(value)
+            assert decoded == [
+                (pos, startchar, endchar, (meta,))
+                for pos, startchar, endchar, meta in poslist
+            ]
+            assert decoded[1] == alone
+            a, b = (
+                Span(pos, startchar=startchar, endchar=endchar, divs=[meta])
+                for pos, startchar, endchar, meta in (decoded[1], alone)
+            )
+            assert a == b and span_key(a) == span_key(b)
+
+            positions, startchars, endchars, metaids, metas = (
+                fmt.decode_character_columns(value)
+            )
+            assert [
+                (pos, startchar, endchar, (metas[metaid],))
+                for pos, startchar, endchar, metaid in zip(
+                    positions, startchars, endchars, metaids
+                )
+            ] == decoded
+
+    def test_pickled(self):
+        """Test that postings pickled by earlier versions still decode, and
+        take more space."""
+
+        from whoosh.system import pack_uint
+
+        from cylleneus.engine.compat import dumps
+        from cylleneus.engine.formats import CylleneusCharacters
+
+        deltas = []
+        posbase = charbase = 0
+        for pos, startchar, endchar, meta in self.poslist:
+            deltas.append((pos - posbase, startchar - charbase, endchar - startchar, meta))
+            posbase, charbase = pos, endchar
+        pickled = pack_uint(len(deltas)) + dumps(deltas, -1)
+
+        fmt = CylleneusCharacters()
+        value = fmt.encode(self.poslist)
+        assert fmt.decode_characters(pickled) == fmt.decode_characters(value)
+        assert fmt.decode_positions(pickled) == fmt.decode_positions(value)
+        assert [
+            list(column) for column in fmt.decode_character_columns(pickled)
+        ] == [list(column) for column in fmt.decode_character_columns(value)]
+        assert len(value) * 4 < len(pickled)
@@ -0,0 +1,124 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Tests for the fragments of hits."""
+
+
+import pickle
+import unittest
+
+from .fixtures import make_token
+
+
+def line_token(fieldname, pos, line):
+    return make_token(
+        f"{fieldname}{pos}",
+        pos,
+        {"meta": "line", "line": str(line)},
+        fieldname=fieldname,
+    )
+
+
+class TestCylleneusFragment(unittest.TestCase):
+    """Tests for `cylleneus.engine.highlight.CylleneusFragment`."""
+
+    def setUp(self):
+        """Set up test fixtures, if any."""
+
+        self.text = "x" * 1000
+
+    def test_hash(self):
+        """Test that fragments are deduplicated by hash."""
+
+        from cylleneus.engine.highlight import CylleneusFragment
+
+        fragments = [
+            CylleneusFragment(
+                self.text, [line_token("form", i, i)], i * 10, i * 10 + 5
+            )
+            for i in range(50)
+        ]
+        assert len({hash(fragment) for fragment in fragments}) == 50
+        copies = [fragment.copy() for fragment in fragments]
+        assert len({(1, fragment) for fragment in fragments + copies}) == 50
+
+        fragment = pickle.loads(pickle.dumps(fragments[0]))
+        assert fragment == fragments[0] and fragment.matches
+
+    def test_divs(self):
+        """Test that the divs of a fragment follow its matches."""
+
+        from cylleneus.engine.highlight import CylleneusFragment
+
+        fragment = CylleneusFragment(self.text, [line_token("form", 1, 1)], 10, 15)
+        other = CylleneusFragment(self.text, [line_token("form", 9, 1)], 90, 95)
+        assert fragment.has_same_divs(other)
+        other.matches = [line_token("form", 9, 2)]
+        assert not fragment.has_same_divs(other)
+
+    def test_merge(self):
+        """Test that overlapping, adjacent and same-passage fragments are
+        merged, with their matches in order."""
+
+        from cylleneus.engine.highlight import CylleneusFragment
+        from cylleneus.engine.searching import CylleneusHit
+
+        fragments = [
+            CylleneusFragment(self.text, [line_token("lemma", 1, 1)], 10, 15),
+            CylleneusFragment(self.text, [line_token("form", 1, 1)], 10, 15),
+            CylleneusFragment(self.text, [line_token("form", 5, 2)], 50, 55),
+            CylleneusFragment(self.text, [line_token("form", 7, 2)], 70, 75),
+            CylleneusFragment(self.text, [line_token("form", 20, 3)], 200, 205),
+        ]
+        merged = list(CylleneusHit.merge_fragments(fragments))
+        assert [(f.startchar, f.endchar) for f in merged] == [
+            (10, 15),
+            (50, 75),
+            (200, 205),
+        ]
+        assert [(m.fieldname, m.pos) for m in merged[0].matches] == [
+            ("form", 1),
+            ("lemma", 1),
+        ]
+        assert merged[0].text == self.text
+        assert len(fragments[0].matches) == 1
+
+
+class TestCylleneusPinpointFragmenter(unittest.TestCase):
+    """Tests for `cylleneus.engine.highlight.CylleneusPinpointFragmenter`."""
+
+    def test_columns(self):
+        """Test that matches given as columns are fragmented as tokens are."""
+
+        from cylleneus.engine.highlight import CylleneusPinpointFragmenter
+
+        text = "x" * 1000
+        tokens = [line_token("form", pos, pos // 4) for pos in (1, 2, 3, 9, 30, 31)]
+        positions = [t.pos for t in tokens]
+        startchars = [t.startchar for t in tokens]
+        endchars = [t.endchar for t in tokens]
+
+        made = []
+
+        def make_tokens(i, j):
+            made.extend(range(i, j + 1))
+            return tokens[i: j + 1]
+
+        for surround, charlimit in ((0, None), (20, None), (20, 100)):
+            fragmenter = CylleneusPinpointFragmenter(
+                maxchars=40, surround=surround, charlimit=charlimit
+            )
+            del made[:]
+            fragments = list(
+                fragmenter.fragment_columns(
+                    text, positions, startchars, endchars, make_tokens
+                )
+            )
+            assert [
+                (f.startchar, f.endchar, f.matches) for f in fragments
+            ] == [
+                (f.startchar, f.endchar, f.matches)
+                for f in fragmenter.fragment_matches(text, tokens)
+            ]
+            assert len(made) == sum(len(f.matches) for f in fragments)
+        assert made == [0, 1, 2, 3]
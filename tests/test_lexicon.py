@@ -0,0 +1,62 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Tests for the compiled Latin lexical resources."""
+
+
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+
+class TestLexicon(unittest.TestCase):
+    """Tests for `cylleneus.lang.lat.lexicon`."""
+
+    def setUp(self):
+        """Set up test fixtures, if any."""
+
+        self.tmpdir = Path(tempfile.mkdtemp())
+
+    def tearDown(self):
+        """Tear down test fixtures, if any."""
+
+        shutil.rmtree(self.tmpdir)
+
+    def test_lookups(self):
+        """Test that compiled lookups agree with scanning the resources."""
+
+        from cylleneus.lang.lat import compound, lexicon
+
+        def is_ppp(token):
+            for gender in compound.endings:
+                for number in compound.endings[gender]:
+                    for case in compound.endings[gender][number]:
+                        if (
+                            token.endswith(case)
+                            and token.rsplit(case, 1)[0]
+                            in compound.past_participles
+                        ):
+                            return gender, number
+
+        for token in ["amatus", "amata", "amatum", "amati", "ductae", "arma", "um"]:
+            assert lexicon.is_ppp(token) == is_ppp(token)
+        assert lexicon.is_ppp("amatum") == ("m", "s")
+        assert lexicon.is_copula("est") == ("p", "i", "s", 0)
+        assert lexicon.is_copula("futura esse") == ("u", "n", "p", 2)
+        assert lexicon.is_copula("arma") is None
+        assert "Aaron" in lexicon.proper_names
+        assert "que" in lexicon.exceptions
+
+    def test_cache(self):
+        """Test that the tables are compiled once and reloaded from disk."""
+
+        from cylleneus.lang.lat import lexicon
+
+        path = self.tmpdir / "lexicon.pickle"
+        tables = lexicon.load_tables(path)
+        assert path.exists()
+        assert lexicon.load_tables(path) == tables
+
+        path.write_bytes(b"")
+        assert lexicon.load_tables(path)["copulas"] == tables["copulas"]
@@ -0,0 +1,82 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Tests for bulk WordNet lookups at index time."""
+
+
+import unittest
+
+
+RECORDS = [
+    {
+        "lemma":   "arma",
+        "uri":     "a2156",
+        "morpho":  "n-p---nn2-",
+        "synsets": {
+            "literal":    [
+                {"pos": "n", "offset": "03601056", "semfield": [{"code": "355"}]}
+            ],
+            "metonymic":  [],
+            "metaphoric": [],
+        },
+    },
+    {
+        "lemma":   "uir",
+        "uri":     "u0670",
+        "morpho":  "n-s---mn2-",
+        "synsets": {
+            "literal":    [
+                {"pos": "n", "offset": "10287213", "semfield": [{"code": "599"}]},
+                {"pos": "n", "offset": "10582746", "semfield": []},
+            ],
+            "metonymic":  [],
+            "metaphoric": [],
+        },
+    },
+]
+
+
+class TestLookups(unittest.TestCase):
+    """Tests for `cylleneus.engine.analysis.lookups`."""
+
+    def test_bulk_lemmas(self):
+        """Test that distinct lookups are resolved in chunks."""
+
+        from cylleneus.engine.analysis.lookups import LocalBackend, bulk_lemmas
+
+        backend = LocalBackend(RECORDS)
+        keys = [("arma", "n", None), (None, None, "u0670"), ("arma", "n", None)]
+        results = bulk_lemmas(keys, backend, chunksize=1)
+
+        assert backend.requests == 2
+        assert results[("arma", "n", None)][0]["uri"] == "a2156"
+        assert "synsets" not in results[("arma", "n", None)][0]
+        assert results[(None, None, "u0670")][0]["lemma"] == "uir"
+
+    def test_synset_filter(self):
+        """Test that a document's synsets are resolved in a single request."""
+
+        from cylleneus.engine.analysis.acore import CylleneusToken
+        from cylleneus.engine.analysis.filters import CachedSynsetFilter
+        from cylleneus.engine.analysis.lookups import LocalBackend
+
+        def tokens():
+            t = CylleneusToken(mode="index")
+            for text in ["arma:a2156=n-p---nn2-", "uir:u0670=n-s---mn2-"] * 50:
+                t.text = text
+                yield t
+
+        backend = LocalBackend(RECORDS)
+        Synsets = CachedSynsetFilter(backend=backend)
+        results = [
+            (t.text, t.code) for t in Synsets(tokens(), docix=0) if t.text
+        ]
+
+        assert backend.requests == 1
+        assert len(results) == 150
+        assert results[:3] == [
+            ("n#03601056", "355"),
+            ("n#10287213", "599"),
+            ("n#10582746", ""),
+        ]
+        assert [(t.text, t.code) for t in Synsets([], docix=0) if t.text] == results
@@ -0,0 +1,166 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Tests for consolidated indexes."""
+
+
+import os
+from unittest import mock
+
+from .fixtures import CorpusTestCase, SpaceTokenizer
+
+WORKS = {
+    ("ovid", "metamorphoses"): "in nova fert animus\n",
+    ("vergil", "aeneid"): "arma virumque cano\nTroiae qui primus\n",
+    ("vergil", "georgics"): "quid faciat laetas segetes\nsub arma cano\n",
+}
+
+
+class TestMerge(CorpusTestCase):
+    """Tests for searching an index merged from per-work indexes."""
+
+    def test_filtered_search(self):
+        """Test that hits in a merged index are filtered by document and
+        report their own stored fields."""
+
+        import cylleneus.engine.analysis.analyzers
+        import cylleneus.engine.index
+        from cylleneus.engine import scoring
+        from cylleneus.engine.fields import STORED, Schema, TEXT
+        from cylleneus.engine.searching import CylleneusSearcher
+        from whoosh.query import Term
+
+        schema = Schema(docix=STORED(), text=TEXT(analyzer=SpaceTokenizer()))
+        readers = []
+        for docix, text in enumerate(["arma uirumque cano", "arma amens capio"]):
+            path = self.tmpdir / str(docix)
+            path.mkdir()
+            ix = cylleneus.engine.index.create_in(path, schema=schema, indexname="work")
+            with ix.writer() as writer:
+                writer.add_document(docix=docix, text=text)
+            readers.append(ix.reader())
+
+        path = self.tmpdir / "merged"
+        path.mkdir()
+        ix = cylleneus.engine.index.create_in(path, schema=schema, indexname="merged")
+        writer = ix.writer()
+        for reader in readers:
+            writer.add_reader(reader)
+        writer.commit()
+
+        reader = ix.reader()
+        docnums = {
+            docnum
+            for docnum in reader.all_doc_ids()
+            if reader.stored_fields(docnum)["docix"] == 1
+        }
+        with CylleneusSearcher(reader, weighting=scoring.NullWeighting) as searcher:
+            results = searcher.search(Term("text", "arma"), limit=None)
+            assert sorted(hit["docix"] for hit in results) == [0, 1]
+
+            results = searcher.search(Term("text", "arma"), limit=None, filter=docnums)
+            assert [hit["docix"] for hit in results] == [1]
+
+    def test_merge(self):
+        """Test that a corpus is merged in order of docix, and that its merged
+        index is stale once a work is indexed."""
+
+        from cylleneus.corpus.core import Work, corpora
+
+        self.add_texts(WORKS)
+        corpus = corpora["test"]
+        corpus.create()
+        assert not corpus.merged
+
+        assert corpus.merge() == 3
+        assert corpus.merged
+        assert [
+            (fields["docix"], fields["title"])
+            for fields in corpus.merged_reader.all_stored_fields()
+        ] == [(0, "metamorphoses"), (1, "aeneid"), (2, "georgics")]
+
+        # As if the corpus were indexed and merged a while ago
+        for path in [corpus.manifest_file, *corpus.merged_dir.glob("*.toc")]:
+            stat = path.stat()
+            os.utime(path, (stat.st_atime, stat.st_mtime - 10))
+        assert corpus.merged
+        self.add_texts({("ovid", "tristia"): "arma\n"})
+        Work(corpus).indexer.from_file(corpus.text_dir / "ovid/tristia.txt")
+        assert not corpus.merged
+
+        assert corpus.merge() == 4
+        assert corpus.merged
+
+    def test_search(self):
+        """Test that the works of a merged corpus are searched in its merged
+        index, as a filter on their documents, with the same results."""
+
+        from cylleneus.corpus.core import corpora
+        from cylleneus.search.core import Collection, Search
+
+        self.add_texts(WORKS)
+        corpus = corpora["test"]
+        corpus.create()
+
+        collection = Collection(works=corpus.works_for(author="vergil"))
+        expected = list(Search("arma", collection).highlights)
+        assert [(href.title, href.reference) for href in expected] == [
+            ("aeneid", "line: 1"),
+            ("georgics", "line: 2"),
+        ]
+
+        corpus.merge()
+        search = Search("arma", collection)
+        shards = list(search._shards())
+        assert [
+            (path, indexname, docnums)
+            for _, path, indexname, docnums in shards
+        ] == [(corpus.merged_dir, "test", {1, 2})]
+        assert list(search.highlights) == expected
+
+        search = Search("arma", Collection(works=corpus.works))
+        [(_, _, _, docnums)] = search._shards()
+        assert docnums is None
+        assert list(search.highlights) == expected
+
+        # Documents are numbered afresh in the merged index
+        corpus.work_by_docix(0).indexer.destroy(0)
+        assert corpus.merge() == 2
+        assert [
+            fields["docix"]
+            for fields in corpus.merged_reader.all_stored_fields()
+        ] == [1, 2]
+        search = Search(
+            "arma", Collection(works=[corpus.work_by_docix(2)])
+        )
+        [(_, _, _, docnums)] = search._shards()
+        assert docnums == {1}
+        assert list(search.highlights) == expected[1:]
+
+    def test_shards(self):
+        """Test that whether a corpus is merged is checked once, and that the
+        documents of its merged index are read once."""
+
+        from cylleneus.corpus.core import Corpus, corpora
+        from cylleneus.search.core import Collection, Search
+
+        self.add_texts(WORKS)
+        corpus = corpora["test"]
+        corpus.create()
+        corpus.merge()
+        collection = Collection(works=corpus.works_for(author="vergil"))
+
+        with mock.patch.object(
+            Corpus, "merged", new_callable=mock.PropertyMock, return_value=True
+        ) as merged:
+            [(_, _, _, docnums)] = Search("arma", collection)._shards()
+        assert merged.call_count == 1
+        assert docnums == {1, 2}
+
+        reader = corpus.merged_reader
+        with mock.patch.object(
+            reader, "stored_fields", wraps=reader.stored_fields
+        ) as stored_fields:
+            [(_, _, _, docnums)] = Search("arma", collection)._shards()
+        assert stored_fields.call_count == 0
+        assert docnums == {1, 2}
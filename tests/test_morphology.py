@@ -0,0 +1,78 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Tests for the morphology indexes of annotations."""
+
+
+import unittest
+
+ANALYSES = [
+    ("n-s---fa1-", "lemma1:1:0"),
+    ("n-p---fn1-", "lemma1:1:1"),
+    ("n-s---mn2-", "lemma2:1:0"),
+    ("n-p---ma2-", "lemma2:1:1"),
+]
+
+
+class Field(object):
+    def to_bytes(self, text):
+        return text.encode("utf8")
+
+    def from_bytes(self, btext):
+        return btext.decode("utf8")
+
+
+class Reader(object):
+    def __init__(self, terms):
+        self.schema = {"annotation": Field()}
+        self.terms = sorted(terms)
+
+    def lexicon(self, fieldname):
+        for text in self.terms:
+            yield text.encode("utf8")
+
+
+class TestMorphologyIndex(unittest.TestCase):
+    """Tests for `cylleneus.engine.morphology.MorphologyIndex`."""
+
+    def setUp(self):
+        """Set up test fixtures, if any."""
+
+        # The terms indexed by the annotation filter
+        terms = set()
+        for annotation, group in ANALYSES:
+            terms.add(f"{annotation}::{group}")
+            for j, v in enumerate(annotation):
+                if v != "-":
+                    terms.add(f"{'-' * j}{v}{'-' * (9 - j)}::{group}")
+        self.reader = Reader(terms)
+
+    def test_lemma_groups(self):
+        """Test that only the groups with an analysis having every feature of
+        an annotation are found."""
+
+        from cylleneus.engine.morphology import morphology
+
+        index = morphology(self.reader)
+        assert morphology(self.reader) is index
+        assert index.lemma_groups("-------a--") == ["lemma1:1:0", "lemma2:1:1"]
+        assert index.lemma_groups("--p----a--") == ["lemma2:1:1"]
+        assert index.lemma_groups("--p-----3-") == []
+        assert index.lemma_groups("----------") == []
+
+    def test_annotation(self):
+        """Test that annotation queries expand to the terms of the groups
+        with an analysis having every feature of the query."""
+
+        from cylleneus.engine.query.terms import Annotation
+
+        q = Annotation("annotation", "--p-------::--p----a--")
+        assert list(q._btexts(self.reader)) == [b"--p-------::lemma2:1:1"]
+        assert list(q.terms()) == [("annotation", "--p-------")]
+
+        # Queries by a single feature
+        q = Annotation("annotation", r"-------a--::([\w\d$]+):(\d+):(\d+)$")
+        assert list(q._btexts(self.reader)) == [
+            b"-------a--::lemma1:1:0",
+            b"-------a--::lemma2:1:1",
+        ]
@@ -0,0 +1,94 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Tests for indexing works by passage."""
+
+
+import unittest
+
+from .fixtures import make_token
+
+
+def line(text, book, line):
+    return text, {"meta": "book-line", "book": str(book), "line": str(line)}
+
+
+VALUE = [
+    line("arma", 1, 1),
+    line("virumque", 1, 1),
+    line("cano", 1, 2),
+    line("arma", 2, 1),
+    line("troiae", 2, 1),
+    line("cano", 3, 1),
+]
+
+
+class Tokenizer(object):
+    def __call__(self, value, **kwargs):
+        for pos, (text, meta) in enumerate(value):
+            yield make_token(text, pos, meta, **kwargs)
+
+
+def postings(reader, text):
+    m = reader.postings("form", text)
+    while m.is_active():
+        yield m.id(), m.value_as("characters")
+        m.next()
+
+
+class TestPassages(unittest.TestCase):
+    """Tests for `cylleneus.engine.writing.SegmentWriter.add_passages`."""
+
+    def setUp(self):
+        """Set up test fixtures, if any."""
+
+        from cylleneus.engine import fields
+        from cylleneus.engine.filedb.filestore import RamStorage
+
+        self.schema = fields.Schema(
+            docix=fields.STORED(), form=fields.FORM(analyzer=Tokenizer()),
+        )
+        self.storage = RamStorage()
+
+    def test_add_passages(self):
+        """Test that each passage of a work is a document of its own."""
+
+        ix = self.storage.create_index(self.schema, indexname="passages")
+        writer = ix.writer()
+        assert writer.add_passages(depth=1, docix=3, form=VALUE) == 3
+        writer.commit()
+
+        reader = ix.reader()
+        assert reader.doc_count() == 3
+        assert list(reader.all_doc_ixs()) == [3]
+        assert [reader.stored_fields(i) for i in range(3)] == [{"docix": 3}] * 3
+        assert list(postings(reader, "cano")) == [
+            (0, [(2, 20, 24, (("meta=book-line", "book=1", "line=2"),))]),
+            (2, [(5, 50, 54, (("meta=book-line", "book=3", "line=1"),))]),
+        ]
+        assert list(reader.vector_as("weight", 1, "form")) == [
+            ("arma", 1.0),
+            ("troiae", 1.0),
+        ]
+        assert reader.doc_field_length(0, "form") == 3
+
+    def test_add_document(self):
+        """Test that the passages of a work hold the postings of the work."""
+
+        documents = self.storage.create_index(self.schema, indexname="work")
+        writer = documents.writer()
+        writer.add_document(docix=3, form=VALUE)
+        writer.commit()
+
+        passages = self.storage.create_index(self.schema, indexname="passages")
+        writer = passages.writer()
+        writer.add_passages(depth=2, docix=3, form=VALUE)
+        writer.commit()
+
+        document, passage = documents.reader(), passages.reader()
+        assert passage.doc_count() == 4
+        assert list(document.lexicon("form")) == list(passage.lexicon("form"))
+        for text in ("arma", "virumque", "cano", "troiae"):
+            assert [
+                value for _, values in postings(passage, text) for value in values
+            ] == [value for _, values in postings(document, text) for value in values]
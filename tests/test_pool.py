@@ -0,0 +1,91 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Tests for the pool of open indexes."""
+
+
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+from .fixtures import SpaceTokenizer
+
+
+class TestIndexPool(unittest.TestCase):
+    """Tests for `cylleneus.corpus.indexer.IndexPool`."""
+
+    def setUp(self):
+        """Set up test fixtures, if any."""
+
+        self.tmpdir = Path(tempfile.mkdtemp())
+
+    def tearDown(self):
+        """Tear down test fixtures, if any."""
+
+        shutil.rmtree(self.tmpdir)
+
+    def test_reader(self):
+        """Test that pooled readers are reused until the index changes."""
+
+        import cylleneus.engine.index
+        from cylleneus.corpus.indexer import IndexPool
+        from cylleneus.engine.fields import STORED, Schema, TEXT
+
+        schema = Schema(docix=STORED(), text=TEXT(analyzer=SpaceTokenizer()))
+        pool = IndexPool(maxsize=2)
+        assert pool.reader(self.tmpdir, schema, "work") is None
+
+        ix = cylleneus.engine.index.create_in(
+            self.tmpdir, schema=schema, indexname="work"
+        )
+        with ix.writer() as writer:
+            writer.add_document(docix=0, text="arma uirumque cano")
+        reader = pool.reader(self.tmpdir, schema, "work")
+        assert reader.doc_count() == 1
+        assert pool.reader(self.tmpdir, schema, "work") is reader
+
+        with ix.writer() as writer:
+            writer.add_document(docix=1, text="arma amens capio")
+        reader = pool.reader(self.tmpdir, schema, "work")
+        assert reader.doc_count() == 2
+
+        reader.close()
+        assert pool.reader(self.tmpdir, schema, "work").doc_count() == 2
+
+        pool.discard(self.tmpdir)
+        shutil.rmtree(self.tmpdir)
+        self.tmpdir.mkdir()
+        assert pool.reader(self.tmpdir, schema, "work") is None
+
+    def test_docnums(self):
+        """Test that the documents of each docix are read once for each
+        version of the index."""
+
+        import cylleneus.engine.index
+        from cylleneus.corpus.indexer import IndexPool
+        from cylleneus.engine.fields import STORED, Schema, TEXT
+
+        schema = Schema(docix=STORED(), text=TEXT(analyzer=SpaceTokenizer()))
+        pool = IndexPool(maxsize=2)
+        assert pool.docnums(self.tmpdir, schema, "work") is None
+
+        ix = cylleneus.engine.index.create_in(
+            self.tmpdir, schema=schema, indexname="work"
+        )
+        with ix.writer() as writer:
+            writer.add_document(docix=3, text="arma uirumque cano")
+            writer.add_document(docix=3, text="Troiae qui primus")
+            writer.add_document(docix=5, text="arma amens capio")
+        docnums = pool.docnums(self.tmpdir, schema, "work")
+        assert docnums == {3: [0, 1], 5: [2]}
+        assert pool.docnums(self.tmpdir, schema, "work") is docnums
+
+        with ix.writer() as writer:
+            writer.add_document(docix=6, text="quid faciat")
+        assert pool.docnums(self.tmpdir, schema, "work") == {
+            3: [0, 1],
+            5: [2],
+            6: [3],
+        }
+        pool.clear()
@@ -0,0 +1,40 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Tests for parsing batches of queries."""
+
+
+import unittest
+
+from .fixtures import SpaceTokenizer
+
+
+class CountingTokenizer(SpaceTokenizer):
+    def __init__(self):
+        self.values = []
+
+    def __call__(self, value, **kwargs):
+        self.values.append(value)
+        yield from super().__call__(value, **kwargs)
+
+
+class TestQueryBatch(unittest.TestCase):
+    """Tests for `cylleneus.engine.qparser.default.CylleneusQueryParser`."""
+
+    def test_shared_terms(self):
+        """Test that terms shared by the queries of a parser are processed
+        once."""
+
+        from cylleneus.engine.fields import STORED, Schema, TEXT
+        from cylleneus.engine.qparser.default import CylleneusQueryParser
+
+        tokenizer = CountingTokenizer()
+        schema = Schema(form=TEXT(analyzer=tokenizer), docix=STORED())
+        parser = CylleneusQueryParser("form", schema)
+
+        first = parser.parse("arma cano")
+        second = parser.parse("arma uirum")
+        assert tokenizer.values == ["arma", "cano", "uirum"]
+        assert str(first) == "('arma' AND 'cano')"
+        assert str(second) == "('arma' AND 'uirum')"
+        assert parser.parse("arma cano") == first
@@ -0,0 +1,34 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Tests for the registry of corpora."""
+
+
+import unittest
+
+
+class TestRegistry(unittest.TestCase):
+    """Tests for `cylleneus.corpus.meta.Registry`."""
+
+    def test_lazy(self):
+        """Test that corpora are listed without importing them, and that
+        their descriptors agree with their modules."""
+
+        from cylleneus.corpus.meta import Registry, __path__
+
+        manifest = Registry(__path__[0])
+        assert "default" in manifest and "perseus" in manifest
+        assert "phi5" not in manifest
+        assert not any(manifest.loaded(name) for name in manifest)
+
+        descriptor = manifest.descriptors["perseus"]
+        assert descriptor.module == "cylleneus.corpus.lat.perseus"
+        assert descriptor.repo["location"] == "remote"
+
+        meta = manifest["perseus"]
+        assert manifest.loaded("perseus") and not manifest.loaded("lasla")
+        for field in ["description", "language", "glob", "repo"]:
+            assert getattr(meta, field) == getattr(descriptor, field)
+
+        with self.assertRaises(KeyError):
+            manifest["nonesuch"]
@@ -0,0 +1,100 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Tests for the term requirements of queries."""
+
+
+import random
+import unittest
+from itertools import product
+
+
+class TestTermRequirements(unittest.TestCase):
+    """Tests for `cylleneus.engine.searching.TermRequirements`."""
+
+    def test_term_lists(self):
+        """Test that requirements agree with the term lists they replace."""
+
+        from cylleneus.engine.searching import TermRequirements
+
+        rng = random.Random(0)
+        vocabulary = [
+            (field, f"{field}{i}")
+            for field in ("lemma", "annotation", "synset")
+            for i in range(4)
+        ]
+        for _ in range(200):
+            required = rng.sample(vocabulary, rng.randint(0, 3))
+            clauses = [
+                rng.sample(vocabulary, rng.randint(1, 4))
+                for _ in range(rng.randint(0, 3))
+            ]
+            termlists = [required + list(terms) for terms in product(*clauses)]
+            requirements = TermRequirements(required, clauses)
+
+            assert requirements.terms == {
+                term for termlist in termlists for term in termlist
+            }
+            assert requirements.size == len(termlists[0])
+            for _ in range(10):
+                terms = set(rng.sample(vocabulary, rng.randint(0, 5)))
+                assert requirements.satisfied_by(terms) == any(
+                    all(term in terms for term in termlist)
+                    for termlist in termlists
+                )
+                assert requirements.covers(terms) == any(
+                    all(term in termlist for term in terms)
+                    for termlist in termlists
+                )
+
+    def test_unsatisfiable(self):
+        """Test that a query with an empty clause requires nothing that can be
+        matched."""
+
+        from cylleneus.engine.searching import TermRequirements
+
+        requirements = TermRequirements([("lemma", "a")], [[]])
+        assert not requirements.terms
+        assert not requirements.satisfied_by({("lemma", "a")})
+        assert not requirements.covers({("lemma", "a")})
+
+
+class WordNet(object):
+    instances = 0
+
+    def __init__(self):
+        WordNet.instances += 1
+        self.lookups = 0
+
+    def semfields(self, code):
+        self.lookups += 1
+        return type(
+            "Results",
+            (),
+            {"lemmas": [{"code": code, "lemmas": [{"uri": "a1"}, {"uri": "b2"}]}]},
+        )
+
+
+class TestHitContext(unittest.TestCase):
+    """Tests for `cylleneus.engine.searching.HitContext`."""
+
+    def test_shared(self):
+        """Test that WordNet clients and the lemmas of synsets and semantic
+        fields are looked up once for every hit of every index."""
+
+        from cylleneus.engine.query.compound import And
+        from cylleneus.engine.query.terms import Lemma, Semfield
+        from cylleneus.engine.searching import HitContext, TermRequirements
+
+        context = HitContext()
+        context.wordnets = {"lat": WordNet}
+        q = And([Lemma("lemma", "arma:c1=n"), Semfield("semfield", "1")])
+
+        terms = TermRequirements.from_query(q, None).terms
+        assert terms == {("lemma", "arma:c1=n"), ("semfield", "1")}
+        for _ in range(10):
+            assert context.uris(terms, "lat") == {"c1", "a1", "b2"}
+            assert context.uris(terms, "grk") == {"c1", "a1", "b2"}
+            assert context.uris({("semfield", "1")}, "lat") == {"a1", "b2"}
+        assert WordNet.instances == 1
+        assert context.wordnet("lat").lookups == 1
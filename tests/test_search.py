@@ -0,0 +1,195 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Tests for searching a collection of works."""
+
+
+from collections import Counter
+from unittest import mock
+
+from .fixtures import CorpusTestCase
+
+WORKS = {
+    ("catullus", "carmina"): "cui dono lepidum novum libellum\n",
+    ("ovid", "tristia"): "arma cano\nparve nec invideo sine me liber ibis in\n"
+    "urbem ei mihi quo domino non licet ire tuo\narma gravi numero\n",
+    ("vergil", "aeneid"): "arma virumque cano\nTroiae qui primus ab oris\n"
+    "Italiam fato profugus\nLaviniaque venit\nlitora multum ille et\n"
+    "terris iactatus et alto\narma amens capio\n",
+    ("vergil", "georgics"): "quid faciat laetas segetes\nsub arma cano\n",
+}
+
+
+def results(search):
+    return [
+        (hit["docix"], meta["start"]["line"], meta["end"]["line"])
+        for hit, meta, _ in search.results
+    ]
+
+
+class TestSearch(CorpusTestCase):
+    """Tests for `cylleneus.search.core.Search`."""
+
+    def setUp(self):
+        """Set up test fixtures, if any."""
+
+        from cylleneus.corpus.core import corpora
+        from cylleneus.search.core import Collection
+
+        super().setUp()
+        self.add_texts(WORKS)
+        self.corpus = corpora["test"]
+        self.corpus.create()
+        self.collection = Collection(
+            works=[self.corpus.work_by_docix(docix) for docix in range(4)]
+        )
+
+    def test_parallel(self):
+        """Test that searching with worker threads or processes has the
+        results, in the same order, of searching work by work."""
+
+        from cylleneus.search.core import Search, Searcher
+
+        search = Search("arma", self.collection)
+        count = search.run()
+        expected = results(search), list(search.highlights)
+        assert expected[0] == [
+            (1, "1", "1"),
+            (1, "4", "4"),
+            (2, "1", "1"),
+            (2, "7", "7"),
+            (3, "2", "2"),
+        ]
+
+        for backend in ("thread", "process"):
+            search = Search("arma", self.collection, jobs=3, backend=backend)
+            assert search.run() == count
+            assert (results(search), list(search.highlights)) == expected
+
+            searcher = Searcher(self.collection, jobs=2, backend=backend)
+            search = searcher.search("arma")
+            assert (results(search), list(search.highlights)) == expected
+
+    def test_parallel_query(self):
+        """Test that the query is parsed once, and shipped to the workers."""
+
+        from cylleneus.engine.qparser.default import CylleneusQueryParser
+        from cylleneus.search.core import Search
+
+        queries = {}
+        Search("arma", self.collection, queries=queries).parse(self.corpus)
+        with mock.patch.object(
+            CylleneusQueryParser, "parse", side_effect=AssertionError
+        ):
+            for backend in ("thread", "process"):
+                search = Search(
+                    "arma",
+                    self.collection,
+                    queries=queries,
+                    jobs=2,
+                    backend=backend,
+                )
+                search.run()
+                assert len(search.results) == 5
+
+    def test_stream(self):
+        """Test that a page of highlights is streamed from its offset."""
+
+        from cylleneus.search.core import Search, Searcher
+
+        expected = list(Search("arma", self.collection).highlights)
+        assert len(expected) == 5
+        for offset, page_size in ((0, None), (0, 2), (1, 3), (4, 2), (6, 2)):
+            search = Search("arma", self.collection)
+            stop = offset + page_size if page_size is not None else None
+            assert (
+                list(search.stream(offset=offset, page_size=page_size))
+                == expected[offset:stop]
+            )
+
+        searcher = Searcher(self.collection)
+        assert list(searcher.stream("arma", offset=2, page_size=2)) == (
+            expected[2:4]
+        )
+        assert [search.spec for search in searcher.searches] == ["arma"]
+
+    def test_stream_stop(self):
+        """Test that streaming stops at the end of the page, without
+        highlighting later works or fetching highlights off the page."""
+
+        from cylleneus.search import core
+
+        search = core.Search("arma", self.collection)
+        with mock.patch.object(
+            core, "_highlights", wraps=core._highlights
+        ) as highlights, mock.patch.object(
+            core, "_fetch", wraps=core._fetch
+        ) as fetch:
+            page = list(search.stream(offset=1, page_size=1))
+        assert [(href.title, href.reference) for href in page] == [
+            ("tristia", "line: 4")
+        ]
+        # The works without hits and with the page's hits, and no others
+        assert highlights.call_count == 2
+        assert fetch.call_count == 1
+
+    def test_estimate(self):
+        """Test that the estimate counts the documents and corpora of the
+        results."""
+
+        from cylleneus.search.core import Collection, Search
+
+        search = Search("arma", self.collection)
+        assert search.estimate() == (3, 1)
+        assert search.count[1:] == (3, 1)
+
+        works = [self.corpus.work_by_docix(docix) for docix in (0, 3)]
+        search = Search("arma", Collection(works=works))
+        assert search.estimate() == search.count[1:] == (1, 1)
+
+        search = Search("libellum", self.collection)
+        assert search.estimate() == search.count[1:] == (1, 1)
+
+
+class TestPassageSearch(CorpusTestCase):
+    """Tests for searching works indexed by passage."""
+
+    def test_passages(self):
+        """Test that a work indexed by line has a hit for each line matched,
+        with the highlights and counts of the work indexed whole."""
+
+        from cylleneus import settings
+        from cylleneus.corpus.core import corpora
+        from cylleneus.search.core import Collection, Search
+
+        self.add_texts(WORKS)
+        corpus = corpora["test"]
+        corpus.create()
+        collection = Collection(
+            works=[corpus.work_by_docix(docix) for docix in range(4)]
+        )
+        search = Search("arma", collection)
+        count, expected = search.run(), list(search.highlights)
+        assert len(search.results) == 5
+
+        with mock.patch.object(settings, "INDEX_PASSAGES", 1):
+            corpus.create()
+        assert corpus.reader_for_docix(2).doc_count() == 7
+        assert corpus.reader_for_docix(2).stored_fields(6)["title"] == "aeneid"
+
+        for jobs in (1, 2):
+            search = Search("arma", collection, jobs=jobs)
+            assert search.run() == count
+            assert Counter(hit["docix"] for hit, _, _ in search.results) == {
+                1: 2,
+                2: 2,
+                3: 1,
+            }
+            assert list(search.highlights) == expected
+        assert search.estimate() == count[1:]
+
+        assert corpus.merge() == 4
+        assert corpus.merged_reader.doc_count() == 14
+        search = Search("arma", collection)
+        assert search.run() == count
+        assert list(search.highlights) == expected
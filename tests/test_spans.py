@@ -0,0 +1,85 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Tests for the matching of spans."""
+
+
+import unittest
+
+
+class Matcher(object):
+    def __init__(self, spans):
+        self._spans = spans
+
+    def spans(self):
+        return list(self._spans)
+
+
+def make_spans(positions):
+    from cylleneus.engine.query.spans import Span
+
+    return [
+        Span(
+            pos,
+            startchar=pos * 6,
+            endchar=pos * 6 + 5,
+            divs=[(("meta=book-line", f"book={pos // 50 + 1}", f"line={pos}"),)],
+        )
+        for pos in positions
+    ]
+
+
+class TestSpans(unittest.TestCase):
+    """Tests for `cylleneus.engine.query.spans`."""
+
+    def setUp(self):
+        """Set up test fixtures, if any."""
+
+        self.a = Matcher(make_spans(range(0, 300, 2)))
+        self.b = Matcher(make_spans(range(0, 300, 3)))
+
+    def test_hash(self):
+        """Test that spans hash by position."""
+
+        from cylleneus.engine.query.spans import Span
+
+        spans = {Span(i, startchar=i * 6, endchar=i * 6 + 5) for i in range(10)}
+        assert len(spans) == 10
+        assert len({hash(span) for span in spans}) == 10
+        assert Span(3, startchar=18, endchar=23) in spans
+
+    def test_with(self):
+        """Test that spans of the same token are with each other."""
+
+        from cylleneus.engine.query.spans import SpanWith2
+
+        m = object.__new__(SpanWith2.SpanWith2Matcher)
+        m.ms = [self.a, self.b]
+        spans = m._get_spans()
+        assert sorted(span.start for span in spans) == list(range(0, 300, 6))
+
+    def test_near(self):
+        """Test that spans near each other are found, in order or not."""
+
+        from cylleneus.engine.query.spans import SpanNear, SpanNear2
+
+        m = object.__new__(SpanNear.SpanNearMatcher)
+        m.a, m.b = self.a, self.b
+        m.slop, m.ordered, m.mindist = 1, True, 1
+        spans = m._get_spans()
+        assert [(span.start, span.end) for span in spans][:3] == [
+            (2, 3),
+            (8, 9),
+            (14, 15),
+        ]
+
+        m = object.__new__(SpanNear2.SpanNear2Matcher)
+        m.ms = [self.a, self.b]
+        m.slop, m.ordered, m.mindist = 1, False, 1
+        spans = m._get_spans()
+        assert sorted((span.start, span.end) for span in spans)[:4] == [
+            (2, 3),
+            (3, 4),
+            (8, 9),
+            (9, 10),
+        ]
@@ -0,0 +1,69 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Tests for the compiled tables of corpus metadata."""
+
+
+import pickle
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+
+class TestTables(unittest.TestCase):
+    """Tests for `cylleneus.corpus.tables`."""
+
+    def setUp(self):
+        """Set up test fixtures, if any."""
+
+        self.tmpdir = Path(tempfile.mkdtemp())
+
+    def tearDown(self):
+        """Tear down test fixtures, if any."""
+
+        shutil.rmtree(self.tmpdir)
+
+    def test_table(self):
+        """Test that a compiled table agrees with the table it is compiled
+        from."""
+
+        from cylleneus.corpus.lat.phi5.tables import AUTHOR_TAB
+        from cylleneus.corpus.tables import Table
+
+        path = self.tmpdir / "phi5.tab"
+        table = Table("cylleneus.corpus.lat.phi5.tables", "AUTHOR_TAB", path=path)
+        assert len(table) == len(AUTHOR_TAB)
+        assert list(table) == list(AUTHOR_TAB)
+        assert path.exists()
+        for key in AUTHOR_TAB:
+            assert table[key] == AUTHOR_TAB[key]
+        assert "phi0690" in table and "phi9999" not in table and 690 not in table
+        assert table.get("phi9999") is None
+        with self.assertRaises(KeyError):
+            table["phi9999"]
+        assert pickle.loads(pickle.dumps(table))["phi0690"] == AUTHOR_TAB["phi0690"]
+        table.close()
+
+        # Invalid tables are recompiled
+        path.write_bytes(b"")
+        table = Table("cylleneus.corpus.lat.phi5.tables", "AUTHOR_TAB", path=path)
+        assert table["phi0474"] == AUTHOR_TAB["phi0474"]
+        assert path.stat().st_size > 0
+        table.close()
+
+    def test_write(self):
+        """Test that colliding keys and empty tables are compiled."""
+
+        from cylleneus.corpus.tables import HEADER, MAGIC, write
+
+        path = self.tmpdir / "test.tab"
+        table = {str(i): {"ix": [i]} for i in range(100)}
+        write(path, table)
+        data = path.read_bytes()
+        magic, nkeys, nslots, *_ = HEADER.unpack_from(data)
+        assert magic == MAGIC and nkeys == 100 and nslots == 256
+
+        write(path, {})
+        magic, nkeys, nslots, *_ = HEADER.unpack_from(path.read_bytes())
+        assert nkeys == 0 and nslots == 8
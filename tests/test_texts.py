@@ -0,0 +1,116 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Tests for the cache of parsed source texts."""
+
+
+import os
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from types import SimpleNamespace
+
+
+class TestTextCache(unittest.TestCase):
+    """Tests for `cylleneus.corpus.texts`."""
+
+    def setUp(self):
+        """Set up test fixtures, if any."""
+
+        self.tmpdir = Path(tempfile.mkdtemp())
+
+    def tearDown(self):
+        """Tear down test fixtures, if any."""
+
+        shutil.rmtree(self.tmpdir)
+
+    def test_load(self):
+        """Test that a text is parsed once until its file changes."""
+
+        from cylleneus.corpus.texts import TextCache, lines, xml
+
+        parsed = []
+
+        def parse(value):
+            parsed.append(value)
+            return lines(value)
+
+        path = self.tmpdir / "aeneid.txt"
+        path.write_text("arma uirumque cano\nTroiae qui primus ab oris\n")
+        texts = TextCache()
+        for _ in range(3):
+            doc = texts.load("test", path, parse)
+        assert len(parsed) == 1
+        assert doc[1] == "Troiae qui primus ab oris\n"
+
+        path.write_text("arma uirumque cano\n")
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1000000))
+        assert texts.load("test", path, parse) == ["arma uirumque cano\n"]
+        assert len(parsed) == 2
+
+        path = self.tmpdir / "aeneid.xml"
+        path.write_bytes("<text><l n='1'>arma uirumque cano</l></text>".encode("utf8"))
+        doc = texts.load("test", path, xml)
+        assert doc.find("l").text == "arma uirumque cano"
+        assert texts.load("test", path, xml) is doc
+
+    def test_spans(self):
+        """Test that spans are read from the source by their offsets."""
+
+        from cylleneus.corpus.texts import Spans, line_spans
+
+        source = self.tmpdir / "aeneid.txt"
+        source.write_bytes(
+            "arma uirumque cano\nTroiae qui primus ab oris\nItaliam fato profugus\n".encode("utf8")
+        )
+        sidecar = self.tmpdir / "aeneid.spans"
+        Spans.write(sidecar, line_spans(source.read_bytes()), source)
+        with Spans(sidecar) as spans:
+            assert len(spans) == 3
+            assert spans.read(source, 1) == b"Troiae qui primus ab oris\n"
+            assert spans.read(source, 0, 1).count(b"\n") == 2
+            assert spans.read(source, 3) is None
+
+        Spans.write(sidecar, {2: (0, 4)}, source)
+        with Spans(sidecar) as spans:
+            assert spans.get(0) is None and spans.get(2) == (0, 4)
+
+        Spans.write(sidecar, {}, source)
+        with Spans(sidecar) as spans:
+            assert len(spans) == 0 and spans.get(0) is None
+
+    def test_spans_for(self):
+        """Test that a sidecar is not used once its source has changed."""
+
+        from cylleneus.corpus.texts import Spans, line_spans, spans_for
+
+        source = self.tmpdir / "aeneid.txt"
+        source.write_bytes(b"arma uirumque cano\nTroiae qui primus ab oris\n")
+        Spans.write(
+            self.tmpdir / "aeneid.spans", line_spans(source.read_bytes()), source
+        )
+        docs = SimpleNamespace(location=lambda docix: (self.tmpdir, "aeneid", 0))
+        corpus = SimpleNamespace(name="test", text_dir=self.tmpdir, docs=docs)
+        work = SimpleNamespace(
+            corpus=corpus, docix=[0], filename=[(0, "aeneid.txt")]
+        )
+
+        with spans_for(work) as spans:
+            assert spans.read(source, 1) == b"Troiae qui primus ab oris\n"
+
+        stat = source.stat()
+        os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1000000))
+        assert spans_for(work) is None
+
+        source.write_bytes(b"Troiae qui primus ab oris\n")
+        Spans.write(
+            self.tmpdir / "aeneid.spans", line_spans(source.read_bytes()), source
+        )
+        with spans_for(work) as spans:
+            assert len(spans) == 1
+        stat = source.stat()
+        source.write_bytes(b"arma uirumque cano\n")
+        os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        assert spans_for(work) is None
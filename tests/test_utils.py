@@ -0,0 +1,46 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Tests for `cylleneus.utils`."""
+
+
+import unittest
+
+
+class TestLRUCache(unittest.TestCase):
+    """Tests for `cylleneus.utils.LRUCache`."""
+
+    def test_eviction(self):
+        """Test that the least recently used item is discarded."""
+
+        from cylleneus.utils import LRUCache
+
+        cache = LRUCache(maxsize=2)
+        cache["arma"] = 1
+        cache["uirum"] = 2
+        assert cache["arma"] == 1
+
+        cache["cano"] = 3
+        assert len(cache) == 2
+        assert "uirum" not in cache
+        assert cache.get("uirum") is None
+        assert cache.keys() == ["arma", "cano"]
+
+    def test_sizeof(self):
+        """Test that items are discarded to keep their total size bounded."""
+
+        from cylleneus.utils import LRUCache
+
+        discarded = []
+        cache = LRUCache(
+            maxsize=10,
+            sizeof=len,
+            callback=lambda key, value: discarded.append(key),
+        )
+        cache["arma"] = "arma"
+        cache["uirum"] = "uirumque"
+        assert discarded == ["arma"] and cache.size == 8
+
+        cache["cano"] = "cano" * 5
+        assert discarded == ["arma", "uirum"]
+        assert cache.keys() == ["cano"] and cache.size == 20